@@ -0,0 +1,64 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# This script checks the naming convention of layers, surfaces, building materials,            #
+# composites, line types, fills and pen tables in one pass. Attribute types are fetched        #
+# concurrently and every result is written to a report (JSON Lines or CSV) as it arrives.      #
+################################################################################################
+
+
+
+
+############ Archicad Connection #############
+from archicad import ACConnection
+from kaa.audit import AUDIT_TYPES, AuditReportWriter, auditAttributes
+from kaa.naming import compileRuleTables, loadRuleTables
+
+conn = ACConnection.connect()
+assert conn
+##############################################
+
+
+
+
+###################################### CONFIGURATION ######################################
+
+###### CONSTANT VALUES #####
+
+ATTRIBUTE_TYPES = AUDIT_TYPES               # <- e.g. ["Layer", "Surface"] to audit fewer types
+REPORT_PATH = "attribute_audit.jsonl"       # <- use a .csv name for a CSV report
+ONLY_NON_COMPLIANT = False                  # <- True: report only the names that need fixing
+RULES_PATH = None                           # <- optional JSON rule file, see kaa/naming.py loadRuleTables
+
+############################
+
+###########################################################################################
+
+
+
+
+################################################################################## BEGIN LOGIC ##################################################################################
+
+print("Begin Auditing for Attribute Names.")
+
+classifiers = loadRuleTables(RULES_PATH) if RULES_PATH else compileRuleTables()
+
+with AuditReportWriter(REPORT_PATH, ONLY_NON_COMPLIANT) as writer:
+    summary = auditAttributes(conn, writer, ATTRIBUTE_TYPES, classifiers)
+
+# Print the summary per attribute type
+hasError = False
+for (attributeType, (audited, nonCompliant)) in summary.items():
+    print(f"{attributeType}: {audited} audited, {nonCompliant} non-compliant")
+    if (nonCompliant > 0):
+        hasError = True
+
+# Print End message
+if (hasError):
+    print(f"Audit finished - please fix the names listed in {REPORT_PATH} that don't match our standards!")
+else:
+    print("Audit finished - no errors found, hooray! Nice attribute management.")
+
+#########################################################################################################################################################################################
@@ -0,0 +1,49 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# This script audits attribute names across many projects at once. Pass the ports of running  #
+# Archicad instances and/or snapshot reports (full reports written by                          #
+# Attributes_Audit-Names_AllTypes_v1.py). Projects are audited concurrently and the results   #
+# are merged into one report plus one summary.                                                 #
+#                                                                                              #
+# Example: python Attributes_Audit-Names_Batch_v1.py 19723 19724 old_project.jsonl             #
+################################################################################################
+
+
+import argparse
+import json
+
+from kaa.audit import AUDIT_TYPES, AuditReportWriter
+from kaa.batch import MAX_PROJECTS, batchAudit, formatSummary, parseSource
+from kaa.naming import compileRuleTables, loadRuleTables
+
+
+
+
+################################################################################## BEGIN LOGIC ##################################################################################
+
+parser = argparse.ArgumentParser(description="Audit attribute names across several Archicad projects.")
+parser.add_argument("sources", nargs="+", help="Archicad port numbers and/or snapshot report files")
+parser.add_argument("--types", nargs="+", default=AUDIT_TYPES, help="attribute types to audit")
+parser.add_argument("--report", default="batch_audit.jsonl", help="merged report (.jsonl or .csv)")
+parser.add_argument("--summary", default="batch_audit_summary.json", help="merged summary (JSON)")
+parser.add_argument("--parallel", type=int, default=MAX_PROJECTS, help="projects audited at the same time")
+parser.add_argument("--rules", default=None, help="optional JSON rule file")
+parser.add_argument("--only-non-compliant", action="store_true", help="report only the names that need fixing")
+args = parser.parse_args()
+
+classifiers = loadRuleTables(args.rules) if args.rules else compileRuleTables()
+
+with AuditReportWriter(args.report, args.only_non_compliant, extraFields=["project"]) as writer:
+    summary = batchAudit([parseSource(s) for s in args.sources], writer, args.types, classifiers, args.parallel)
+
+with open(args.summary, "w", encoding="utf-8") as summaryFile:
+    json.dump(summary, summaryFile, indent=2)
+
+# Print the non-compliant/audited counts per project and type
+print(formatSummary(summary))
+print(f"\nReport: {args.report}\nSummary: {args.summary}")
+
+#########################################################################################################################################################################################
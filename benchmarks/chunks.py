@@ -0,0 +1,134 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Wall time and peak memory of fetching the bounding boxes and six property values of a huge  #
+# element list in one request against chunked, parallel requests (kaa/fastpath.py). The       #
+# stand-in server answers every request for the elements it names, building the response per  #
+# request like Archicad does, and runs in this process, so the peak includes both sides.      #
+#                                                                                              #
+# Example: python -m benchmarks.chunks --elements 50000 --chunks 0 2000 5000 10000             #
+################################################################################################
+
+
+import argparse
+import json
+import os
+import threading
+import time
+import tracemalloc
+import types
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+from kaa.connection import loadJson
+from kaa.fastpath import RawCommands
+from kaa.transport import KeepAliveTransport, useTransport
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+ELEMENTS = 50000
+CHUNK_SIZES = [0, 2000, 5000, 10000]     # 0 = one request
+THREADS = 4
+PROPERTIES = 6
+OUTPUT_DIR = "bench_results"
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def answer(request: Dict[str, Any]) -> Dict[str, Any]:
+    # Function: a response like Archicad's for the elements of a bounding box or property value request
+    elements = request["parameters"]["elements"]
+    if (request["command"].endswith("BoundingBoxes")):
+        boxes = [{"boundingBox3D": {"xMin": i * 0.5, "yMin": 1.0, "zMin": 0.0, "xMax": i * 0.5 + 0.9, "yMax": 1.2, "zMax": 2.1}} for i in range(len(elements))]
+        return {"succeeded": True, "result": {"boundingBoxes3D": boxes}}
+    value = {"propertyValue": {"type": "singleEnum", "status": "normal", "value": {"type": "nonLocalizedValue", "nonLocalizedValue": "Exterior"}}}
+    count = len(request["parameters"]["properties"])
+    return {"succeeded": True, "result": {"propertyValuesForElements": [{"propertyValues": [value] * count} for _ in elements]}}
+
+
+def standInServer() -> ThreadingHTTPServer:
+    # Function: a local HTTP/1.1 server answering like Archicad, started on a free port in a daemon thread
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            body = json.dumps(answer(loadJson(self.rfile.read(int(self.headers["Content-Length"]))))).encode("UTF-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def standInConnection(port: int):
+    # Function: an ACConnection look-alike whose commands module is the archicad package's (no Product info call)
+    from urllib.request import Request
+    from archicad.releases.ac27.b3001commands import Commands
+    request = Request(f"http://127.0.0.1:{port}", headers={"Content-Type": "application/json"})
+    return types.SimpleNamespace(request=request, commands=Commands(request))
+
+
+def fetch(conn, guids: List[str], chunkSize: int) -> None:
+    raw = RawCommands(conn, chunkSize=chunkSize, threads=THREADS)
+    propertyIds = [types.SimpleNamespace(guid=uuid.uuid4()) for _ in range(PROPERTIES)]
+    raw.GetBoundingBoxes(guids)
+    raw.GetPropertyValuesOfElements(guids, propertyIds)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="One request vs. chunked parallel requests for huge element lists.")
+    parser.add_argument("--elements", type=int, default=ELEMENTS)
+    parser.add_argument("--chunks", type=int, nargs="+", default=CHUNK_SIZES)
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    server = standInServer()
+    conn = standInConnection(server.server_address[1])
+    transport = useTransport(conn, KeepAliveTransport())
+    guids = [str(uuid.uuid4()) for _ in range(args.elements)]
+    fetch(conn, guids[:100], 0)    # warm up
+
+    results: Dict[str, Any] = {"elements": args.elements, "threads": THREADS, "runs": []}
+    for chunkSize in args.chunks:
+        start = time.perf_counter()
+        fetch(conn, guids, chunkSize)
+        elapsed = (time.perf_counter() - start) * 1000
+        tracemalloc.start()
+        fetch(conn, guids, chunkSize)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results["runs"].append({"chunkSize": chunkSize, "ms": elapsed, "peak": peak})
+        print(f"chunk size {chunkSize or 'all':>6}   {elapsed:9.1f} ms   peak {peak / 2**20:7.1f} MB")
+    transport.close()
+    server.shutdown()
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, f"chunks_{args.elements}.json"), "w", encoding="utf-8") as resultFile:
+        json.dump(results, resultFile, indent=2)
+
+#######################################################################################################
+
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Output equivalence of the ordering engines. Every legacy ordering in kaa/ordering.py runs    #
+# next to its replacement (the NumPy versions in kaa/geometry.py, the record versions in       #
+# kaa/ordering.py and the perimeter walk in kaa/perimeter.py) on every story/building group    #
+# of seeded synthetic projects and of project snapshots (geometry stores written by kaa        #
+# store-sync). Per group the two orders are compared by Kendall tau (1: same order) and the    #
+# position of the first element they disagree on; per engine pair the total time of both and   #
+# the speedup are reported. The run fails (exit code 1) when a group's tau is below --min-tau, #
+# when more than --max-different of the groups differ at all, or when only one engine fails    #
+# or they number different elements. Results go to bench_results/equivalence.json.             #
+#                                                                                              #
+# Example: python -m benchmarks.equivalence --sizes 100 1000 --store C:/KAA/store/campus       #
+################################################################################################
+
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from benchmarks.synthetic import SyntheticBox, SyntheticBoxWrapper, SyntheticElementId, SyntheticGroup, SyntheticGuid, SyntheticModel, generateModel
+from kaa.geometry import FLAG_EXTERIOR, NO_SIDE, SIDES, ElementTable, clusterStories, orderByDistance, orderByPrevious
+from kaa.ordering import sortPositions, sortPositionsByDistance, sortPositionsByPrevious, sortRecordsByDistance
+from kaa.perimeter import walkPerimeter
+from kaa.records import ElementRecord
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+SIZES = [100, 1000]                 # zones and openings per synthetic project
+SHAPES = ["rect", "L", "U"]
+MIN_TAU = 1.0                       # lowest Kendall tau a group may have (1: every group in the same order)
+MAX_DIFFERENT = 0.0                 # share of groups that may differ at all
+STORY_LIMIT = 1                     # meters, zMin grouping of the zones of a snapshot
+REPEAT = 3
+SHOW = 5                            # differing groups listed per engine pair
+OUTPUT_DIR = "bench_results"
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class GroupInput(NamedTuple):
+    # the elements of one story/building group in every shape the engines take, built before timing
+    key: Tuple[int, int]
+    pairs: List[Tuple[Any, Any]]            # (elementId, bounding box) as in the legacy scripts
+    entry: Tuple[Any, Any]
+    table: ElementTable
+    rows: np.ndarray
+    entryRow: int
+    records: List[ElementRecord]
+    entryRecord: ElementRecord
+    minMax: Tuple[float, float]             # zMax range, as the exterior scripts pass it to the walk
+    sides: Dict[str, str]
+
+
+class EnginePair(NamedTuple):
+    name: str
+    elements: str                                   # "zones" or "openings"
+    legacy: Callable[[GroupInput], List[str]]       # each returns the GUIDs of the group in numbering order
+    new: Callable[[GroupInput], List[str]]
+    maxSize: int = 0                                # 0: no limit
+
+
+def entryOf(elements):
+    # Function: the numbering scripts start from a user picked element, the harness starts from the lowest-left one
+    return min(elements, key=lambda e: (e[1].boundingBox3D.xMin, e[1].boundingBox3D.yMin))
+
+
+def groupInput(key: Tuple[int, int], pairs: List[Tuple[Any, Any]], sides: Dict[str, str]) -> GroupInput:
+    entry = entryOf(pairs)
+    table = ElementTable.fromPairs(pairs)
+    records = [ElementRecord(e.elementId.guid, b.boundingBox3D.xMin, b.boundingBox3D.yMin, b.boundingBox3D.zMin, b.boundingBox3D.xMax,
+                             b.boundingBox3D.yMax, b.boundingBox3D.zMax, key[0], key[1], sides.get(e.elementId.guid)) for (e, b) in pairs]
+    zValues = [b.boundingBox3D.zMax for (_, b) in pairs]
+    entryRow = table.rowOf(entry[0].elementId.guid)
+    return GroupInput(key, pairs, entry, table, np.arange(len(pairs)), entryRow, records, records[entryRow], (min(zValues), max(zValues)), sides)
+
+
+def legacyByDistance(group: GroupInput) -> List[str]:
+    # the zone scripts pass (xMin, yMin, zMin, xMax, yMax) tuples; the GUID rides along as a sixth value the sort never reads
+    positions = [(b.boundingBox3D.xMin, b.boundingBox3D.yMin, b.boundingBox3D.zMin, b.boundingBox3D.xMax, b.boundingBox3D.yMax, e.elementId.guid) for (e, b) in group.pairs]
+    entry = group.entry[1].boundingBox3D
+    return [p[5] for p in sortPositionsByDistance(positions, (entry.xMin, entry.yMin))]
+
+
+def tableOrder(order) -> Callable[[GroupInput], List[str]]:
+    return lambda group: group.table.guids[order(group.table, group.rows, group.entryRow)].tolist()
+
+
+ENGINE_PAIRS = [
+    EnginePair("orderByDistance", "zones", legacyByDistance, tableOrder(orderByDistance)),
+    EnginePair("sortRecordsByDistance", "zones", legacyByDistance, lambda group: [r.guid for r in sortRecordsByDistance(group.records, group.entryRecord)]),
+    EnginePair("orderByPrevious", "zones", lambda group: [e[0].elementId.guid for e in sortPositionsByPrevious(group.pairs, group.entry)],
+               tableOrder(orderByPrevious), maxSize=2000),
+    EnginePair("walkPerimeter", "openings", lambda group: [e[0].elementId.guid for e in sortPositions(group.entry, group.minMax, group.pairs, group.sides)],
+               lambda group: [r.guid for r in walkPerimeter(group.entryRecord, group.minMax, group.records)], maxSize=1000),
+]
+
+
+def modelFromStore(path: str) -> SyntheticModel:
+    # Function: the zones and exterior openings of a geometry store as a model the engines run on. A store does not keep the
+    # element type: exterior rows with an ExteriorSide are openings grouped by StoryNumber/BuildingNumber, rows without a
+    # story, side or exterior flag are zones grouped by zMin (doors stored without a StoryNumber are taken for zones)
+    from kaa.store import GeometryStore
+    table = GeometryStore.open(path).table()
+    data = table.data
+    pair = lambda row: (SyntheticElementId(SyntheticGuid(str(table.guids[row]))),
+                        SyntheticBoxWrapper(SyntheticBox(*(float(data[f][row]) for f in ("xMin", "yMin", "zMin", "xMax", "yMax", "zMax")))))
+    hasBox = ~np.isnan(data["xMin"])
+    isOpening = hasBox & ((data["flags"] & FLAG_EXTERIOR) != 0) & (data["side"] != NO_SIDE)
+    isZone = hasBox & ((data["flags"] & FLAG_EXTERIOR) == 0) & (data["side"] == NO_SIDE) & (data["story"] < 0)
+
+    zones: Dict[Tuple[int, int], List[Tuple[Any, Any]]] = {}
+    zoneRows = np.flatnonzero(isZone)
+    for (row, story) in zip(zoneRows.tolist(), clusterStories(data["zMin"][zoneRows], STORY_LIMIT)[0].tolist()):
+        zones.setdefault((story, 0), []).append(pair(row))
+    openings: Dict[Tuple[int, int], List[Tuple[Any, Any]]] = {}
+    for row in np.flatnonzero(isOpening).tolist():
+        openings.setdefault((int(data["story"][row]), int(data["building"][row])), []).append(pair(row))
+    sides = {str(table.guids[row]): SIDES[data["side"][row]] for row in np.flatnonzero(isOpening).tolist()}
+    return SyntheticModel([SyntheticGroup(key[0], key[1], zones.get(key, []), openings.get(key, [])) for key in sorted(set(zones) | set(openings))], sides)
+
+
+def kendallTau(first: Sequence[str], second: Sequence[str]) -> float:
+    # Function: Kendall tau of two orders of the same elements (1: same order, -1: reversed); the discordant pairs are
+    # counted as inversions with a Fenwick tree, O(n log n)
+    count = len(first)
+    if (count < 2):
+        return 1.0
+    positionOf = {guid: i for (i, guid) in enumerate(second)}
+    tree = [0] * (count + 1)
+    inversions = 0
+    for (seen, position) in enumerate(positionOf[guid] for guid in first):
+        index = position + 1
+        smaller = 0
+        while (index > 0):
+            smaller += tree[index]
+            index -= index & -index
+        inversions += seen - smaller            # earlier elements that come after this one in second
+        index = position + 1
+        while (index <= count):
+            tree[index] += 1
+            index += index & -index
+    return 1.0 - 4.0 * inversions / (count * (count - 1))
+
+
+def firstDivergence(first: Sequence[str], second: Sequence[str]) -> int:
+    # Function: index of the first element the orders disagree on, -1 if they are the same
+    return next((i for (i, (a, b)) in enumerate(zip(first, second)) if a != b), -1 if len(first) == len(second) else min(len(first), len(second)))
+
+
+def runEngine(engine: Callable[[GroupInput], List[str]], group: GroupInput, repeat: int) -> Tuple[Optional[List[str]], float, Optional[str]]:
+    # Function: (order or None, best wall time in seconds, error) of one engine on one group
+    (order, best, error) = (None, float("inf"), None)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):     # the legacy walk prints "error!" before it fails
+                order = engine(group)
+        except Exception as exception:
+            # the legacy perimeter walk can lose its way on some footprints, that is a result too
+            (order, error) = (None, f"{type(exception).__name__}: {exception}")
+        best = min(best, time.perf_counter() - start)
+    return (order, best, error)
+
+
+def compareGroup(pair: EnginePair, group: GroupInput, repeat: int) -> Dict[str, Any]:
+    # Function: the comparison of one group: size, times, tau, first divergence, and why it fails if it does
+    (legacyOrder, legacyTime, legacyError) = runEngine(pair.legacy, group, repeat)
+    (newOrder, newTime, newError) = runEngine(pair.new, group, repeat)
+    result = {"group": list(group.key), "size": len(group.pairs), "legacyMs": legacyTime * 1000, "newMs": newTime * 1000, "tau": None, "firstDivergence": None}
+    if (legacyOrder is None or newOrder is None):
+        result["problem"] = None if (legacyOrder is None and newOrder is None) else f"only one engine failed: {legacyError or newError}"
+        result["errors"] = [legacyError, newError]
+    elif (len(set(legacyOrder)) != len(legacyOrder) or len(set(newOrder)) != len(newOrder) or set(legacyOrder) != set(newOrder)):
+        result["problem"] = "the engines number different elements"
+    else:
+        result["tau"] = kendallTau(legacyOrder, newOrder)
+        result["firstDivergence"] = firstDivergence(legacyOrder, newOrder)
+        if (result["firstDivergence"] >= 0):
+            result["divergence"] = [legacyOrder[result["firstDivergence"]], newOrder[result["firstDivergence"]]]
+    return result
+
+
+def comparePair(pair: EnginePair, model: SyntheticModel, repeat: int, minTau: float, maxDifferent: float, full: bool = False) -> Dict[str, Any]:
+    # Function: compares an engine pair on every group of a model against the tolerance
+    groups = [groupInput((g.story, g.building), getattr(g, pair.elements), model.sides) for g in model.groups if getattr(g, pair.elements)]
+    size = sum(len(g.pairs) for g in groups)
+    if (pair.maxSize and size > pair.maxSize and not full):
+        return {"skipped": f"size above {pair.maxSize}"}
+    results = [compareGroup(pair, group, repeat) for group in groups]
+    different = [r for r in results if r.get("problem") or (r["firstDivergence"] is not None and r["firstDivergence"] >= 0)]
+    problems = [f"group {tuple(r['group'])}: {r['problem']}" for r in results if r.get("problem")]
+    below = sum(1 for r in results if r["tau"] is not None and r["tau"] < minTau)
+    if (below):
+        problems.append(f"{below} group(s) with a tau below {minTau}")
+    if (results and len(different) > maxDifferent * len(results)):
+        problems.append(f"{len(different)} of {len(results)} groups differ, more than {maxDifferent:.0%}")
+    (legacyMs, newMs) = (sum(r["legacyMs"] for r in results), sum(r["newMs"] for r in results))
+    taus = [r["tau"] for r in results if r["tau"] is not None]
+    return {
+        "groups": len(results),
+        "elements": size,
+        "different": len(different),
+        "bothFailed": sum(1 for r in results if "errors" in r and r["problem"] is None),
+        "minTau": min(taus) if taus else None,
+        "legacyMs": legacyMs,
+        "newMs": newMs,
+        "speedup": legacyMs / newMs if newMs else None,
+        "problems": problems,
+        "details": different,
+    }
+
+
+def printPair(source: str, name: str, result: Dict[str, Any], show: int):
+    if ("skipped" in result):
+        print(f"{source:<24}{name:<24}{result['skipped']}")
+        return
+    tau = "-" if result["minTau"] is None else f"{result['minTau']:.4f}"
+    speedup = "-" if result["speedup"] is None else f"{result['speedup']:.1f}x"
+    verdict = "FAIL" if result["problems"] else "ok"
+    print(f"{source:<24}{name:<24}{result['groups']:>7}{result['different']:>10}{tau:>9}{result['legacyMs']:>12.1f}{result['newMs']:>10.1f}{speedup:>9}  {verdict}")
+    for detail in result["details"][:show]:
+        where = detail.get("problem") or f"tau {detail['tau']:.4f}, first divergence at {detail['firstDivergence']} ({detail['divergence'][0]} / {detail['divergence'][1]})"
+        print(f"{'':<24}  group {tuple(detail['group'])} of {detail['size']}: {where}")
+    if (result["bothFailed"]):
+        print(f"{'':<24}  {result['bothFailed']} group(s) failed in both engines")
+    for problem in result["problems"]:
+        print(f"{'':<24}  {problem}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check that the new ordering engines number projects like the legacy ones.")
+    parser.add_argument("--sizes", nargs="*", type=int, default=SIZES, help="zones and openings per synthetic project (none: snapshots only)")
+    parser.add_argument("--shapes", nargs="+", choices=SHAPES, default=SHAPES)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--stories", type=int, default=4)
+    parser.add_argument("--buildings", type=int, default=2)
+    parser.add_argument("--store", nargs="+", default=[], help="geometry stores (kaa store-sync) of real projects to compare on")
+    parser.add_argument("--only", nargs="+", default=None, help="compare only these engines")
+    parser.add_argument("--min-tau", type=float, default=MIN_TAU, help="lowest Kendall tau a group may have")
+    parser.add_argument("--max-different", type=float, default=MAX_DIFFERENT, help="share of groups that may differ at all")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--show", type=int, default=SHOW, help="differing groups listed per engine pair")
+    parser.add_argument("--full", action="store_true", help="also compare the slow legacy engines above their size limit")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="directory for equivalence.json")
+    args = parser.parse_args(argv)
+
+    pairs = [p for p in ENGINE_PAIRS if args.only is None or p.name in args.only]
+    sources = [(f"{shape} {size}", lambda size=size, shape=shape: generateModel(args.seed, size, size, args.stories, args.buildings, shape))
+               for size in args.sizes for shape in args.shapes]
+    sources += [(os.path.basename(os.path.normpath(path)), lambda path=path: modelFromStore(path)) for path in args.store]
+
+    print(f"{'model':<24}{'engine':<24}{'groups':>7}{'different':>10}{'min tau':>9}{'legacy ms':>12}{'new ms':>10}{'speedup':>9}")
+    results = {}
+    failed = False
+    for (source, load) in sources:
+        model = load()
+        results[source] = {}
+        for pair in pairs:
+            result = comparePair(pair, model, args.repeat, args.min_tau, args.max_different, args.full)
+            results[source][pair.name] = result
+            failed = failed or bool(result.get("problems"))
+            printPair(source, pair.name, result, args.show)
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, "equivalence.json"), "w", encoding="utf-8") as resultFile:
+        json.dump({"minTau": args.min_tau, "maxDifferent": args.max_different, "failed": failed, "results": results}, resultFile, indent=2)
+    return 1 if failed else 0
+
+#######################################################################################################
+
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
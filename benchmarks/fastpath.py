@@ -0,0 +1,146 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Decoding time of the bulk responses (Get3DBoundingBoxes and GetPropertyValuesOfElements with #
+# the six properties the numberers read) as the archicad package does it (json, then typed     #
+# objects per element and value, then the element table / plain value columns) against         #
+# kaa/fastpath.py (parse, then straight into arrays), with orjson and with the standard json   #
+# module. The response bodies are built from a synthetic model as Archicad would send them;    #
+# the archicad package must be installed, no Archicad needed. Results are saved as JSON.       #
+#                                                                                              #
+# Example: python -m benchmarks.fastpath --elements 50000                                      #
+################################################################################################
+
+
+import argparse
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from benchmarks.synthetic import SyntheticModel, generateModel
+from kaa import connection
+from kaa.fastpath import decodeBoxes, decodeColumns
+from kaa.geometry import ElementTable
+from kaa.records import plainValue
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+ELEMENTS = 50000
+OUTPUT_DIR = "bench_results"
+PROPERTY_FIELDS = ["position", "story", "building", "side", "firstDoor", "firstWindow"]
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def timed(function: Callable[[], Any], repeat: int) -> float:
+    # Function: best wall time of function in milliseconds
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def responseBodies(model: SyntheticModel) -> Dict[str, bytes]:
+    # Function: the JSON bodies Archicad sends for the boxes and the properties of every opening of the model
+    openings = [(o, g) for g in model.groups for o in g.openings]
+    first = openings[0][0][0].elementId.guid
+
+    def value(field, opening, group):
+        guid = opening[0].elementId.guid
+        if (field == "position"):
+            return {"type": "singleEnum", "status": "normal", "value": {"type": "nonLocalizedValue", "nonLocalizedValue": "Exterior"}}
+        if (field == "side"):
+            return {"type": "singleEnum", "status": "normal", "value": {"type": "displayValue", "displayValue": model.sides[guid]}}
+        if (field in ("story", "building")):
+            return {"type": "integer", "status": "normal", "value": group.story if field == "story" else group.building + 1}
+        return {"type": "boolean", "status": "normal", "value": field == "firstDoor" and guid == first}
+
+    boxes = [{"boundingBox3D": dict(o[1].boundingBox3D._asdict())} for (o, _) in openings]
+    values = [{"propertyValues": [{"propertyValue": value(f, o, g)} for f in PROPERTY_FIELDS]} for (o, g) in openings]
+    return {
+        "guids": [o[0].elementId.guid for (o, _) in openings],
+        "boxes": json.dumps({"succeeded": True, "result": {"boundingBoxes3D": boxes}}).encode("UTF-8"),
+        "values": json.dumps({"succeeded": True, "result": {"propertyValuesForElements": values}}).encode("UTF-8"),
+    }
+
+
+def typedPath(act, bodies: Dict[str, Any]) -> List[Any]:
+    # what the archicad package and the scripts do: json, typed objects, then the table and plain value columns
+    from archicad.acbasetype import _ListBuilder
+    elements = [act.ElementIdArrayItem(act.ElementId(guid)) for guid in bodies["guids"]]
+    boxes = _ListBuilder(act.BoundingBox3DOrError)(json.loads(bodies["boxes"])["result"]["boundingBoxes3D"])
+    values = _ListBuilder(act.PropertyValuesOrError)(json.loads(bodies["values"])["result"]["propertyValuesForElements"])
+    table = ElementTable.fromBoundingBoxes(elements, boxes)
+    columns = []
+    for i in range(len(PROPERTY_FIELDS)):
+        column = np.empty(len(values), dtype=object)
+        column[:] = [plainValue(v.propertyValues[i]) for v in values]
+        columns.append(column)
+    return [table, columns]
+
+
+def fastPath(bodies: Dict[str, Any]) -> List[Any]:
+    # kaa/fastpath.py: parse, then straight into the box array and the columns
+    boxes = decodeBoxes(connection.loadJson(bodies["boxes"])["result"]["boundingBoxes3D"])
+    columns = decodeColumns(connection.loadJson(bodies["values"])["result"]["propertyValuesForElements"], len(PROPERTY_FIELDS))
+    return [ElementTable.fromBoxes(bodies["guids"], boxes, np.array(bodies["guids"])), columns]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Typed archicad decoding vs. the raw JSON fast path on bulk responses.")
+    parser.add_argument("--elements", type=int, default=ELEMENTS)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3, help="runs of the fast path (the typed path runs once)")
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    from archicad.releases.ac27 import b3001types as act   # only the archicad types are used, no connection is made
+
+    model = generateModel(args.seed, 0, args.elements, stories=4, buildings=2)
+    bodies = responseBodies(model)
+    (typed, fast) = (typedPath(act, bodies), fastPath(bodies))
+    (typedData, fastData) = (typed[0].data, fast[0].data)
+    same = all(np.array_equal(typedData[f], fastData[f], equal_nan=typedData[f].dtype.kind == "f") for f in typedData.dtype.names)
+    if (not same or not all(np.array_equal(a, b) for (a, b) in zip(typed[1], fast[1]))):
+        raise AssertionError("the fast path decoded different values than the typed path")
+
+    results: Dict[str, Any] = {"elements": len(bodies["guids"]), "bytes": len(bodies["boxes"]) + len(bodies["values"])}
+    results["typed_ms"] = timed(lambda: typedPath(act, bodies), 1)   # minutes at 50k elements, once is enough
+    results["fast_ms"] = timed(lambda: fastPath(bodies), args.repeat)
+    orjson = connection.orjson
+    connection.orjson = None            # the same fast path with the standard json module
+    try:
+        results["fast_json_ms"] = timed(lambda: fastPath(bodies), args.repeat)
+    finally:
+        connection.orjson = orjson
+    results["orjson"] = orjson is not None
+
+    print(f"{results['elements']} elements, {results['bytes'] / 2**20:.1f} MB of responses")
+    for (label, key) in (("typed (archicad package)", "typed_ms"), (f"fast path ({'orjson' if orjson is not None else 'json'})", "fast_ms"), ("fast path (json)", "fast_json_ms")):
+        print(f"{label:<26}{results[key]:9.1f} ms   ({results['typed_ms'] / results[key]:5.1f}x)")
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, f"fastpath_{args.elements}.json"), "w", encoding="utf-8") as resultFile:
+        json.dump(results, resultFile, indent=2)
+
+#######################################################################################################
+
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# tracemalloc benchmark of the per-element state the fenestration and door numberers keep.    #
+# "wrappers" is the old layout: archicad ElementIdArrayItems, BoundingBox3DOrError objects,    #
+# (element, box) tuples and one property response per property. "records" is the new one:    #
+# one ElementRecord per element built from one bounding box and one property response. The    #
+# responses are archicad package types built from a synthetic model (the archicad package must #
+# be installed, no Archicad needed). Peak and retained memory are saved as JSON.              #
+#                                                                                              #
+# Example: python -m benchmarks.memory --elements 50000                                        #
+################################################################################################
+
+
+import argparse
+import gc
+import json
+import os
+import tracemalloc
+import uuid
+from typing import Any, Callable, Dict
+
+from benchmarks.synthetic import SyntheticModel, generateModel
+from kaa.records import buildRecords
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+ELEMENTS = 50000
+OUTPUT_DIR = "bench_results"
+
+# the properties both numberers read, with the record field each one fills
+PROPERTY_FIELDS = ["position", "story", "building", "side", "firstDoor", "firstWindow"]
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def make(cls, **fields):
+    # Function: an archicad type instance without the package's per-field validation (same objects, built much faster)
+    instance = cls.__new__(cls)
+    for (name, value) in fields.items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def typedResponses(act, model: SyntheticModel) -> Dict[str, Any]:
+    # Function: typed results (as the archicad package returns them) for the exterior doors/windows of a synthetic model
+    openings = [(o, g) for g in model.groups for o in g.openings]
+    first = openings[0][0][0].elementId.guid
+
+    def value(field, opening, group):
+        guid = opening[0].elementId.guid
+        if (field == "position"):
+            return make(act.NormalSingleEnumPropertyValue, value=make(act.NonLocalizedValueEnumId, nonLocalizedValue="Exterior", type="nonLocalizedValue"), type="singleEnum", status="normal")
+        if (field == "side"):
+            return make(act.NormalSingleEnumPropertyValue, value=make(act.DisplayValueEnumId, displayValue=model.sides[guid], type="displayValue"), type="singleEnum", status="normal")
+        if (field in ("story", "building")):
+            return make(act.NormalIntegerPropertyValue, value=group.story if field == "story" else group.building + 1, type="integer", status="normal")
+        return make(act.NormalBooleanPropertyValue, value=(field == "firstDoor" and guid == first), type="boolean", status="normal")
+
+    def propertyValues(fields):
+        return [make(act.PropertyValuesWrapper, propertyValues=[make(act.PropertyValueWrapper, propertyValue=value(f, o, g)) for f in fields]) for (o, g) in openings]
+
+    elements = [make(act.ElementIdArrayItem, elementId=make(act.ElementId, guid=uuid.UUID(o[0].elementId.guid))) for (o, _) in openings]
+    boxes = [make(act.BoundingBox3DWrapper, boundingBox3D=make(act.BoundingBox3D, **o[1].boundingBox3D._asdict())) for (o, _) in openings]
+    return {"elements": elements, "boxes": boxes, "propertyValues": propertyValues}
+
+
+def wrapperState(responses):
+    # the old layout: every fetch result is kept, one property response per property
+    elements = list(responses["elements"])
+    boxes = list(responses["boxes"])
+    pairs = list(zip(elements, boxes))
+    values = [responses["propertyValues"]([f]) for f in PROPERTY_FIELDS]
+    sides = {e.elementId.guid: v.propertyValues[0].propertyValue.value.displayValue for (e, v) in zip(elements, values[3])}
+    return (elements, boxes, pairs, values, sides)
+
+
+def recordState(responses):
+    # the new layout: one bounding box and one property fetch, only the records are kept (the responses are dropped)
+    return buildRecords(responses["elements"], responses["boxes"], responses["propertyValues"](PROPERTY_FIELDS), PROPERTY_FIELDS)
+
+
+def measure(build: Callable[[], Any]) -> Dict[str, int]:
+    # Function: peak memory while building and memory still held by the result, in bytes
+    gc.collect()
+    tracemalloc.start()
+    try:
+        state = build()
+        gc.collect()
+        (retained, peak) = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del state
+    return {"peak": peak, "retained": retained}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Peak and retained memory of archicad wrappers vs. element records.")
+    parser.add_argument("--elements", type=int, default=ELEMENTS)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    from archicad.releases.ac27 import b3001types as act   # only the archicad types are used, no connection is made
+
+    model = generateModel(args.seed, 0, args.elements, stories=4, buildings=2)
+    results = {"elements": args.elements}
+    for (name, build) in (("wrappers", wrapperState), ("records", recordState)):
+        # the typed responses are built inside the measurement, like a fetch would
+        results[name] = measure(lambda: build(typedResponses(act, model)))
+        print(f"{name:<10} peak {results[name]['peak'] / 2**20:8.1f} MB   retained {results[name]['retained'] / 2**20:8.1f} MB   ({results[name]['retained'] / args.elements:6.0f} B/element)")
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, f"memory_{args.elements}.json"), "w", encoding="utf-8") as resultFile:
+        json.dump(results, resultFile, indent=2)
+
+#######################################################################################################
+
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,213 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Times every ordering and classification function on synthetic projects of growing size and  #
+# saves one JSON file per size (bench_results/<size>.json by default). Functions whose cost    #
+# grows too fast are skipped above their maxSize unless --full is given.                       #
+#                                                                                              #
+# Example: python -m benchmarks.run --sizes 100 1000 10000 50000 --shape L --buildings 2       #
+################################################################################################
+
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+from typing import Callable, Dict, List, NamedTuple
+
+from benchmarks.synthetic import SyntheticModel, generateLayerNames, generateModel
+from kaa.geometry import ElementTable, clusterStories, orderByDistance, orderByPrevious
+from kaa.naming import LAYER_CLASSIFIER, PrefixClassifier, LAYER_RULES, IGNORED_LAYER_NAMES
+from kaa.ordering import createClusters, determineClosestPoint, sortPositions, sortPositionsByDistance, sortPositionsByPrevious
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+SIZES = [100, 1000, 10000, 50000]   # zones and openings per project
+MAX_LAYERS = 20000                  # layer lists are capped at this size
+REPEAT = 3
+OUTPUT_DIR = "bench_results"
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class BenchCase(NamedTuple):
+    name: str
+    setup: Callable[[SyntheticModel, List[str]], Callable[[], object]]   # returns the timed callable
+    maxSize: int = 0                                                     # 0: no limit
+
+
+def entryOf(elements):
+    # Function: the numbering scripts start from a user picked element, the benchmark starts from the lowest-left one
+    return min(elements, key=lambda e: (e[1].boundingBox3D.xMin, e[1].boundingBox3D.yMin))
+
+
+def boxTuples(elements):
+    return [(e[1].boundingBox3D.xMin, e[1].boundingBox3D.yMin, e[1].boundingBox3D.zMin, e[1].boundingBox3D.xMax, e[1].boundingBox3D.yMax) for e in elements]
+
+
+def setupClusters(model, layers):
+    zValues = [z[1].boundingBox3D.zMin for z in model.zones()]
+    return lambda: createClusters(zValues, 1)
+
+
+def setupByDistance(model, layers):
+    groups = [(boxTuples(g.zones), entryOf(g.zones)[1].boundingBox3D) for g in model.groups if g.zones]
+    return lambda: [sortPositionsByDistance(positions, (entry.xMin, entry.yMin)) for (positions, entry) in groups]
+
+
+def setupByPrevious(model, layers):
+    groups = [(g.zones, entryOf(g.zones)) for g in model.groups if g.zones]
+    return lambda: [sortPositionsByPrevious(zones, entry) for (zones, entry) in groups]
+
+
+def setupPerimeter(model, layers):
+    groups = []
+    for g in model.groups:
+        if (g.openings):
+            zValues = [o[1].boundingBox3D.zMax for o in g.openings]
+            groups.append((entryOf(g.openings), (min(zValues), max(zValues)), g.openings))
+    return lambda: [sortPositions(entry, minMax, openings, model.sides) for (entry, minMax, openings) in groups]
+
+
+def setupClosestPoint(model, layers):
+    # a single determineClosestPoint step from the entry of every group (the inner step of the perimeter walk)
+    groups = [(entryOf(g.openings), g.openings) for g in model.groups if g.openings]
+    return lambda: [determineClosestPoint(entry, openings, model.sides[entry[0].elementId.guid], [entry], model.sides) for (entry, openings) in groups]
+
+
+def tableGroups(model):
+    # one ElementTable for all zones, rows grouped per synthetic (story, building) group
+    table = ElementTable.fromPairs(model.zones())
+    groups, start = [], 0
+    for g in model.groups:
+        if (g.zones):
+            groups.append((list(range(start, start + len(g.zones))), table.rowOf(entryOf(g.zones)[0].elementId.guid)))
+            start += len(g.zones)
+    return table, groups
+
+
+def setupTable(model, layers):
+    zones = model.zones()
+    return lambda: ElementTable.fromPairs(zones)
+
+
+def setupClusterStories(model, layers):
+    table = ElementTable.fromPairs(model.zones())
+    return lambda: clusterStories(table.data["zMin"], 1)
+
+
+def setupTableByDistance(model, layers):
+    (table, groups) = tableGroups(model)
+    return lambda: [orderByDistance(table, rows, entry) for (rows, entry) in groups]
+
+
+def setupTableByPrevious(model, layers):
+    (table, groups) = tableGroups(model)
+    return lambda: [orderByPrevious(table, rows, entry) for (rows, entry) in groups]
+
+
+def setupClassify(model, layers):
+    return lambda: [LAYER_CLASSIFIER.classify(name) for name in layers]
+
+
+def setupClassifyAll(model, layers):
+    # classifyAll memoizes, so every run gets a fresh classifier (construction included)
+    return lambda: PrefixClassifier(LAYER_RULES, IGNORED_LAYER_NAMES).classifyAll(layers)
+
+
+BENCH_CASES = [
+    BenchCase("createClusters", setupClusters),
+    BenchCase("sortPositionsByDistance", setupByDistance),
+    BenchCase("sortPositionsByPrevious", setupByPrevious, maxSize=2000),
+    BenchCase("determineClosestPoint", setupClosestPoint),
+    BenchCase("sortPositions", setupPerimeter, maxSize=1000),
+    BenchCase("ElementTable.fromPairs", setupTable),
+    BenchCase("clusterStories", setupClusterStories),
+    BenchCase("orderByDistance", setupTableByDistance),
+    BenchCase("orderByPrevious", setupTableByPrevious, maxSize=10000),
+    BenchCase("PrefixClassifier.classify", setupClassify),
+    BenchCase("PrefixClassifier.classifyAll", setupClassifyAll),
+]
+
+
+def timeCall(function: Callable[[], object], repeat: int) -> Dict[str, float]:
+    # Function: best/median wall time of repeat runs, garbage collection paused while timing
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return {"best": min(times), "median": statistics.median(times), "runs": len(times)}
+
+
+def runSize(size: int, seed: int, stories: int, buildings: int, shape: str, repeat: int, cases: List[BenchCase], full: bool = False) -> Dict[str, object]:
+    # Function: benchmarks every case on one synthetic project of the given size
+    model = generateModel(seed, size, size, stories, buildings, shape)
+    layers = generateLayerNames(seed, min(size, MAX_LAYERS))
+    results = {}
+    for case in cases:
+        if (case.maxSize and size > case.maxSize and not full):
+            results[case.name] = {"skipped": f"size above {case.maxSize}"}
+            continue
+        try:
+            results[case.name] = timeCall(case.setup(model, layers), repeat)
+        except Exception as error:
+            # the legacy perimeter walk can lose its way on some footprints, that is a result too
+            results[case.name] = {"failed": f"{type(error).__name__}: {error}"}
+    return {
+        "size": size,
+        "layers": len(layers),
+        "model": {"seed": seed, "stories": stories, "buildings": buildings, "shape": shape},
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the numbering and attribute algorithms on synthetic projects.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES, help="zones and openings per project")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--stories", type=int, default=4)
+    parser.add_argument("--buildings", type=int, default=1)
+    parser.add_argument("--shape", choices=["rect", "L", "U"], default="rect")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--only", nargs="+", default=None, help="benchmark only these functions")
+    parser.add_argument("--full", action="store_true", help="also run the slow functions above their size limit")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="directory for the per-size JSON results")
+    args = parser.parse_args(argv)
+
+    cases = [c for c in BENCH_CASES if args.only is None or c.name in args.only]
+    os.makedirs(args.out, exist_ok=True)
+    for size in args.sizes:
+        result = runSize(size, args.seed, args.stories, args.buildings, args.shape, args.repeat, cases, args.full)
+        with open(os.path.join(args.out, f"{size}.json"), "w", encoding="utf-8") as resultFile:
+            json.dump(result, resultFile, indent=2)
+        for (name, timing) in result["results"].items():
+            cell = timing.get("skipped") or timing.get("failed") or f"{timing['best'] * 1000:10.2f} ms"
+            print(f"{size:>7}  {name:<32}{cell}")
+
+#######################################################################################################
+
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Load time and memory of the geometry store (kaa/store.py) against building the element      #
+# table from typed archicad responses, as every script run does after its fetch. Also times   #
+# GUID lookups and a small incremental update. The responses are archicad package types       #
+# built from a synthetic model (the archicad package must be installed, no Archicad needed);  #
+# the store is written to a temporary directory unless --dir is given.                         #
+#                                                                                              #
+# Example: python -m benchmarks.store --elements 50000                                         #
+################################################################################################
+
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from typing import Any, Callable, Dict
+
+from benchmarks.memory import measure, typedResponses
+from benchmarks.synthetic import generateModel
+from kaa.geometry import ElementTable, clusterStories
+from kaa.store import GeometryStore
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+ELEMENTS = 50000
+OUTPUT_DIR = "bench_results"
+LOOKUPS = 1000
+UPDATES = 100
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def timed(function: Callable[[], Any], repeat: int = 5) -> float:
+    # Function: best wall time of function in milliseconds
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def fromResponses(act, model) -> ElementTable:
+    # what a script does today: typed responses from the fetch, then the table
+    responses = typedResponses(act, model)
+    return ElementTable.fromBoundingBoxes(responses["elements"], responses["boxes"])
+
+
+def fromStore(path: str) -> ElementTable:
+    # open the store and use every zMin, so the pages are really read
+    table = GeometryStore.open(path).table()
+    clusterStories(table.data["zMin"], 1)
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Geometry store load time and memory vs. building the table from responses.")
+    parser.add_argument("--elements", type=int, default=ELEMENTS)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--dir", default=None, help="store directory (default: a temporary directory)")
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    from archicad.releases.ac27 import b3001types as act   # only the archicad types are used, no connection is made
+
+    model = generateModel(args.seed, 0, args.elements, stories=4, buildings=2)
+    path = args.dir or tempfile.mkdtemp(prefix="kaa_store_")
+    table = fromResponses(act, model)
+    store = GeometryStore.create(path, capacity=len(table))
+    store.upsert(table.guids, table.data)
+
+    results: Dict[str, Any] = {"elements": len(table)}
+    results["responses"] = dict(measure(lambda: fromResponses(act, model)), ms=timed(lambda: fromResponses(act, model), 3))
+    results["store"] = dict(measure(lambda: fromStore(path)), ms=timed(lambda: fromStore(path)))
+
+    rng = random.Random(args.seed)
+    guids = rng.sample(table.guids.tolist(), min(LOOKUPS, len(table)))
+    results["lookup_ms"] = timed(lambda: store.rowsOf(guids))
+    changed = table.data[:UPDATES].copy()
+    changed["xMin"] += 1.0
+    results["update_ms"] = timed(lambda: store.upsert(table.guids[:UPDATES], changed, fields=["xMin"]))
+
+    for name in ("responses", "store"):
+        print(f"{name:<10} {results[name]['ms']:8.1f} ms   peak {results[name]['peak'] / 2**20:7.1f} MB   retained {results[name]['retained'] / 2**20:7.1f} MB")
+    print(f"rowsOf {len(guids)} GUIDs {results['lookup_ms']:.2f} ms, update {UPDATES} rows {results['update_ms']:.2f} ms")
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, f"store_{args.elements}.json"), "w", encoding="utf-8") as resultFile:
+        json.dump(results, resultFile, indent=2)
+
+#######################################################################################################
+
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Seeded generators for synthetic projects: multi-story, multi-building models with           #
+# rectangular, L- or U-shaped footprints, zones inside the footprint and exterior doors/windows#
+# along its perimeter (with their Top/Right/Bottom/Left exterior side), plus layer name lists. #
+# Elements are shaped like the archicad package's results (e[0].elementId.guid,                #
+# e[1].boundingBox3D.xMin ...) so the ordering code runs on them unchanged.                    #
+################################################################################################
+
+
+import random
+import uuid
+from typing import Dict, List, NamedTuple, Tuple
+
+from kaa.naming import LAYER_RULES
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+STORY_HEIGHT = 3.0          # meters between stories
+BUILDING_SPACING = 20.0     # meters between the footprints of two buildings
+OPENING_WIDTH = 0.9
+WALL_THICKNESS = 0.3
+
+# Footprints as rectilinear outlines (clockwise, unit square scaled later), one per shape
+FOOTPRINTS = {
+    "rect": [(0, 0), (0, 1), (1, 1), (1, 0)],
+    "L": [(0, 0), (0, 1), (0.4, 1), (0.4, 0.4), (1, 0.4), (1, 0)],
+    "U": [(0, 0), (0, 1), (0.3, 1), (0.3, 0.4), (0.7, 0.4), (0.7, 1), (1, 1), (1, 0)],
+}
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class SyntheticGuid(NamedTuple):
+    guid: str
+
+
+class SyntheticElementId(NamedTuple):
+    elementId: SyntheticGuid
+
+
+class SyntheticBox(NamedTuple):
+    xMin: float
+    yMin: float
+    zMin: float
+    xMax: float
+    yMax: float
+    zMax: float
+
+
+class SyntheticBoxWrapper(NamedTuple):
+    boundingBox3D: SyntheticBox
+
+
+class SyntheticGroup(NamedTuple):
+    story: int
+    building: int
+    zones: List[Tuple[SyntheticElementId, SyntheticBoxWrapper]]
+    openings: List[Tuple[SyntheticElementId, SyntheticBoxWrapper]]
+
+
+class SyntheticModel(NamedTuple):
+    groups: List[SyntheticGroup]
+    sides: Dict[str, str]          # opening guid -> exterior side
+
+    def zones(self) -> List[Tuple[SyntheticElementId, SyntheticBoxWrapper]]:
+        return [z for g in self.groups for z in g.zones]
+
+    def openings(self) -> List[Tuple[SyntheticElementId, SyntheticBoxWrapper]]:
+        return [o for g in self.groups for o in g.openings]
+
+
+def makeElement(rng: random.Random, box: SyntheticBox) -> Tuple[SyntheticElementId, SyntheticBoxWrapper]:
+    # Function: builds an (elementId, bounding box) pair with a seeded guid
+    guid = str(uuid.UUID(int=rng.getrandbits(128), version=4)).upper()
+    return (SyntheticElementId(SyntheticGuid(guid)), SyntheticBoxWrapper(box))
+
+
+def _split(total: int, parts: int) -> List[int]:
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+
+def _outline(shape: str, size: float, originX: float) -> List[Tuple[float, float]]:
+    return [(originX + x * size, y * size) for (x, y) in FOOTPRINTS[shape]]
+
+
+def _inside(outline: List[Tuple[float, float]], x: float, y: float) -> bool:
+    # Function: even-odd point in polygon test
+    inside = False
+    for i in range(len(outline)):
+        (x1, y1), (x2, y2) = outline[i], outline[(i + 1) % len(outline)]
+        if ((y1 > y) != (y2 > y)) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def _edgeSide(x1: float, y1: float, x2: float, y2: float) -> str:
+    # Function: exterior side of a clockwise outline edge (outward normal direction)
+    if (y1 == y2):
+        return "Top" if x2 > x1 else "Bottom"
+    return "Right" if y2 < y1 else "Left"
+
+
+def generateModel(seed: int, zoneCount: int, openingCount: int, stories: int = 4, buildings: int = 1, shape: str = "rect") -> SyntheticModel:
+    # Function: generates a project with zoneCount zones and openingCount exterior openings spread over stories x buildings
+    rng = random.Random(seed)
+    groupCount = stories * buildings
+    zonesPerGroup = _split(zoneCount, groupCount)
+    openingsPerGroup = _split(openingCount, groupCount)
+
+    groups = []
+    sides: Dict[str, str] = {}
+    for story in range(stories):
+        for building in range(buildings):
+            idx = story * buildings + building
+            nZones, nOpenings = zonesPerGroup[idx], openingsPerGroup[idx]
+            # footprint grows with the element count so densities stay realistic (about 12 m2 per zone, 1.5 m per opening)
+            size = max(10.0, (nZones * 12.0) ** 0.5 * 1.4, nOpenings * 1.5 / 4)
+            outline = _outline(shape, size, building * (size + BUILDING_SPACING))
+            floor = story * STORY_HEIGHT
+
+            zones = []
+            while (len(zones) < nZones):
+                x, y = rng.uniform(outline[0][0], outline[0][0] + size), rng.uniform(0, size)
+                if (_inside(outline, x, y)):
+                    w, d = rng.uniform(2.5, 6.0), rng.uniform(2.5, 6.0)
+                    zones.append(makeElement(rng, SyntheticBox(round(x, 3), round(y, 3), floor, round(x + w, 3), round(y + d, 3), floor + STORY_HEIGHT - 0.3)))
+
+            perimeter = [(outline[i], outline[(i + 1) % len(outline)]) for i in range(len(outline))]
+            lengths = [abs(b[0] - a[0]) + abs(b[1] - a[1]) for (a, b) in perimeter]
+            openings = []
+            for _ in range(nOpenings):
+                (x1, y1), (x2, y2) = rng.choices(perimeter, weights=lengths)[0]
+                t = rng.random()
+                x, y = round(x1 + (x2 - x1) * t, 2), round(y1 + (y2 - y1) * t, 2)
+                sill = floor + rng.choice([0.0, 0.0, 0.9, 2.1])   # doors, windows and clerestories
+                if (y1 == y2):
+                    box = SyntheticBox(x, y - WALL_THICKNESS / 2, sill, x + OPENING_WIDTH, y + WALL_THICKNESS / 2, sill + 1.2)
+                else:
+                    box = SyntheticBox(x - WALL_THICKNESS / 2, y, sill, x + WALL_THICKNESS / 2, y + OPENING_WIDTH, sill + 1.2)
+                opening = makeElement(rng, box)
+                sides[opening[0].elementId.guid] = _edgeSide(x1, y1, x2, y2)
+                openings.append(opening)
+
+            groups.append(SyntheticGroup(story, building, zones, openings))
+
+    return SyntheticModel(groups, sides)
+
+
+def generateLayerNames(seed: int, count: int, nonCompliantShare: float = 0.1) -> List[str]:
+    # Function: generates layer names that mostly follow the naming convention
+    rng = random.Random(seed)
+    prefixes = [prefix for (prefix, _) in LAYER_RULES]
+    words = ["WALL", "DOOR", "GLAZ", "FURN", "ANNO", "DIMS", "ROOF", "SLAB", "GRID", "CASE", "PLNT", "HRDS"]
+    names = []
+    for i in range(count):
+        body = f"{rng.choice(words)}-{rng.choice(words)}-{i}"
+        if (rng.random() < nonCompliantShare):
+            names.append(rng.choice(["", "Q", "temp "]) + body.lower())
+        else:
+            names.append(rng.choice(prefixes) + body)
+    return names
+
+#######################################################################################################
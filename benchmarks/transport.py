@@ -0,0 +1,133 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Per-request cost of the default transport (a new urllib connection per command) against     #
+# kaa.transport.KeepAliveTransport, on a local stand-in for the Archicad JSON server. The      #
+# stand-in speaks HTTP/1.1 keep-alive, answers small commands with a small result and          #
+# GetPropertyValuesOfElements with a property value per element, and gzips responses when     #
+# asked to and --server-gzip is set (Archicad itself may not). Two workloads: "chatty" (many   #
+# small commands, like per-element loops) and "bulk" (few large property fetches).            #
+#                                                                                              #
+# Example: python -m benchmarks.transport --requests 500 --elements 10000                     #
+################################################################################################
+
+
+import argparse
+import gzip
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict
+from urllib.request import Request
+
+from kaa.connection import threadSafePostCommand
+from kaa.transport import KeepAliveTransport
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+REQUESTS = 500          # chatty workload: small commands
+BULK_REQUESTS = 10      # bulk workload: property fetches of ELEMENTS elements
+ELEMENTS = 10000
+OUTPUT_DIR = "bench_results"
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def propertyValuesResult(count: int) -> Dict[str, object]:
+    # Function: a GetPropertyValuesOfElements result shaped like Archicad's (one string property per element)
+    value = {"propertyValue": {"type": "string", "status": "normal", "value": "Exterior"}}
+    return {"succeeded": True, "result": {"propertyValuesForElements": [{"propertyValues": [value]} for _ in range(count)]}}
+
+
+def standInServer(elements: int, gzipResponses: bool) -> ThreadingHTTPServer:
+    # Function: a local HTTP/1.1 server answering like Archicad, started on a free port in a daemon thread
+    bulk = json.dumps(propertyValuesResult(elements)).encode("UTF-8")
+    small = json.dumps({"succeeded": True, "result": {"isAlive": True}}).encode("UTF-8")
+    compressed = {bulk: gzip.compress(bulk, compresslevel=1), small: small}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if (self.headers.get("Content-Encoding") == "gzip"):
+                body = gzip.decompress(body)
+            command = json.loads(body).get("command", "")
+            payload = bulk if command.endswith("GetPropertyValuesOfElements") else small
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if (gzipResponses and payload is bulk and "gzip" in self.headers.get("Accept-Encoding", "")):
+                payload = compressed[payload]
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def workload(post: Callable, url: str, command: str, count: int) -> float:
+    # Function: milliseconds per request for count requests of one command
+    request = Request(url, headers={"Content-Type": "application/json"})
+    body = json.dumps({"command": command, "parameters": {}})
+    start = time.perf_counter()
+    for _ in range(count):
+        post(request, body)
+    return (time.perf_counter() - start) * 1000 / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Default urllib transport vs. keep-alive transport on a local stand-in server.")
+    parser.add_argument("--requests", type=int, default=REQUESTS)
+    parser.add_argument("--bulk", type=int, default=BULK_REQUESTS)
+    parser.add_argument("--elements", type=int, default=ELEMENTS)
+    parser.add_argument("--server-gzip", action="store_true", help="the stand-in gzips large responses when asked")
+    parser.add_argument("--out", default=OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    server = standInServer(args.elements, args.server_gzip)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    keepAlive = KeepAliveTransport()
+    transports = {"urllib": threadSafePostCommand, "keep-alive": keepAlive.post}
+
+    results = {"requests": args.requests, "bulk": args.bulk, "elements": args.elements, "serverGzip": args.server_gzip}
+    for (name, post) in transports.items():
+        workload(post, url, "API.IsAlive", 10)   # warm up
+        results[name] = {"chatty_ms": workload(post, url, "API.IsAlive", args.requests),
+                         "bulk_ms": workload(post, url, "API.GetPropertyValuesOfElements", args.bulk)}
+        print(f"{name:<11} chatty {results[name]['chatty_ms']:7.3f} ms/request   bulk ({args.elements} elements) {results[name]['bulk_ms']:8.2f} ms/request")
+    stats = keepAlive.stats
+    results["keep-alive"].update(connections=stats.connections, bytesIn=stats.bytesIn, compressedResponses=stats.compressedIn)
+    print(f"keep-alive opened {stats.connections} connection(s) for {stats.requests} requests, {stats.compressedIn} compressed response(s)")
+    keepAlive.close()
+    server.shutdown()
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, f"transport_{args.elements}.json"), "w", encoding="utf-8") as resultFile:
+        json.dump(results, resultFile, indent=2)
+
+#######################################################################################################
+
+
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Shared helpers for the KAA Archicad python scripts. Modules are imported by the scripts in   #
+# the repository root; nothing is imported here so loading the package stays cheap.           #
+################################################################################################
@@ -0,0 +1,87 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# asyncio layer over the Archicad JSON commands. Any command or utility of a connection can be #
+# awaited; independent commands go out concurrently (at most MAX_IN_FLIGHT at a time), so a    #
+# batch of lookups costs about the longest single call instead of the sum of all of them.      #
+#                                                                                              #
+#   aconn = AsyncConnection(conn)                                                              #
+#   doors, selected = aconn.gather(aconn.commands.GetElementsByClassification(doorId),         #
+#                                  aconn.commands.GetSelectedElements())                       #
+################################################################################################
+
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, List
+
+from kaa.connection import enableConcurrentCommands
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+MAX_IN_FLIGHT = 8      # requests sent to Archicad at the same time
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class AsyncCommands:
+    # Class: awaitable view of conn.commands or conn.utilities (each call runs in a worker thread)
+
+    def __init__(self, target, connection: "AsyncConnection"):
+        self._target = target
+        self._connection = connection
+
+    def __getattr__(self, name: str):
+        function = getattr(self._target, name)
+
+        async def call(*args, **kwargs):
+            async with self._connection.semaphore():
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._connection.executor, functools.partial(function, *args, **kwargs))
+
+        call.__name__ = name
+        return call
+
+
+class AsyncConnection:
+    # Class: wraps an ACConnection so its commands and utilities can be awaited with a bounded number of requests in flight
+
+    def __init__(self, conn, maxInFlight: int = MAX_IN_FLIGHT):
+        enableConcurrentCommands(conn)
+        self.conn = conn
+        self.maxInFlight = maxInFlight
+        self.executor = ThreadPoolExecutor(max_workers=maxInFlight)
+        self.commands = AsyncCommands(conn.commands, self)
+        self.utilities = AsyncCommands(conn.utilities, self)
+        self.types = conn.types
+        self._loop = None
+        self._semaphore = None
+
+    def semaphore(self) -> asyncio.Semaphore:
+        # Function: one semaphore per event loop (gather() starts a new loop on every call)
+        loop = asyncio.get_running_loop()
+        if (self._loop is not loop):
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.maxInFlight)
+        return self._semaphore
+
+    def gather(self, *calls: Awaitable[Any]) -> List[Any]:
+        # Function: runs independent awaitables concurrently from synchronous code and returns their results in order
+        async def gatherAll():
+            return await asyncio.gather(*calls)
+        return asyncio.run(gatherAll())
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+#######################################################################################################
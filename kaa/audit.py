@@ -0,0 +1,153 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Attribute naming audit for several attribute types at once. Attribute ids of every type are #
+# listed concurrently, their details are fetched in chunks through a thread pool, and every    #
+# chunk is classified with the compiled rule tables and streamed to a JSON Lines or CSV report #
+# as soon as it arrives. The first line of a report says whether it holds every audited name   #
+# or only the non-compliant ones (a "# {...}" line above the CSV header), so a snapshot audit  #
+# can tell a filtered report from a full one.                                                  #
+################################################################################################
+
+
+import csv
+import json
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Tuple
+
+from kaa.connection import enableConcurrentCommands
+from kaa.naming import PrefixClassifier, compileRuleTables
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+# Attribute type -> (command returning the attribute details, field of the result wrapper)
+ATTRIBUTE_COMMANDS = {
+    "Layer": ("GetLayerAttributes", "layerAttribute"),
+    "Surface": ("GetSurfaceAttributes", "surfaceAttribute"),
+    "BuildingMaterial": ("GetBuildingMaterialAttributes", "buildingMaterialAttribute"),
+    "Composite": ("GetCompositeAttributes", "compositeAttribute"),
+    "Line": ("GetLineAttributes", "lineAttribute"),
+    "Fill": ("GetFillAttributes", "fillAttribute"),
+    "PenTable": ("GetPenTableAttributes", "penTableAttribute"),
+}
+
+AUDIT_TYPES = list(ATTRIBUTE_COMMANDS)
+
+MAX_WORKERS = 4        # requests in flight at the same time
+CHUNK_SIZE = 2000      # attributes per detail request
+
+REPORT_FIELDS = ["type", "guid", "name", "folder", "compliant"]
+REPORT_KIND = "kaa attribute audit"     # "report" of the first line of every report
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class AuditReportWriter:
+    # Class: thread safe streaming report writer. The format follows the file extension (.csv, otherwise JSON Lines).
+
+    def __init__(self, path: str, onlyNonCompliant: bool = False, extraFields: List[str] = ()):
+        self.path = path
+        self.onlyNonCompliant = onlyNonCompliant
+        self.isCsv = path.lower().endswith(".csv")
+        self.lock = threading.Lock()
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        header = json.dumps({"report": REPORT_KIND, "onlyNonCompliant": onlyNonCompliant})
+        self.file.write(("# " + header if self.isCsv else header) + "\n")
+        if (self.isCsv):
+            self.csvWriter = csv.DictWriter(self.file, fieldnames=list(extraFields) + REPORT_FIELDS)
+            self.csvWriter.writeheader()
+
+    def writeRows(self, rows: Iterable[Dict[str, object]]):
+        # Function: appends rows to the report and flushes, so the report can be followed while the audit runs
+        if (self.onlyNonCompliant):
+            rows = [row for row in rows if not row["compliant"]]
+        with self.lock:
+            for row in rows:
+                if (self.isCsv):
+                    self.csvWriter.writerow(row)
+                else:
+                    self.file.write(json.dumps(row) + "\n")
+            self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def classifyRows(attributeType: str, attributes: Iterable[Tuple[str, str]], classifier: PrefixClassifier) -> List[Dict[str, object]]:
+    # Function: turns (guid, name) pairs into report rows (ignored names are left out)
+    rows = []
+    for (guid, name) in attributes:
+        folder = classifier.classify(name)
+        if (folder is None):
+            continue
+        rows.append({"type": attributeType, "guid": guid, "name": name, "folder": folder, "compliant": folder != classifier.default})
+    return rows
+
+
+def fetchAttributeNames(acc, attributeType: str, attributeIds) -> List[Tuple[str, str]]:
+    # Function: fetches the names of one chunk of attributes as (guid, name) pairs
+    command, field = ATTRIBUTE_COMMANDS[attributeType]
+    details = getattr(acc, command)(attributeIds)
+    names = []
+    for (attributeId, detail) in zip(attributeIds, details):
+        attribute = getattr(detail, field, None)
+        if (attribute is not None):
+            names.append((str(attributeId.attributeId.guid), attribute.name))
+    return names
+
+
+def auditAttributes(conn, writer: AuditReportWriter, attributeTypes: Iterable[str] = AUDIT_TYPES, classifiers: Dict[str, PrefixClassifier] = None, maxWorkers: int = MAX_WORKERS, chunkSize: int = CHUNK_SIZE, extra: Dict[str, object] = None) -> Dict[str, Tuple[int, int]]:
+    # Function: audits the given attribute types of one project and returns {type: (audited, non compliant)}
+    if (classifiers is None):
+        classifiers = compileRuleTables()
+    attributeTypes = list(attributeTypes)
+    enableConcurrentCommands(conn)
+    acc = conn.commands
+
+    summary = {attributeType: (0, 0) for attributeType in attributeTypes}
+    with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+        # list the ids of every type at once; each listing is split into detail chunks as soon as it comes back,
+        # and each chunk is classified and written as soon as its details arrive
+        listings = {pool.submit(acc.GetAttributesByType, attributeType): attributeType for attributeType in attributeTypes}
+        chunks = {}
+        pending = set(listings)
+        while (len(pending) > 0):
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if (future in listings):
+                    attributeType = listings[future]
+                    attributeIds = future.result()
+                    for start in range(0, len(attributeIds), chunkSize):
+                        chunk = pool.submit(fetchAttributeNames, acc, attributeType, attributeIds[start:start + chunkSize])
+                        chunks[chunk] = attributeType
+                        pending.add(chunk)
+                    continue
+
+                attributeType = chunks.pop(future)
+                rows = classifyRows(attributeType, future.result(), classifiers[attributeType])
+                if (extra):
+                    rows = [dict(extra, **row) for row in rows]
+                writer.writeRows(rows)
+
+                audited, nonCompliant = summary[attributeType]
+                summary[attributeType] = (audited + len(rows), nonCompliant + sum(1 for row in rows if not row["compliant"]))
+
+    return summary
+
+#######################################################################################################
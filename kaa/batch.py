@@ -0,0 +1,161 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Cross-project naming audit. Each source is either the port of a running Archicad instance   #
+# or a snapshot file (a full JSON Lines/CSV report written earlier by the attribute audit);    #
+# snapshots written with only the non-compliant names are refused, they would undercount.      #
+# Sources are audited concurrently with a bounded number of projects in flight; every row goes #
+# to one merged report with a "project" column and the counts are merged into one summary.    #
+################################################################################################
+
+
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Tuple, Union
+
+from kaa.audit import AUDIT_TYPES, REPORT_KIND, AuditReportWriter, auditAttributes, classifyRows
+from kaa.connection import connect
+from kaa.naming import PrefixClassifier, compileRuleTables
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+MAX_PROJECTS = 4       # projects audited at the same time
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def parseSource(source: str) -> Union[int, str]:
+    # Function: a source is an Archicad port number or a path to a snapshot report
+    return int(source) if source.isdigit() else source
+
+
+def sourceLabel(source: Union[int, str]) -> str:
+    return f"port {source}" if isinstance(source, int) else os.path.basename(source)
+
+
+def sourceLabels(sources: List[Union[int, str]]) -> List[str]:
+    # Function: one distinct label per source: the file name of a snapshot, its normalised path if another snapshot has
+    # the same file name, and a " (2)", " (3)" ... suffix for a source given more than once
+    names = [sourceLabel(source) for source in sources]
+    labels = [os.path.normpath(os.path.abspath(source)) if isinstance(source, str) and names.count(name) > 1 else name
+              for (source, name) in zip(sources, names)]
+    seen: Dict[str, int] = {}
+    unique = []
+    for label in labels:
+        seen[label] = seen.get(label, 0) + 1
+        unique.append(label if seen[label] == 1 else f"{label} ({seen[label]})")
+    return unique
+
+
+def readSnapshotHeader(path: str) -> Dict[str, object]:
+    # Function: the first line of a snapshot report ({"report": REPORT_KIND, "onlyNonCompliant": ...}), {} for reports
+    # written before the audit wrote one
+    with open(path, encoding="utf-8", newline="") as snapshotFile:
+        line = snapshotFile.readline().strip()
+    if (path.lower().endswith(".csv")):
+        return json.loads(line[1:]) if line.startswith("#") else {}
+    header = json.loads(line) if line else {}
+    return header if header.get("report") == REPORT_KIND else {}
+
+
+def readSnapshot(path: str) -> Iterable[Dict[str, str]]:
+    # Function: yields the rows of a snapshot report (JSON Lines, or CSV for .csv files), without the header line
+    with open(path, encoding="utf-8", newline="") as snapshotFile:
+        if (path.lower().endswith(".csv")):
+            if (not snapshotFile.readline().startswith("#")):
+                snapshotFile.seek(0)
+            yield from csv.DictReader(snapshotFile)
+        else:
+            for line in snapshotFile:
+                if (line.strip()):
+                    row = json.loads(line)
+                    if (row.get("report") != REPORT_KIND):
+                        yield row
+
+
+def auditSnapshot(path: str, writer: AuditReportWriter, attributeTypes: Iterable[str] = AUDIT_TYPES, classifiers: Dict[str, PrefixClassifier] = None, extra: Dict[str, object] = None) -> Dict[str, Tuple[int, int]]:
+    # Function: re-classifies the names stored in a snapshot with the current rules; a snapshot holding only the
+    # non-compliant names raises ValueError, as its counts would pass for those of the whole project
+    if (readSnapshotHeader(path).get("onlyNonCompliant")):
+        raise ValueError(f"{path} holds only the non-compliant names; audit the project again or use a full report")
+    if (classifiers is None):
+        classifiers = compileRuleTables()
+    attributeTypes = list(attributeTypes)
+
+    namesByType: Dict[str, List[Tuple[str, str]]] = {attributeType: [] for attributeType in attributeTypes}
+    for row in readSnapshot(path):
+        if (row["type"] in namesByType):
+            namesByType[row["type"]].append((row["guid"], row["name"]))
+
+    summary = {}
+    for (attributeType, names) in namesByType.items():
+        rows = classifyRows(attributeType, names, classifiers[attributeType])
+        if (extra):
+            rows = [dict(extra, **row) for row in rows]
+        writer.writeRows(rows)
+        summary[attributeType] = (len(rows), sum(1 for row in rows if not row["compliant"]))
+    return summary
+
+
+def auditSource(source: Union[int, str], writer: AuditReportWriter, attributeTypes: List[str], classifiers: Dict[str, PrefixClassifier],
+                label: str = None) -> Dict[str, Tuple[int, int]]:
+    # Function: audits one port or snapshot into the shared report, its rows labelled with label (sourceLabel by default)
+    extra = {"project": label or sourceLabel(source)}
+    if (isinstance(source, str)):
+        return auditSnapshot(source, writer, attributeTypes, classifiers, extra)
+
+    return auditAttributes(connect(source), writer, attributeTypes, classifiers, extra=extra)
+
+
+def batchAudit(sources: Iterable[Union[int, str]], writer: AuditReportWriter, attributeTypes: Iterable[str] = AUDIT_TYPES, classifiers: Dict[str, PrefixClassifier] = None, maxProjects: int = MAX_PROJECTS) -> Dict[str, object]:
+    # Function: audits every source with at most maxProjects in flight and returns the merged summary
+    if (classifiers is None):
+        classifiers = compileRuleTables()
+    attributeTypes = list(attributeTypes)
+    sources = list(sources)
+
+    projects: Dict[str, Dict[str, Tuple[int, int]]] = {}
+    errors: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=maxProjects) as pool:
+        futures = {pool.submit(auditSource, source, writer, attributeTypes, classifiers, label): label
+                   for (source, label) in zip(sources, sourceLabels(sources))}
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                projects[label] = future.result()
+            except Exception as error:
+                errors[label] = str(error)
+
+    totals = {}
+    for attributeType in attributeTypes:
+        totals[attributeType] = (sum(p[attributeType][0] for p in projects.values() if attributeType in p),
+                                 sum(p[attributeType][1] for p in projects.values() if attributeType in p))
+
+    return {"projects": dict(sorted(projects.items())), "totals": totals, "errors": errors}
+
+
+def formatSummary(summary: Dict[str, object]) -> str:
+    # Function: renders the merged summary as a plain text table (non-compliant / audited per type)
+    attributeTypes = list(summary["totals"])
+    width = max([len("TOTAL")] + [len(label) for label in summary["projects"]] + [len(label) for label in summary["errors"]])
+    lines = ["".ljust(width) + "".join(t.rjust(18) for t in attributeTypes)]
+    rows = list(summary["projects"].items()) + [("TOTAL", summary["totals"])]
+    for (label, counts) in rows:
+        cells = [f"{counts[t][1]}/{counts[t][0]}" if t in counts else "-" for t in attributeTypes]
+        lines.append(label.ljust(width) + "".join(c.rjust(18) for c in cells))
+    for (label, error) in summary["errors"].items():
+        lines.append(f"{label.ljust(width)}  FAILED: {error}")
+    return "\n".join(lines)
+
+#######################################################################################################
@@ -0,0 +1,81 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Per-element input cache. A task stores, for every element it wrote, a key made of the        #
+# rounded inputs the value was computed from and the value written; on the next run elements   #
+# whose key is unchanged and that still hold that value are skipped, so a re-run on an         #
+# unchanged model computes and writes nothing, while a value edited by hand, rolled back (kaa  #
+# rollback) or missing in a copy of the project is written again. The cache is a small JSON    #
+# file ({"version": ..., "keys": {guid: [key, value]}}) replaced atomically; a cache written   #
+# by another version of the task's rules is ignored.                                           #
+#                                                                                              #
+#   cache = KeyCache.load(path, DIMENSION_CACHE_VERSION)                                       #
+#   if (cache.changed(guid, key, current)): ... write ...; cache.update(guid, key, value)      #
+#   cache.save()                                                                               #
+################################################################################################
+
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def roundedKey(*values: Optional[float], digits: int = 3) -> str:
+    # Function: a cache key from numbers rounded to digits decimals (millimeters for meters), None kept as "-"
+    return ",".join("-" if v is None else f"{round(float(v), digits):.{digits}f}" for v in values)
+
+
+class KeyCache:
+    # Class: GUID -> [input key, value] of the last written value, read from and saved to one JSON file
+
+    def __init__(self, path: str, version: str, keys: Optional[Dict[str, List[Any]]] = None):
+        self.path = path
+        self.version = version
+        self.keys = keys or {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: str, version: str) -> "KeyCache":
+        # Function: the cache in path; empty if the file is missing, unreadable or from another version
+        try:
+            with open(path, "r", encoding="utf-8") as cacheFile:
+                content = json.load(cacheFile)
+        except (OSError, ValueError):
+            return cls(path, version)
+        if (content.get("version") != version):
+            return cls(path, version)
+        return cls(path, version, dict(content.get("keys", {})))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def changed(self, guid: str, key: str, current: Any = None) -> bool:
+        # Function: whether the element must be written: its key changed or it no longer holds (current) the value written
+        return self.keys.get(guid) != [key, current]
+
+    def update(self, guid: str, key: str, value: Any = None):
+        if (self.keys.get(guid) != [key, value]):
+            (self.keys[guid], self.dirty) = ([key, value], True)
+
+    def forget(self, guids: Iterable[str]):
+        # Function: drops elements (e.g. ones whose value could not be computed) so they are retried next time
+        for guid in guids:
+            if (self.keys.pop(guid, None) is not None):
+                self.dirty = True
+
+    def save(self):
+        if (not self.dirty):
+            return
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as cacheFile:
+            json.dump({"version": self.version, "keys": self.keys}, cacheFile, separators=(",", ":"))
+        os.replace(temporary, self.path)
+        self.dirty = False
+
+#######################################################################################################
@@ -0,0 +1,180 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Record and replay of Archicad sessions. kaa ... --record FILE wraps the connection's         #
+# post_command and appends every request with its response and round trip time to a gzipped    #
+# JSON Lines cassette as it arrives (the first line holds the Archicad version, build and      #
+# language). kaa ... --replay FILE runs the same command without Archicad, on any system: the  #
+# connection is built from the cassette's header and every request is answered with the        #
+# response recorded for the same request body (in recorded order if it was sent several        #
+# times, the last one repeated), so a problem project captured once re-runs deterministically. #
+# A request the cassette does not hold raises CassetteMiss. Bodies are compared as canonical   #
+# JSON, so json and orjson bodies match. kaa cassette FILE [FILE2] lists the round trips and   #
+# recorded time per command, and compares two recordings (e.g. of two versions of a script).   #
+#                                                                                              #
+#   python Number_Modern_A040-ExteriorFenestration_v1.py --record problem.cassette             #
+#   python Number_Modern_A040-ExteriorFenestration_v1.py --replay problem.cassette --dry-run   #
+################################################################################################
+
+
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+from kaa.connection import PostCommand, dumpJson, installPostCommand, loadJson
+from kaa.trace import commandName
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+CASSETTE_VERSION = 1
+REPLAY_URL = "http://127.0.0.1:19723"     # never contacted, the replayed commands only need a request to carry
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class CassetteMiss(ConnectionError):
+    # Raised on replay for a request the cassette holds no response for (the replayed "Archicad" cannot answer it)
+    pass
+
+
+def requestKey(request: Any) -> str:
+    # Function: the canonical JSON of a request (parsed, or a JSON body), equal for equal requests whatever encoder wrote them
+    if (isinstance(request, (str, bytes))):
+        request = loadJson(request)
+    return json.dumps(request, sort_keys=True, separators=(",", ":"))
+
+
+def readCassette(path: str) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+    # Function: (header, recorded {"request", "response", "ms"} entries) of a cassette; the entries are read lazily
+    cassetteFile = gzip.open(path, "rt", encoding="utf-8")
+    header = loadJson(cassetteFile.readline() or "{}")
+    if (header.get("version") != CASSETTE_VERSION):
+        cassetteFile.close()
+        raise ValueError(f"{path} is not a version {CASSETTE_VERSION} kaa cassette")
+
+    def entries() -> Iterator[Dict[str, Any]]:
+        with cassetteFile:
+            for line in cassetteFile:
+                if (line.strip()):
+                    yield loadJson(line)
+    return (header, entries())
+
+
+class CassetteRecorder:
+    # Class: appends the requests and responses of a connection to a cassette file
+
+    def __init__(self, path: str, product: Tuple[int, int, str]):
+        self.path = path
+        self.requests = 0
+        self.uninstall = lambda: None     # set by recordSession
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        (version, build, lang) = product
+        self._file.write(dumpJson({"version": CASSETTE_VERSION, "archicad": [version, build, lang], "created": time.strftime("%Y-%m-%dT%H:%M:%S")}) + "\n")
+
+    def wrap(self, postCommand: PostCommand) -> PostCommand:
+        def recordingPostCommand(req, jsonStr: str) -> Dict[str, Any]:
+            start = time.perf_counter()
+            response = postCommand(req, jsonStr)
+            line = dumpJson({"request": loadJson(jsonStr), "response": response, "ms": round((time.perf_counter() - start) * 1000, 3)})
+            with self._lock:
+                self._file.write(line + "\n")
+                self.requests += 1
+            return response
+        return recordingPostCommand
+
+    def close(self):
+        # Function: stops recording the connection and closes the cassette
+        self.uninstall()
+        with self._lock:
+            self._file.close()
+
+
+class CassettePlayer:
+    # Class: answers requests with the responses recorded for them; usable as a post_command
+
+    def __init__(self, path: str):
+        (header, entries) = readCassette(path)
+        self.path = path
+        self.product = tuple(header["archicad"])
+        self.recorded = 0
+        self.served = 0
+        self.uninstall = lambda: None     # set by replayConnection
+        self._lock = threading.Lock()
+        self._responses: Dict[str, Deque[str]] = {}
+        self._asked = set()
+        for entry in entries:
+            # kept encoded: every replayed response is decoded fresh, so callers never share objects
+            self._responses.setdefault(requestKey(entry["request"]), deque()).append(dumpJson(entry["response"]))
+            self.recorded += 1
+
+    def post(self, req, jsonStr: str) -> Dict[str, Any]:
+        # Function: the next response recorded for the request; the last one is repeated if it is sent more often than recorded
+        key = requestKey(jsonStr)
+        with self._lock:
+            responses = self._responses.get(key)
+            if (responses is None):
+                raise CassetteMiss(f"{self.path} holds no response to {commandName(jsonStr)} with these parameters; "
+                                   f"record the session again with this version of the script")
+            self.served += 1
+            self._asked.add(key)
+            response = responses.popleft() if len(responses) > 1 else responses[0]
+        return loadJson(response)
+
+    def close(self):
+        # Function: stops answering the connection's requests
+        self.uninstall()
+
+    def unplayed(self) -> int:
+        # Function: recorded responses no request asked for
+        with self._lock:
+            return sum(len(responses) - (1 if key in self._asked else 0) for (key, responses) in self._responses.items())
+
+
+def recordSession(conn, path: str) -> CassetteRecorder:
+    # Function: records every request of the connection to the cassette at path from now on (close() when done)
+    recorder = CassetteRecorder(path, (conn.version, conn.build, conn.lang))
+    recorder.uninstall = installPostCommand(conn, recorder.wrap)
+    return recorder
+
+
+def replayConnection(path: str):
+    # Function: (ACConnection, CassettePlayer) for the Archicad release of the cassette, answering from it without Archicad
+    # (player.close() when done; other connections of the release still reach Archicad)
+    from urllib.request import Request
+    from archicad import ACConnection
+    from archicad.versioning import _Versioning
+    player = CassettePlayer(path)
+    conn = ACConnection.__new__(ACConnection)     # ACConnection() would ask a running Archicad for its version
+    conn.port = None
+    conn.request = Request(REPLAY_URL, headers={"Content-Type": "application/json"})
+    (conn.version, conn.build, conn.lang) = player.product
+    versioning = _Versioning(conn.version, conn.build, conn.request)
+    (conn.commands, conn.types, conn.utilities) = (versioning.commands, versioning.types, versioning.utilities)
+    player.uninstall = installPostCommand(conn, lambda postCommand: player.post)
+    return (conn, player)
+
+
+def cassetteStats(path: str) -> Dict[str, List[float]]:
+    # Function: command name -> [round trips, recorded ms] of a cassette
+    stats: Dict[str, List[float]] = {}
+    for entry in readCassette(path)[1]:
+        name = entry["request"].get("command", "unknown")
+        row = stats.setdefault(name[4:] if name.startswith("API.") else name, [0, 0.0])
+        row[0] += 1
+        row[1] += entry.get("ms", 0.0)
+    return stats
+
+#######################################################################################################
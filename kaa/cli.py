@@ -0,0 +1,256 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# One command line for all the scripts: python -m kaa <command> [options]. Only argparse is   #
+# imported up front; a command's task module (kaa/tasks), numpy and the archicad package are   #
+# imported when that command runs, so --help and snapshot audits start without them. Every     #
+# command takes --port, --dry-run (compute and print, write nothing), --trace [file] and       #
+# --transport (keepalive: one reused, compressed connection; urllib: a new one per command).   #
+# --chunk-size N splits bulk fetches of huge element lists into parallel requests of N.        #
+# Property writes are journaled in --journal DIR; kaa rollback undoes the last run's writes.   #
+# --record FILE saves the session to a cassette, --replay FILE re-runs it without Archicad.    #
+#                                                                                              #
+#   python -m kaa zones --from previous --dry-run                                              #
+#   python -m kaa layer-audit --snapshot old_project.jsonl                                     #
+################################################################################################
+
+
+import argparse
+import importlib
+import sys
+from typing import Callable, List, NamedTuple, Optional
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+DEFAULT_TRACE_PATH = "kaa_trace.json"    # same default as kaa/trace.py (not imported here to keep start-up cheap)
+DEFAULT_FETCH_THREADS = 4                # same default as kaa/fastpath.py
+DEFAULT_JOURNAL_DIR = "kaa_journal"      # same default as kaa/journal.py
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class Command(NamedTuple):
+    name: str
+    task: str                                              # "module:function" run as function(conn, args, tracer)
+    help: str
+    configure: Callable[[argparse.ArgumentParser], None]   # adds the command's own options
+    offline: Callable[[argparse.Namespace], bool] = lambda args: False   # True: runs without Archicad
+
+
+def numberingOptions(parser: argparse.ArgumentParser, stories: bool = True):
+    parser.add_argument("--prefix", default='', help="text put in front of every number")
+    parser.add_argument("--story-tolerance", type=float, default=0.3,
+                        help="meters an element may start below its story's level and stay on it (--stories-from table)")
+    parser.add_argument("--stable", action="store_true",
+                        help="keep as many current numbers as the new order allows and write only the changed ones")
+    parser.add_argument("--no-validate", dest="validate", action="store_false",
+                        help="write even if a number is already held by another element or overflows its story (index past 99)")
+    if (stories):
+        parser.add_argument("--stories-from", choices=["table", "property"], default="table",
+                            help="table: the story of the Project Map story the element's zMin is on, unless its StoryNumber is set "
+                                 "(default); property: the StoryNumber every element must have")
+        parser.add_argument("--stories", type=int, default=4, help="number of stories with --stories-from property (StoryNumber 0..stories-1)")
+        parser.add_argument("--building-gap", type=float, default=8.0,
+                            help="meters between buildings for elements without a BuildingNumber (0 = BuildingNumber required)")
+
+
+def boundedFloat(low: float, high: float = float("inf"), lowIncluded: bool = False) -> Callable[[str], float]:
+    # Function: an argparse type for numbers above low (or at it if lowIncluded) and at most high
+    def parse(text: str) -> float:
+        value = float(text)
+        if (not (value >= low if lowIncluded else value > low) or not value <= high):
+            bounds = f"{'at least' if lowIncluded else 'above'} {low:g}" + (f" and at most {high:g}" if high != float("inf") else "")
+            raise argparse.ArgumentTypeError(f"{text} is not {bounds}")
+        return value
+    return parse
+
+
+def watchOptions(parser: argparse.ArgumentParser):
+    parser.add_argument("--watch", action="store_true", help="keep running and renumber the groups whose elements change (Ctrl+C stops)")
+    parser.add_argument("--interval", type=boundedFloat(0), default=2.0, help="seconds between polls in --watch mode")
+    parser.add_argument("--debounce", type=boundedFloat(0, lowIncluded=True), default=1.0, help="seconds a change must settle before renumbering")
+    parser.add_argument("--max-load", type=boundedFloat(0, 1), default=0.05,
+                        help="most of one CPU core --watch may use, above 0 and at most 1 (polls less often on big models)")
+    parser.add_argument("--refresh", type=float, default=60.0, help="seconds between full re-reads that pick up property edits (0 = never)")
+
+
+def zonesOptions(parser):
+    parser.add_argument("--from", dest="order", choices=["first", "previous"], default="first",
+                        help="order by distance from the First_Zone or from the zone numbered last")
+    parser.add_argument("--stories-from", choices=["table", "zmin"], default="table",
+                        help="table: the Project Map story each zone's zMin is on (default); zmin: cluster the zMin values")
+    parser.add_argument("--story-limit", type=float, default=1, help="with --stories-from zmin, zones whose zMin differ by less belong to one story")
+    numberingOptions(parser, stories=False)
+    watchOptions(parser)
+    parser.add_argument("--store", default=None, help="read zone boxes from this geometry store (see store-sync; not with --watch)")
+
+
+def doorsOptions(parser):
+    parser.add_argument("--by", choices=["distance", "zone"], default="distance",
+                        help="number by distance from the First_Door, or by related zone number plus a letter")
+    numberingOptions(parser)
+    watchOptions(parser)
+
+
+def fenestrationOptions(parser):
+    numberingOptions(parser)
+    watchOptions(parser)
+
+
+def dimensionsOptions(parser):
+    parser.add_argument("--cache", default=None,
+                        help="file remembering the inputs of the written dimensions (default: <project>_kaa_dimensions.json next to the "
+                             "project file if the Tapir add-on reports its path, else kaa_dimensions_cache.json in the working directory)")
+    parser.add_argument("--no-cache", action="store_true", help="recompute and write every zone, even unchanged ones")
+
+
+def storeOptions(parser):
+    parser.add_argument("--store", required=True, help="geometry store directory (created if missing)")
+
+
+def rollbackOptions(parser):
+    parser.add_argument("file", nargs="?", default=None, help="journal to roll back (default: the newest one not rolled back in --journal)")
+    parser.add_argument("--force", action="store_true", help="also restore elements changed since the run, and journals already rolled back")
+
+
+def cassetteOptions(parser):
+    parser.add_argument("cassettes", nargs="+", metavar="FILE", help="one cassette, or two to compare (e.g. recorded with two versions of a script)")
+
+
+def layerAuditOptions(parser):
+    parser.add_argument("--snapshot", default=None, help="audit the layer names of a snapshot report instead of Archicad")
+
+
+def layerOrgOptions(parser):
+    parser.add_argument("--rebuild", action="store_true", help="rebuild every folder through a DUMMY folder (old process, broken in AC27)")
+
+
+COMMANDS = [
+    Command("zones", "kaa.tasks.zones:run", "number zones from the First_Zone of each story", zonesOptions),
+    Command("doors", "kaa.tasks.doors:run", "number interior doors", doorsOptions),
+    Command("fenestration", "kaa.tasks.fenestration:run", "number exterior doors and windows clockwise", fenestrationOptions),
+    Command("dimensions", "kaa.tasks.dimensions:run", "write zone dimensions from bounding box and ZoneAngle", dimensionsOptions),
+    Command("store-sync", "kaa.tasks.store:sync", "update a geometry store with the zones, doors and windows of the model", storeOptions),
+    Command("rollback", "kaa.tasks.rollback:run", "restore the values a journaled run overwrote", rollbackOptions),
+    Command("cassette", "kaa.tasks.cassette:summary", "round trips and recorded time per command of recorded sessions", cassetteOptions, lambda args: True),
+    Command("layer-audit", "kaa.tasks.layers:audit", "check layer names against the naming convention", layerAuditOptions, lambda args: bool(args.snapshot)),
+    Command("layer-org", "kaa.tasks.layers:organize", "sort layers into folders by name", layerOrgOptions),
+]
+
+
+def buildParser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--port", type=int, default=None, help="Archicad port (default: first running instance)")
+    common.add_argument("--dry-run", action="store_true", help="compute and print the changes without writing them")
+    common.add_argument("--trace", nargs="?", const=DEFAULT_TRACE_PATH, default=None, metavar="FILE",
+                        help=f"time every command and phase and write a Chrome trace (default {DEFAULT_TRACE_PATH})")
+    common.add_argument("--transport", choices=("keepalive", "urllib"), default="keepalive",
+                        help="keepalive: send every command over one reused connection, responses compressed if Archicad "
+                             "supports it (default); urllib: the archicad package's new connection per command")
+    common.add_argument("--chunk-size", type=int, default=0, metavar="N",
+                        help="fetch boxes and property values of more than N elements in chunks of N, in parallel (default 0: one request)")
+    common.add_argument("--fetch-threads", type=int, default=DEFAULT_FETCH_THREADS, metavar="N",
+                        help=f"chunk requests in flight at once (default {DEFAULT_FETCH_THREADS})")
+    common.add_argument("--journal", default=DEFAULT_JOURNAL_DIR, metavar="DIR",
+                        help=f"directory of the write journals kaa rollback restores from (default {DEFAULT_JOURNAL_DIR})")
+    common.add_argument("--no-journal", action="store_true", help="write without recording the previous values")
+    cassette = common.add_mutually_exclusive_group()
+    cassette.add_argument("--record", default=None, metavar="FILE", help="record every command and response of the session to a cassette")
+    cassette.add_argument("--replay", default=None, metavar="FILE",
+                          help="run without Archicad, answering every command from a recorded cassette (nothing is journaled)")
+
+    parser = argparse.ArgumentParser(prog="kaa", description="KAA Archicad numbering and attribute tools.")
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    subparsers.required = True
+    for command in COMMANDS:
+        subparser = subparsers.add_parser(command.name, parents=[common], help=command.help, description=command.help)
+        command.configure(subparser)
+        subparser.set_defaults(spec=command)
+    return parser
+
+
+def loadTask(task: str) -> Callable:
+    # Function: imports the task's module on first use and returns its function
+    (moduleName, functionName) = task.split(":")
+    return getattr(importlib.import_module(moduleName), functionName)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = buildParser()
+    args = parser.parse_args(argv)
+    if (getattr(args, "watch", False) and getattr(args, "store", None)):
+        # the watch polls the live zone boxes but would number from the stored ones, so moved zones were never renumbered
+        parser.error("--store cannot be used with --watch: the watch numbers from the live zone boxes")
+    command = args.spec
+    run = loadTask(command.task)
+
+    if (command.offline(args)):
+        from kaa.trace import NULL_TRACER   # nothing to time without Archicad
+        return run(None, args, NULL_TRACER)
+
+    from kaa.connection import connect
+    from kaa.numbering import NumberingError
+    from kaa.trace import startTracing
+
+    (player, recorder) = (None, None)
+    try:
+        if (args.replay):
+            from kaa.cassette import replayConnection
+            (conn, player) = replayConnection(args.replay)   # no Archicad: every command is answered from the cassette
+        else:
+            conn = connect(args.port)
+    except ConnectionError as error:
+        print(error)
+        return -1
+    transport = None
+    if (args.transport == "keepalive" and player is None):
+        from kaa.transport import KeepAliveTransport, useTransport
+        transport = useTransport(conn, KeepAliveTransport())   # before tracing, so the tracer wraps it
+    if (args.chunk_size > 0):
+        from kaa.fastpath import configureChunks
+        configureChunks(args.chunk_size, args.fetch_threads)
+    if (args.record):
+        from kaa.cassette import recordSession
+        recorder = recordSession(conn, args.record)   # before tracing, so the recorded times are the round trips
+    if (not args.dry_run and not args.no_journal and player is None):
+        from kaa.journal import startJournal
+        startJournal(conn, args.journal, command.name)   # the file is only written if the run writes
+    tracer = startTracing(conn, args.trace)   # run with --trace to time every command and phase
+    try:
+        return run(conn, args, tracer)
+    except NumberingError as error:
+        # missing user input, the message says what to set
+        print(error)
+        return -1
+    except ConnectionError as error:
+        # a request the replayed cassette has no response for
+        print(error)
+        return -1
+    finally:
+        # the wrappers around the connection's post_command come off in the reverse order of installing them
+        tracer.finish()
+        if (recorder is not None):
+            recorder.close()
+            print(f"{recorder.requests} request(s) recorded to {args.record}")
+        if (transport is not None):
+            transport.close()
+        if (player is not None):
+            player.close()
+            print(f"{player.served} request(s) replayed from {args.replay}, {player.unplayed()} recorded response(s) not asked for")
+
+#######################################################################################################
+
+
+
+
+if __name__ == "__main__":
+    sys.exit(main())
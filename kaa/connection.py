@@ -0,0 +1,109 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Helpers around the archicad package's ACConnection. Every typed command in the archicad      #
+# package sends its JSON through the module level function post_command(request, jsonStr) of  #
+# its release's commands module; utilities call the same commands. Swapping that function is   #
+# the one place where the way commands reach Archicad can be changed for a whole connection.   #
+# Responses are parsed with orjson when it is installed (several times faster on the large     #
+# element lists), else with the standard json module.                                          #
+################################################################################################
+
+
+import json
+import sys
+import threading
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PostCommand = Callable[[Any, str], Dict[str, Any]]   # (urllib Request, JSON body) -> decoded response
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+_installLock = threading.Lock()
+
+
+def loadJson(data) -> Any:
+    # Function: parses a JSON response body (bytes or str)
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def dumpJson(value: Any) -> str:
+    # Function: a JSON request body
+    return orjson.dumps(value).decode("UTF-8") if orjson is not None else json.dumps(value)
+
+
+def connect(port: Optional[int] = None):
+    # Function: connects to Archicad on port (None: --port on the command line, else the first running instance)
+    # The archicad package is imported here, so tools that never connect do not pay for loading it.
+    from archicad import ACConnection
+    conn = ACConnection.connect(port)
+    if (not conn):
+        raise ConnectionError(f"Could not connect to Archicad on port {port}" if port else "Could not find a running Archicad instance")
+    return conn
+
+
+def commandsModule(conn):
+    # Function: returns the module holding post_command for this connection's Archicad release
+    commands = getattr(conn.commands, "__wrapped__", conn.commands)   # conn.commands may be a timed stand-in (kaa.trace)
+    return sys.modules[type(commands).__module__]
+
+
+def installPostCommand(conn, wrap: Callable[[PostCommand], PostCommand]) -> Callable[[], None]:
+    # Function: sends the requests of this connection through wrap(current post_command) and returns the function undoing it
+    # post_command is shared by every connection of the release, so the wrapper only sees requests made with conn.request;
+    # other connections go straight to the previous function. The archicad package's own post_command is swapped for the
+    # thread safe one first, so every wrapper sits on a safe base. Undo functions may be called in any order.
+    with _installLock:
+        module = commandsModule(conn)
+        if (module.post_command.__module__ == module.__name__):
+            module.post_command = threadSafePostCommand
+        previous = module.post_command
+        wrapped = wrap(previous)
+        if (wrapped is previous):
+            return lambda: None
+        request = conn.request
+
+        def scopedPostCommand(req, jsonStr: str) -> Dict[str, Any]:
+            if (req is request and scopedPostCommand.installed):
+                return wrapped(req, jsonStr)
+            return previous(req, jsonStr)
+
+        scopedPostCommand.installed = True
+        scopedPostCommand.previous = previous
+        module.post_command = scopedPostCommand
+
+    def uninstall():
+        with _installLock:
+            scopedPostCommand.installed = False
+            # undone wrappers on top of the chain are unlinked; one below a live wrapper only passes requests on
+            while (not getattr(module.post_command, "installed", True)):
+                module.post_command = module.post_command.previous
+    return uninstall
+
+
+def threadSafePostCommand(req, jsonStr: str) -> Dict[str, Any]:
+    # Function: same as the archicad package's post_command, but builds a fresh Request per call.
+    # urlopen(req, data) stores data on the shared Request object, so two threads using one connection can send each other's payloads.
+    # Only req.headers are copied: the Content-length urlopen left among the unredirected headers is the previous request's.
+    from urllib.request import Request, urlopen   # loaded with the first request, not with every tool that imports kaa
+    request = Request(req.full_url, data=jsonStr.encode("UTF-8"), headers=dict(req.headers))
+    response = urlopen(request)
+    return loadJson(response.read())
+
+
+def enableConcurrentCommands(conn):
+    # Function: makes one connection safe to use from a thread pool (no-op if already done)
+    installPostCommand(conn, lambda postCommand: postCommand)
+    return conn
+
+#######################################################################################################
@@ -0,0 +1,177 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Fast path for the bulk commands. For Get3DBoundingBoxes / Get2DBoundingBoxes and             #
+# GetPropertyValuesOfElements the archicad package validates the response and builds a typed   #
+# object per element and per property value, which the scripts unwrap to floats and strings    #
+# right away. RawCommands sends the same commands as plain JSON through the connection's       #
+# post_command (so the transport and tracing still apply) and decodes the response directly    #
+# into NumPy arrays: an n x 6 (3D) or n x 4 (2D) box array with NaN rows for elements without  #
+# a box, and one object array of plain values per property (see kaa.records.plainValue).       #
+#                                                                                              #
+# Chunked mode (kaa ... --chunk-size N): element lists longer than N are split into chunks of  #
+# N, sent through a pool of FETCH_THREADS threads and decoded as they arrive into the result   #
+# arrays, so only a few chunk responses are in memory at a time and decoding overlaps with     #
+# the remaining requests.                                                                      #
+#                                                                                              #
+#   raw = RawCommands(conn)                                                                    #
+#   boxes = raw.GetBoundingBoxes(guids)                # xMin, yMin, zMin, xMax, yMax, zMax    #
+#   (position, story) = raw.GetPropertyValuesOfElements(guids, [positionId, storyId])          #
+################################################################################################
+
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from kaa.connection import commandsModule, dumpJson, enableConcurrentCommands
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+BOX_FIELDS = {
+    "3D": ("xMin", "yMin", "zMin", "xMax", "yMax", "zMax"),
+    "2D": ("xMin", "yMin", "xMax", "yMax"),
+}
+
+CHUNK_SIZE = 0          # elements per request, 0 = every element list in one request (set with --chunk-size)
+FETCH_THREADS = 4       # chunk requests in flight at once
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def elementParameters(guids: Sequence[str]) -> List[Dict[str, Any]]:
+    # Function: the "elements" parameter (ElementIdArrayItems) for GUID strings
+    return [{"elementId": {"guid": guid}} for guid in guids]
+
+
+def decodeBoxes(items: Sequence[Dict[str, Any]], dimensions: str = "3D") -> np.ndarray:
+    # Function: n x 6 (3D) or n x 4 (2D) coordinates in BOX_FIELDS order of BoundingBox3DOrError / BoundingBox2DOrError
+    # JSON items; rows of elements Archicad returned an error for are NaN
+    key = "boundingBox" + dimensions
+    fields = itemgetter(*BOX_FIELDS[dimensions])
+    boxes = np.full((len(items), len(BOX_FIELDS[dimensions])), np.nan)
+    present = [row for (row, item) in enumerate(items) if key in item]
+    if (present):
+        boxes[present] = [fields(items[row][key]) for row in present]
+    return boxes
+
+
+def enumValue(value: Dict[str, Any]) -> Any:
+    # an EnumValueId (or EnumValueIdWrapper of a multi-enum) as its non-localized or display value
+    value = value.get("enumValueId", value)
+    return value.get("nonLocalizedValue", value.get("displayValue"))
+
+
+def plainJsonValue(item: Dict[str, Any]) -> Any:
+    # Function: kaa.records.plainValue for a PropertyValueOrErrorItem JSON item
+    propertyValue = item.get("propertyValue")
+    if (propertyValue is None or propertyValue.get("status", "normal") != "normal"):
+        return None
+    value = propertyValue.get("value")
+    if (isinstance(value, dict)):
+        return enumValue(value)
+    if (isinstance(value, list)):
+        return [enumValue(v) if isinstance(v, dict) else v for v in value]
+    return value
+
+
+def decodeColumns(items: Sequence[Dict[str, Any]], count: int) -> List[np.ndarray]:
+    # Function: one object array of plain values per requested property from PropertyValuesOrError JSON items
+    # (None for missing values and for elements Archicad returned an error for)
+    columns = [[None] * len(items) for _ in range(count)]
+    for (row, item) in enumerate(items):
+        for (column, value) in zip(columns, item.get("propertyValues", ())):
+            column[row] = plainJsonValue(value)
+    arrays = []
+    for column in columns:
+        array = np.empty(len(items), dtype=object)
+        array[:] = column
+        arrays.append(array)
+    return arrays
+
+
+def configureChunks(chunkSize: int, threads: int = FETCH_THREADS):
+    # Function: the chunk size and thread count of every RawCommands created afterwards (see the header)
+    global CHUNK_SIZE, FETCH_THREADS
+    (CHUNK_SIZE, FETCH_THREADS) = (max(0, chunkSize), max(1, threads))
+
+
+def fetchChunks(count: int, chunkSize: int, threads: int, fetch: Callable[[int, int], Any], store: Callable[[int, Any], None]):
+    # Function: fetch(start, stop) for every chunk of range(count) on a pool of threads; store(start, result) is called
+    # in this thread as each chunk completes (in completion order), so a result can be dropped once it is stored
+    chunks = range(0, count, chunkSize)
+    with ThreadPoolExecutor(max_workers=min(threads, len(chunks))) as pool:
+        pending = {pool.submit(fetch, start, min(start + chunkSize, count)): start for start in chunks}
+        try:
+            for future in as_completed(pending):
+                store(pending.pop(future), future.result())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+class RawCommands:
+    # Class: the bulk commands of a connection with array results; usable as an aio.AsyncCommands target
+
+    def __init__(self, conn, chunkSize: Optional[int] = None, threads: Optional[int] = None):
+        self.conn = conn
+        self.chunkSize = CHUNK_SIZE if chunkSize is None else chunkSize
+        self.threads = FETCH_THREADS if threads is None else threads
+
+    def chunked(self, count: int) -> bool:
+        # Function: whether a list of count elements is fetched in chunks (then the connection is made safe for the pool)
+        if (self.chunkSize <= 0 or count <= self.chunkSize):
+            return False
+        enableConcurrentCommands(self.conn)
+        return True
+
+    def post(self, command: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        # Function: the "result" of a command, sent through the connection's post_command; raises the archicad package's
+        # UnsucceededCommandCall like the typed commands
+        module = commandsModule(self.conn)
+        response = module.post_command(self.conn.request, dumpJson({"command": f"API.{command}", "parameters": parameters}))
+        if (not response["succeeded"]):
+            raise module.UnsucceededCommandCall(response)
+        return response["result"]
+
+    def GetBoundingBoxes(self, guids: Sequence[str], dimensions: str = "3D", chunked: bool = True) -> np.ndarray:
+        # Function: Get3DBoundingBoxes or Get2DBoundingBoxes of the elements as a box array (see decodeBoxes)
+        if (chunked and self.chunked(len(guids))):
+            boxes = np.empty((len(guids), len(BOX_FIELDS[dimensions])))
+            def store(start: int, chunk: np.ndarray):
+                boxes[start:start + len(chunk)] = chunk
+            fetchChunks(len(guids), self.chunkSize, self.threads, lambda start, stop: self.GetBoundingBoxes(guids[start:stop], dimensions, chunked=False), store)
+            return boxes
+        if (len(guids) == 0):
+            return np.full((0, len(BOX_FIELDS[dimensions])), np.nan)
+        result = self.post(f"Get{dimensions}BoundingBoxes", {"elements": elementParameters(guids)})
+        return decodeBoxes(result[f"boundingBoxes{dimensions}"], dimensions)
+
+    def GetPropertyValuesOfElements(self, guids: Sequence[str], propertyIds: Sequence[Any], chunked: bool = True) -> List[np.ndarray]:
+        # Function: one column of plain values per property (PropertyIds, as returned by GetPropertyIds)
+        if (chunked and self.chunked(len(guids))):
+            columns = [np.empty(len(guids), dtype=object) for _ in propertyIds]
+            def store(start: int, chunk: List[np.ndarray]):
+                for (column, values) in zip(columns, chunk):
+                    column[start:start + len(values)] = values
+            fetchChunks(len(guids), self.chunkSize, self.threads, lambda start, stop: self.GetPropertyValuesOfElements(guids[start:stop], propertyIds, chunked=False), store)
+            return columns
+        if (len(guids) == 0):
+            return [np.empty(0, dtype=object) for _ in propertyIds]
+        properties = [{"propertyId": {"guid": str(p.guid)}} for p in propertyIds]
+        result = self.post("GetPropertyValuesOfElements", {"elements": elementParameters(guids), "properties": properties})
+        return decodeColumns(result["propertyValuesForElements"], len(propertyIds))
+
+#######################################################################################################
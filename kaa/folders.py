@@ -0,0 +1,91 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Idempotent attribute folder sync. The current folder tree (with its attributes) is read in   #
+# one GetAttributeFolderStructure call and compared with where the naming convention says each #
+# attribute belongs. Only the missing folders are created (in one CreateAttributeFolders call) #
+# and only misfiled attributes are moved (one MoveAttributesAndFolders call per target folder).#
+# Running the sync on an already organised project makes no write calls.                      #
+################################################################################################
+
+
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class FolderSyncPlan(NamedTuple):
+    foldersToCreate: List[str]              # top level folders that do not exist yet
+    moves: Dict[str, List[str]]             # folder name -> attribute guids that have to move into it
+
+    def isEmpty(self) -> bool:
+        return len(self.foldersToCreate) == 0 and len(self.moves) == 0
+
+
+def readFolderTree(structure) -> Tuple[Dict[str, Tuple[str, Tuple[str, ...]]], Dict[str, object]]:
+    # Function: walks an AttributeFolderStructure and returns (attribute guid -> (name, folder path), top level folder name -> folder id)
+    attributes: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+    topFolders: Dict[str, object] = {}
+
+    stack = [(structure, ())]
+    while (len(stack) > 0):
+        folder, path = stack.pop()
+        for attribute in (folder.attributes or []):
+            attributes[str(attribute.attribute.attributeId.guid)] = (attribute.attribute.name, path)
+        for subfolder in (folder.subfolders or []):
+            if (len(path) == 0):
+                topFolders[subfolder.attributeFolder.name] = subfolder.attributeFolder.attributeFolderId
+            stack.append((subfolder.attributeFolder, path + (subfolder.attributeFolder.name,)))
+
+    return attributes, topFolders
+
+
+def planFolderSync(targetFolders: Dict[str, Optional[str]], attributePaths: Dict[str, Tuple[str, ...]], existingFolders: Iterable[str] = ()) -> FolderSyncPlan:
+    # Function: computes the minimal creates and moves so every attribute sits in its target folder
+    # targetFolders maps attribute guid -> folder name (None = leave the attribute where it is).
+    # An attribute inside a subfolder of its target folder counts as filed, so hand made sub-organisation is kept.
+    existingFolders = set(existingFolders)
+    moves: Dict[str, List[str]] = {}
+
+    for (guid, folder) in targetFolders.items():
+        if (folder is None):
+            continue
+        currentPath = attributePaths.get(guid, ())
+        if (len(currentPath) > 0 and currentPath[0] == folder):
+            continue
+        moves.setdefault(folder, []).append(guid)
+
+    foldersToCreate = [folder for folder in moves if folder not in existingFolders]
+    return FolderSyncPlan(foldersToCreate, moves)
+
+
+def syncAttributeFolders(acc, act, attributeType: str, classify: Callable[[str], Optional[str]], folderOrder: List[str] = (), dryRun: bool = False) -> FolderSyncPlan:
+    # Function: reads the folder tree once, classifies every attribute by name, and applies the minimal plan with batched write calls
+    # (dryRun: only returns the plan)
+    attributes, topFolders = readFolderTree(acc.GetAttributeFolderStructure(attributeType))
+    targetFolders = {guid: classify(name) for (guid, (name, _)) in attributes.items()}
+    attributePaths = {guid: path for (guid, (_, path)) in attributes.items()}
+    plan = planFolderSync(targetFolders, attributePaths, topFolders.keys())
+
+    # keep the configured folder order for creating and moving
+    order = {folder: idx for (idx, folder) in enumerate(folderOrder)}
+    plan.foldersToCreate.sort(key=lambda f: order.get(f, len(order)))
+    if (plan.isEmpty() or dryRun):
+        return plan
+
+    if (len(plan.foldersToCreate) > 0):
+        acc.CreateAttributeFolders([act.AttributeFolderCreationParameters(attributeType, [folder]) for folder in plan.foldersToCreate])
+        # new folder ids are only known after creation (one more read of the tree)
+        _, topFolders = readFolderTree(acc.GetAttributeFolderStructure(attributeType))
+
+    for folder in sorted(plan.moves, key=lambda f: order.get(f, len(order))):
+        attributeIds = [act.AttributeIdWrapperItem(act.AttributeId(guid)) for guid in plan.moves[folder]]
+        acc.MoveAttributesAndFolders([], attributeIds, topFolders[folder])
+
+    return plan
+
+#######################################################################################################
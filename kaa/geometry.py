@@ -0,0 +1,192 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Columnar model of element geometry. Fetched bounding boxes are converted once into a NumPy  #
+# structured array (xMin..zMax, story, building, side, flags) with a parallel GUID array, so  #
+# filtering, grouping and ordering work on index arrays and masks instead of dereferencing    #
+# e[1].boundingBox3D.xMin on Python objects in every loop. The archicad ElementIdArrayItems    #
+# are kept (by row) only to write results back.                                                #
+#                                                                                              #
+#   table = ElementTable.fromBoundingBoxes(zones, acc.Get3DBoundingBoxes(zones))               #
+#   table.data["story"] = clusterStories(table.data["zMin"], 1)[0]                             #
+#   for (story,), rows in table.groups(["story"]).items(): ...                                 #
+################################################################################################
+
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+ELEMENT_DTYPE = np.dtype([
+    ("xMin", "f8"), ("yMin", "f8"), ("zMin", "f8"),
+    ("xMax", "f8"), ("yMax", "f8"), ("zMax", "f8"),
+    ("story", "i4"),        # story number (-1: unknown)
+    ("building", "i4"),     # building number (-1: unknown)
+    ("side", "i1"),         # exterior side, index into SIDES (-1: none)
+    ("flags", "u1"),        # FLAG_* bits
+])
+GUID_DTYPE = "U36"
+
+SIDES = ("Top", "Right", "Bottom", "Left")   # clockwise, as used by the exterior walk
+NO_SIDE = -1
+
+FLAG_SELECTED = 1
+FLAG_ENTRY = 2
+FLAG_EXTERIOR = 4
+FLAG_NO_GEOMETRY = 8      # Archicad returned an error instead of a bounding box
+FLAG_DELETED = 16         # no longer in the model, the row is kept by the geometry store (kaa/store.py)
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def sideCode(side: Optional[str]) -> int:
+    return SIDES.index(side) if side in SIDES else NO_SIDE
+
+
+class ElementTable:
+    # Class: one row per element; data is the structured array, guids the parallel GUID array and
+    # elements the archicad ElementIdArrayItems (or anything with .elementId) in the same order
+
+    def __init__(self, elements: List[Any], data: np.ndarray, guids: Optional[np.ndarray] = None):
+        self.elements = elements
+        self.data = data
+        self.guids = guids if guids is not None else np.array([e.elementId.guid for e in elements], dtype=GUID_DTYPE)
+        self._rowOfGuid = None
+
+    @classmethod
+    def empty(cls, count: int) -> np.ndarray:
+        data = np.zeros(count, dtype=ELEMENT_DTYPE)
+        data["story"] = -1
+        data["building"] = -1
+        data["side"] = NO_SIDE
+        return data
+
+    @classmethod
+    def fromBoundingBoxes(cls, elements: List[Any], boundingBoxes: Sequence[Any]) -> "ElementTable":
+        # Function: builds the table from Get3DBoundingBoxes results (BoundingBox3DOrError, in the order of elements)
+        coordinates = np.full((len(elements), 6), np.nan)
+        for (row, wrapper) in enumerate(boundingBoxes):
+            box = getattr(wrapper, "boundingBox3D", None)
+            if (box is not None):
+                coordinates[row] = (box.xMin, box.yMin, box.zMin, box.xMax, box.yMax, box.zMax)
+        return cls.fromBoxes(elements, coordinates)
+
+    @classmethod
+    def fromBoxes(cls, elements: List[Any], boxes: np.ndarray, guids: Optional[np.ndarray] = None) -> "ElementTable":
+        # Function: builds the table from an n x 6 box array (kaa.fastpath, NaN rows for elements without a box)
+        data = cls.empty(len(elements))
+        for (column, name) in enumerate(("xMin", "yMin", "zMin", "xMax", "yMax", "zMax")):
+            data[name] = boxes[:, column]
+        data["flags"][np.isnan(boxes[:, 0])] |= FLAG_NO_GEOMETRY
+        return cls(list(elements), data, guids)
+
+    @classmethod
+    def fromPairs(cls, pairs: Iterable[Tuple[Any, Any]]) -> "ElementTable":
+        # Function: builds the table from (element, bounding box) pairs as used by the legacy scripts
+        pairs = list(pairs)
+        return cls.fromBoundingBoxes([p[0] for p in pairs], [p[1] for p in pairs])
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def rowOf(self, guid: str) -> int:
+        # Function: row of an element by GUID (index built on first use)
+        if (self._rowOfGuid is None):
+            self._rowOfGuid = {guid: row for (row, guid) in enumerate(self.guids.tolist())}
+        return self._rowOfGuid[guid]
+
+    def rowsOf(self, elements: Iterable[Any]) -> np.ndarray:
+        # Function: rows of the given elements (ElementIdArrayItems), elements not in the table are left out
+        guids = np.array([e.elementId.guid for e in elements], dtype=GUID_DTYPE)
+        return np.flatnonzero(np.isin(self.guids, guids))
+
+    def elementsAt(self, rows: Iterable[int]) -> List[Any]:
+        return [self.elements[row] for row in rows]
+
+    def subset(self, rows: np.ndarray) -> "ElementTable":
+        return ElementTable([self.elements[row] for row in rows], self.data[rows], self.guids[rows])
+
+    def setFlag(self, flag: int, rows) -> None:
+        self.data["flags"][rows] |= flag
+
+    def hasFlag(self, flag: int) -> np.ndarray:
+        return (self.data["flags"] & flag) != 0
+
+    def setSides(self, sides: Sequence[Optional[str]], rows: Optional[np.ndarray] = None) -> None:
+        # Function: stores exterior side names (Top/Right/Bottom/Left) for rows (all rows if None)
+        codes = np.array([sideCode(side) for side in sides], dtype="i1")
+        if (rows is None):
+            self.data["side"] = codes
+        else:
+            self.data["side"][rows] = codes
+
+    def groups(self, keys: Sequence[str] = ("story", "building"), rows: Optional[np.ndarray] = None) -> Dict[Tuple[int, ...], np.ndarray]:
+        # Function: rows grouped by the given integer columns, groups in ascending key order, rows in table order
+        rows = np.arange(len(self.data)) if rows is None else np.asarray(rows)
+        if (len(rows) == 0):
+            return {}
+        columns = [self.data[key][rows] for key in keys]
+        order = np.lexsort(columns[::-1])   # lexsort is stable and sorts by its last key first
+        sortedColumns = [column[order] for column in columns]
+        breaks = np.flatnonzero(np.any([np.diff(column) != 0 for column in sortedColumns], axis=0)) + 1
+        return {tuple(int(column[start]) for column in sortedColumns): rows[chunk] for (start, chunk) in zip(np.r_[0, breaks], np.split(order, breaks))}
+
+
+def clusterStories(zValues: np.ndarray, limit: float) -> Tuple[np.ndarray, List[Tuple[float, float]]]:
+    # Function: vectorised createClusters: sorted z values closer than limit to their neighbour form one story.
+    # Returns the story index of every value (in the input order) and the (zMin, zMax) range of every story.
+    # Elements without geometry (NaN) get story -1.
+    zValues = np.asarray(zValues, dtype=float)
+    stories = np.full(len(zValues), -1, dtype="i4")
+    valid = np.flatnonzero(~np.isnan(zValues))
+    if (len(valid) == 0):
+        return stories, []
+    order = valid[np.argsort(zValues[valid], kind="stable")]
+    sortedValues = zValues[order]
+    starts = np.r_[True, np.diff(sortedValues) > limit]
+    stories[order] = np.cumsum(starts) - 1
+    firsts = np.flatnonzero(starts)
+    lasts = np.r_[firsts[1:] - 1, len(sortedValues) - 1]
+    return stories, [(float(sortedValues[f]), float(sortedValues[l])) for (f, l) in zip(firsts, lasts)]
+
+
+def distancesFrom(table: ElementTable, rows: np.ndarray, x: float, y: float) -> np.ndarray:
+    # Function: plan distance of the (xMin, yMin) corner of every row from (x, y)
+    return np.hypot(table.data["xMin"][rows] - x, table.data["yMin"][rows] - y)
+
+
+def orderByDistance(table: ElementTable, rows: np.ndarray, entryRow: int) -> np.ndarray:
+    # Function: rows sorted by distance from the entry element (same order as kaa.ordering.sortPositionsByDistance)
+    rows = np.asarray(rows)
+    distances = distancesFrom(table, rows, table.data["xMin"][entryRow], table.data["yMin"][entryRow])
+    return rows[np.argsort(distances, kind="stable")]
+
+
+def orderByPrevious(table: ElementTable, rows: np.ndarray, entryRow: int) -> np.ndarray:
+    # Function: nearest-neighbour walk starting at the entry element (same order as kaa.ordering.sortPositionsByPrevious)
+    rows = np.asarray(rows)
+    xs, ys = table.data["xMin"][rows], table.data["yMin"][rows]
+    visited = np.zeros(len(rows), dtype=bool)
+    current = int(np.flatnonzero(rows == entryRow)[0])
+    visited[current] = True
+    order = [current]
+    for _ in range(len(rows) - 1):
+        distances = np.hypot(xs - xs[current], ys - ys[current])
+        distances[visited] = np.inf
+        current = int(np.argmin(distances))   # first of equally close rows, like the legacy stable sort
+        visited[current] = True
+        order.append(current)
+    return rows[order]
+
+#######################################################################################################
@@ -0,0 +1,139 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Write journal. Before a task sends SetPropertyValuesOfElements, writeValues (kaa/tasks/      #
+# common.py) records the previous and the new value of every element it writes in the run's    #
+# journal file, so a bad run can be undone with one command: kaa rollback reads the current    #
+# values once, restores the previous ones in a single SetPropertyValuesOfElements and marks    #
+# the journal as rolled back. Elements whose value changed again since the run are left alone  #
+# (--force restores them too). The previous values come from the read the task already made    #
+# (--stable, --watch), else from one batched read of the elements about to be written.         #
+#                                                                                              #
+# One journal per run, kaa_journal/<date>-<time>-<command>.json (--journal DIR), written only  #
+# if the run writes something: {"version", "command", "created", "rolledBack", "entries":      #
+# {property GUID: {element GUID: [previous, written]}}}. An element written several times in   #
+# one run (--watch) keeps its first previous and its last written value.                       #
+################################################################################################
+
+
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+JOURNAL_DIR = "kaa_journal"
+JOURNAL_VERSION = 1
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class WriteJournal:
+    # Class: previous and written values of the element properties one run wrote, saved to its file before each write is sent
+
+    def __init__(self, path: str, command: str, entries: Optional[Dict[str, Dict[str, List[Any]]]] = None,
+                 created: Optional[str] = None, rolledBack: Optional[str] = None):
+        self.path = path
+        self.command = command
+        self.entries = entries or {}       # property GUID -> element GUID -> [previous, written]
+        self.created = created or time.strftime("%Y-%m-%dT%H:%M:%S")
+        self.rolledBack = rolledBack
+
+    @classmethod
+    def create(cls, directory: str, command: str) -> "WriteJournal":
+        # Function: a new journal for a run of command in directory (the file is written with the first record)
+        stem = os.path.join(directory, f"{time.strftime('%Y%m%d-%H%M%S')}-{command}")
+        (path, count) = (stem + ".json", 1)
+        while (os.path.exists(path)):
+            count += 1
+            path = f"{stem}-{count}.json"
+        return cls(path, command)
+
+    @classmethod
+    def load(cls, path: str) -> "WriteJournal":
+        with open(path, "r", encoding="utf-8") as journalFile:
+            content = json.load(journalFile)
+        if (content.get("version") != JOURNAL_VERSION):
+            raise ValueError(f"{path} is not a version {JOURNAL_VERSION} write journal")
+        return cls(path, content["command"], content["entries"], content["created"], content.get("rolledBack"))
+
+    def __len__(self) -> int:
+        return sum(len(elements) for elements in self.entries.values())
+
+    def record(self, propertyGuid: str, values: Iterable[Tuple[str, Any]], previous: Dict[str, Any]):
+        # Function: records the (element GUID, new value) pairs about to be written with their previous values and saves
+        elements = self.entries.setdefault(propertyGuid, {})
+        for (guid, value) in values:
+            if (guid in elements):
+                elements[guid][1] = value
+            else:
+                elements[guid] = [previous.get(guid), value]
+        self.save()
+
+    def save(self):
+        directory = os.path.dirname(self.path)
+        if (directory):
+            os.makedirs(directory, exist_ok=True)
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as journalFile:
+            json.dump({"version": JOURNAL_VERSION, "command": self.command, "created": self.created, "rolledBack": self.rolledBack,
+                       "entries": self.entries}, journalFile, separators=(",", ":"))
+        os.replace(temporary, self.path)
+
+
+_journals: Dict[int, WriteJournal] = {}     # id(connection) -> its journal (ACConnection has __slots__, it cannot hold one)
+
+
+def startJournal(conn, directory: str, command: str) -> WriteJournal:
+    # Function: journals every writeValues on the connection from now on (see the header)
+    _journals[id(conn)] = WriteJournal.create(directory, command)
+    return _journals[id(conn)]
+
+
+def journalOf(conn) -> Optional[WriteJournal]:
+    # Function: the journal started for the connection, None if its writes are not journaled
+    return _journals.get(id(conn))
+
+
+def latestJournal(directory: str = JOURNAL_DIR) -> Optional[str]:
+    # Function: the path of the newest journal in directory that is not rolled back yet, None if there is none
+    if (not os.path.isdir(directory)):
+        return None
+    paths = [os.path.join(directory, n) for n in os.listdir(directory) if n.endswith(".json")]
+    for path in sorted(paths, key=os.path.getmtime, reverse=True):
+        try:
+            if (WriteJournal.load(path).rolledBack is None):
+                return path
+        except (OSError, ValueError, KeyError):
+            continue
+    return None
+
+
+def rollbackValues(journal: WriteJournal, current: Dict[str, Dict[str, Any]], force: bool = False) -> Tuple[List[Tuple[str, str, Any]], List[Tuple[str, str, Any]]]:
+    # Function: ((property GUID, element GUID, previous value) to restore, (property GUID, element GUID, current value) left
+    # alone because they changed since the run) given the current values by property; elements still holding their previous
+    # value are in neither
+    (restore, changed) = ([], [])
+    for (propertyGuid, elements) in journal.entries.items():
+        values = current.get(propertyGuid, {})
+        for (guid, (previous, written)) in elements.items():
+            value = values.get(guid)
+            if (value == previous):
+                continue
+            if (value == written or force):
+                restore.append((propertyGuid, guid, previous))
+            else:
+                changed.append((propertyGuid, guid, value))
+    return (restore, changed)
+
+#######################################################################################################
@@ -0,0 +1,150 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Request coalescing for property values and bounding boxes (DataLoader style). Code running   #
+# on one AsyncConnection awaits loader.values(guids, propertyIds) or loader.boxes(guids) where #
+# it needs them; the requests made within one batch window (a few milliseconds, the next loop  #
+# turn if 0) are merged and sent as one GetPropertyValuesOfElements (all their elements x all #
+# their properties) and one Get3DBoundingBoxes / Get2DBoundingBoxes per dimension, through     #
+# kaa/fastpath.py, and every caller gets the rows it asked for. Results are kept for the life #
+# of the loader, so asking again for the same elements costs nothing: use one loader per run   #
+# (or clear() it) when the model may have changed.                                             #
+#                                                                                              #
+#   loader = BatchLoader(aconn)                                                                #
+#   (story,) = await loader.values(guids, [storyId])   # merged with the other callers' asks   #
+################################################################################################
+
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from kaa.aio import AsyncCommands, AsyncConnection
+from kaa.fastpath import BOX_FIELDS, RawCommands
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+BATCH_WINDOW = 0.005    # seconds requests are collected before a batch is sent (small next to an Archicad round trip)
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class LoadedRows:
+    # Class: rows fetched so far for one property or box kind: a GUID -> row index and the row array
+
+    def __init__(self, data: np.ndarray):
+        self.rowOf: Dict[str, int] = {}
+        self.data = data
+
+    def missing(self, guids: Sequence[str]) -> List[str]:
+        return [g for g in guids if g not in self.rowOf]
+
+    def add(self, guids: Sequence[str], data: np.ndarray):
+        start = len(self.data)
+        for (offset, guid) in enumerate(guids):
+            self.rowOf[guid] = start + offset
+        self.data = np.concatenate([self.data, data])
+
+    def get(self, guids: Sequence[str]) -> np.ndarray:
+        return self.data[[self.rowOf[g] for g in guids]]
+
+
+class BatchLoader:
+    # Class: merges the value and box requests of concurrent callers on one AsyncConnection into as few commands as possible
+
+    def __init__(self, aconn: AsyncConnection, window: float = BATCH_WINDOW):
+        self.aconn = aconn
+        self.window = window
+        self.raw = AsyncCommands(RawCommands(aconn.conn), aconn)
+        self.requests = 0         # values() / boxes() calls
+        self.commands = 0         # commands sent for them
+        self._values: Dict[str, LoadedRows] = {}      # property GUID -> values
+        self._boxes: Dict[str, LoadedRows] = {}       # "3D" / "2D" -> box rows
+        self._pendingValues: List[tuple] = []         # (guids, property GUIDs, property ids)
+        self._pendingBoxes: Dict[str, List[List[str]]] = {}
+        self._batch: Optional[asyncio.Future] = None
+
+    def clear(self):
+        # Function: forgets every fetched value and box (the next requests go to Archicad again)
+        self._values.clear()
+        self._boxes.clear()
+
+    def _rowsOf(self, store: Dict[str, LoadedRows], key: str, empty: np.ndarray) -> LoadedRows:
+        if (key not in store):
+            store[key] = LoadedRows(empty)
+        return store[key]
+
+    async def _wait(self):
+        # waits for the batch this request was added to (started by the first request of the window)
+        if (self._batch is None or self._batch.get_loop() is not asyncio.get_running_loop()):
+            self._batch = asyncio.ensure_future(self._dispatch())
+        await asyncio.shield(self._batch)
+
+    async def values(self, guids: Sequence[str], propertyIds: Sequence[Any]) -> List[np.ndarray]:
+        # Function: one object array of plain values per property, in the order of guids (see RawCommands.GetPropertyValuesOfElements)
+        self.requests += 1
+        guids = list(guids)
+        keys = [str(p.guid) for p in propertyIds]
+        stores = [self._rowsOf(self._values, key, np.empty(0, dtype=object)) for key in keys]
+        if (any(store.missing(guids) for store in stores)):
+            self._pendingValues.append((guids, keys, list(propertyIds)))
+            await self._wait()
+        return [store.get(guids) for store in stores]
+
+    async def boxes(self, guids: Sequence[str], dimensions: str = "3D") -> np.ndarray:
+        # Function: the box array of the elements, in the order of guids (see RawCommands.GetBoundingBoxes)
+        self.requests += 1
+        guids = list(guids)
+        store = self._rowsOf(self._boxes, dimensions, np.empty((0, len(BOX_FIELDS[dimensions]))))
+        if (store.missing(guids)):
+            self._pendingBoxes.setdefault(dimensions, []).append(guids)
+            await self._wait()
+        return store.get(guids)
+
+    async def _dispatch(self):
+        # one batch: waits for the window, then one command per kind for everything still missing
+        await asyncio.sleep(self.window)
+        (pendingValues, pendingBoxes) = (self._pendingValues, self._pendingBoxes)
+        (self._pendingValues, self._pendingBoxes, self._batch) = ([], {}, None)
+
+        calls = []
+        if (pendingValues):
+            propertyIds = {}
+            needed = {}
+            for (guids, keys, ids) in pendingValues:
+                for (key, propertyId) in zip(keys, ids):
+                    missing = self._values[key].missing(guids)
+                    if (missing):
+                        propertyIds.setdefault(key, propertyId)
+                        needed.update(dict.fromkeys(missing))
+            if (needed):
+                calls.append(self._loadValues(list(needed), list(propertyIds), list(propertyIds.values())))
+        for (dimensions, requests) in pendingBoxes.items():
+            store = self._boxes[dimensions]
+            needed = list(dict.fromkeys(g for guids in requests for g in store.missing(guids)))
+            if (needed):
+                calls.append(self._loadBoxes(needed, dimensions))
+        self.commands += len(calls)
+        await asyncio.gather(*calls)
+
+    async def _loadValues(self, guids: List[str], keys: List[str], propertyIds: List[Any]):
+        columns = await self.raw.GetPropertyValuesOfElements(guids, propertyIds)
+        for (key, column) in zip(keys, columns):
+            store = self._values[key]
+            fresh = [row for (row, g) in enumerate(guids) if g not in store.rowOf]
+            store.add([guids[row] for row in fresh], column[fresh])
+
+    async def _loadBoxes(self, guids: List[str], dimensions: str):
+        self._boxes[dimensions].add(guids, await self.raw.GetBoundingBoxes(guids, dimensions))
+
+#######################################################################################################
@@ -0,0 +1,159 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# KAA attribute naming convention. The rule table below maps a name prefix to the folder the   #
+# attribute belongs in. The table is compiled once into a prefix trie, so classifying a name   #
+# walks at most len(name) characters and never indexes past the end of a short name.          #
+################################################################################################
+
+
+import json
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+# Folder Names (order matters, folders are created in this order)
+ARCHITECTURAL = "ARCHITECTURAL"
+LANDSCAPE = "LANDSCAPE"
+GENERAL = "GENERAL"
+ENGINEERING = "ENGINEERING"
+OPTIONS = "OPTIONS"
+NPLT = "NPLT"
+CONTEXT = "CONTEXT"
+STRUCTURAL = "STRUCTURAL RSC"
+NON_COMPLIANT = "AUDIT: NON-COMPLIANT"
+
+LAYER_FOLDERS = [ARCHITECTURAL, LANDSCAPE, GENERAL, ENGINEERING, OPTIONS, NPLT, CONTEXT, STRUCTURAL, NON_COMPLIANT]
+
+# Layer rule table: (name prefix, folder)
+LAYER_RULES = [
+    ("A-", ARCHITECTURAL),
+    ("L-", LANDSCAPE),
+    ("G-", GENERAL),
+    ("M-", ENGINEERING),
+    ("P-", ENGINEERING),
+    ("E-", ENGINEERING),
+    ("S-", ENGINEERING),
+    ("LT-", ENGINEERING),
+    ("OPTION-", OPTIONS),
+    ("NPLT", NPLT),
+    ("X-", CONTEXT),
+    ("Z-", CONTEXT),
+    ("S9", STRUCTURAL),
+    ("Z9", STRUCTURAL),
+    ("9 |", STRUCTURAL),
+]
+
+# Layers that are never audited or moved
+IGNORED_LAYER_NAMES = ["Archicad Layer"]
+
+# Discipline prefixes used for the other attribute types (surfaces, building materials, composites, line types,
+# fills and pen tables). Edit a type's table in ATTRIBUTE_RULES, or pass a JSON rule file to loadRuleTables().
+DISCIPLINE_RULES = [
+    ("A-", ARCHITECTURAL),
+    ("L-", LANDSCAPE),
+    ("G-", GENERAL),
+    ("M-", ENGINEERING),
+    ("P-", ENGINEERING),
+    ("E-", ENGINEERING),
+    ("S-", ENGINEERING),
+    ("X-", CONTEXT),
+    ("Z-", CONTEXT),
+]
+
+# Attribute type (as used by GetAttributesByType) -> (rule table, ignored names)
+ATTRIBUTE_RULES = {
+    "Layer": (LAYER_RULES, IGNORED_LAYER_NAMES),
+    "Surface": (DISCIPLINE_RULES, []),
+    "BuildingMaterial": (DISCIPLINE_RULES, []),
+    "Composite": (DISCIPLINE_RULES, []),
+    "Line": (DISCIPLINE_RULES, []),
+    "Fill": (DISCIPLINE_RULES, []),
+    "PenTable": (DISCIPLINE_RULES, []),
+}
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+_TERMINAL = ""  # trie key that holds the folder of a complete prefix (never a real character)
+
+
+class PrefixClassifier:
+    # Class: compiles a (prefix, folder) rule table into a prefix trie and classifies names against it
+
+    def __init__(self, rules: Iterable[Tuple[str, str]], ignoredNames: Iterable[str] = (), default: str = NON_COMPLIANT):
+        self.rules = list(rules)
+        self.ignoredNames = set(ignoredNames)
+        self.default = default
+        self.trie: Dict[str, dict] = {}
+
+        for (prefix, folder) in self.rules:
+            if (len(prefix) == 0):
+                raise ValueError("Naming rule prefixes cannot be empty.")
+            node = self.trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            if (_TERMINAL in node and node[_TERMINAL] != folder):
+                raise ValueError(f"Naming rule prefix '{prefix}' is listed twice with different folders.")
+            node[_TERMINAL] = folder
+
+    def classify(self, name: str) -> Optional[str]:
+        # Function: returns the folder of the longest matching prefix, the default folder if no rule matches, or None for ignored names
+        if (name in self.ignoredNames):
+            return None
+
+        folder = self.default
+        node = self.trie
+        for char in name:
+            node = node.get(char)
+            if (node is None):
+                break
+            if (_TERMINAL in node):
+                folder = node[_TERMINAL]
+        return folder
+
+    def classifyAll(self, names: Iterable[str]) -> List[Optional[str]]:
+        # Function: classifies many names at once (repeated names are only walked once)
+        cache: Dict[str, Optional[str]] = {}
+        folders = []
+        for name in names:
+            if (name not in cache):
+                cache[name] = self.classify(name)
+            folders.append(cache[name])
+        return folders
+
+    def isCompliant(self, name: str) -> bool:
+        # Function: ignored names are compliant, anything that falls through to the default folder is not
+        return self.classify(name) != self.default
+
+
+LAYER_CLASSIFIER = PrefixClassifier(LAYER_RULES, IGNORED_LAYER_NAMES)
+
+
+def compileRuleTables(ruleTables: Dict[str, Tuple[List[Tuple[str, str]], List[str]]] = None) -> Dict[str, PrefixClassifier]:
+    # Function: compiles one classifier per attribute type (defaults to ATTRIBUTE_RULES)
+    if (ruleTables is None):
+        ruleTables = ATTRIBUTE_RULES
+    return {attributeType: PrefixClassifier(rules, ignored) for (attributeType, (rules, ignored)) in ruleTables.items()}
+
+
+def loadRuleTables(path: str) -> Dict[str, PrefixClassifier]:
+    # Function: compiles rule tables from a JSON file: {"Surface": {"rules": [["A-", "ARCHITECTURAL"], ...], "ignored": [...]}, ...}
+    # Types missing from the file keep their default table.
+    with open(path, encoding="utf-8") as ruleFile:
+        data = json.load(ruleFile)
+    ruleTables = dict(ATTRIBUTE_RULES)
+    for (attributeType, table) in data.items():
+        ruleTables[attributeType] = ([tuple(rule) for rule in table["rules"]], table.get("ignored", []))
+    return compileRuleTables(ruleTables)
+
+#######################################################################################################
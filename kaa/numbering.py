@@ -0,0 +1,168 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# The numbering rules of the door, window and zone dimension scripts as plain functions. They #
+# take ElementRecords (kaa/records.py) or numbers and return (GUID, value) pairs, so they run  #
+# without Archicad and the tasks in kaa/tasks only fetch, call one of these and write.          #
+# Missing or inconsistent user input raises NumberingError with the message for the user.      #
+# Given the existing {GUID: number} values the numberers renumber stably (kaa/stable.py).     #
+################################################################################################
+
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from kaa.ordering import sortRecordsByDistance
+from kaa.perimeter import PerimeterWalkError, walkPerimeter
+from kaa.records import ElementRecord
+from kaa.stable import stableNumbers
+
+NumberedValue = Tuple[str, str]   # (element GUID, new property value)
+ExistingValues = Optional[Dict[str, Optional[str]]]   # element GUID -> current property value, None: number from 1
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+NUMBER_OF_STORIES = 4      # stories numbered by the door/window numberers (StoryNumber 0..NUMBER_OF_STORIES-1)
+NO_ZONE_NUMBER = '000'     # zone number of doors that are not tied to a zone
+METERS_TO_INCHES = 39.3701
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class NumberingError(ValueError):
+    # Raised when the model is missing user input the numbering needs; the message tells the user what to set
+    pass
+
+
+def numberString(storyIndex: int, elemIndex: int, prefix: str = '') -> str:
+    # Function: the number of the elemIndex-th element on a story, e.g. 203 for the third element on story 2
+    return f"{prefix}{storyIndex:1d}{elemIndex:02d}"
+
+
+def numberGroup(storyIndex: int, orderedGuids: Sequence[str], prefix: str = '', existing: ExistingValues = None) -> List[NumberedValue]:
+    # Function: numbers of one story/building group in its new order; 1, 2, ... or, given the existing values, as few changes as possible
+    if (existing is None):
+        indexes = range(1, len(orderedGuids) + 1)
+    else:
+        indexes = stableNumbers(storyIndex, orderedGuids, existing, prefix)
+    return [(guid, numberString(storyIndex, elemIndex, prefix)) for (guid, elemIndex) in zip(orderedGuids, indexes)]
+
+
+def changedValues(values: Sequence[NumberedValue], existing: ExistingValues) -> List[NumberedValue]:
+    # Function: the values that differ from the existing ones (all of them without existing values)
+    if (existing is None):
+        return list(values)
+    return [(guid, value) for (guid, value) in values if existing.get(guid) != value]
+
+
+def requireField(records: Iterable[ElementRecord], field: str, message: str) -> None:
+    # Function: raises NumberingError (message formatted with the record's guid) for the first record without the field
+    for record in records:
+        if (getattr(record, field) is None):
+            raise NumberingError(message.format(guid=record.guid))
+
+
+def storyBuildingGroups(records: Sequence[ElementRecord], numberOfStories: int, kind: str = "Door/Window"):
+    # Function: yields (story, building, records) for stories 0..numberOfStories-1 and the BuildingNumbers in use, lowest first
+    requireField(records, "story", f"{kind} (ID: {{guid}}) does not have a StoryNumber. Ensure each {kind} has the appropriate StoryNumber set.")
+    for story in range(numberOfStories):
+        onStory = [r for r in records if r.story == story]
+        if (len(onStory) == 0):
+            continue
+        requireField(onStory, "building", f"{kind} (ID: {{guid}}) does not have a BuildingNumber. Ensure each {kind} has the appropriate BuildingNumber set.")
+        for building in sorted(set(r.building for r in onStory)):
+            yield (story, building, [r for r in onStory if r.building == building])
+
+
+def numberDoorsByDistance(doors: Sequence[ElementRecord], numberOfStories: int = NUMBER_OF_STORIES, prefix: str = '',
+                          existing: ExistingValues = None) -> List[NumberedValue]:
+    # Function: interior door numbers per story and building, by distance from the building's First_Door (the last one wins if several are set)
+    values = []
+    for (story, building, doorsInBuilding) in storyBuildingGroups(doors, numberOfStories, "Door"):
+        entryDoors = [d for d in doorsInBuilding if d.isFirstDoor]
+        if (len(entryDoors) == 0):
+            raise NumberingError(f"No First_Door Found in Building {building} on story {story}. Ensure one door has the appropriate property set for each story.")
+        values.extend(numberGroup(story, [d.guid for d in sortRecordsByDistance(doorsInBuilding, entryDoors[-1])], prefix, existing))
+    return values
+
+
+def numberFenestration(openings: Sequence[ElementRecord], numberOfStories: int = NUMBER_OF_STORIES, prefix: str = '',
+                       existing: ExistingValues = None) -> List[NumberedValue]:
+    # Function: exterior door/window numbers per story and building, clockwise around the perimeter from the First_Door (else the First_Window)
+    values = []
+    for (story, building, inBuilding) in storyBuildingGroups(openings, numberOfStories):
+        entryElements = [dw for dw in inBuilding if dw.isFirstDoor] or [dw for dw in inBuilding if dw.isFirstWindow]
+        if (len(entryElements) == 0):
+            raise NumberingError(f"No First_Door or First_Window Found in Building {building} on story {story}. Ensure one door or window has the appropriate property set for each story.")
+        requireField(inBuilding, "side", "Door/Window (ID: {guid}) does not have an ExteriorSide. Ensure each exterior Door/Window has the appropriate ExteriorSide property set.")
+
+        # z band of the building: zMin of the lowest element (by zMax) to the highest zMax
+        minMaxValues = (min(inBuilding, key=lambda dw: dw.zMax).zMin, max(inBuilding, key=lambda dw: dw.zMax).zMax)
+        try:
+            sortedElements = walkPerimeter(entryElements[-1], minMaxValues, inBuilding)
+        except PerimeterWalkError as error:
+            raise NumberingError(f"{error} (Building {building}, story {story})") from error
+        values.extend(numberGroup(story, [dw.guid for dw in sortedElements], prefix, existing))
+    return values
+
+
+def letterDoorsByZone(doorZones: Iterable[Tuple[Any, str]]) -> List[Tuple[Any, str]]:
+    # Function: takes (door, related zone number) pairs and returns (door, zone number + letter) in zone number order, e.g. 101a, 101b, 102a
+    values = []
+    previousZone = None
+    for (door, zoneNumber) in sorted(doorZones, key=lambda d: int(d[1])):
+        charIdx = 'a' if zoneNumber != previousZone else chr(ord(charIdx) + 1)
+        previousZone = zoneNumber
+        values.append((door, zoneNumber + charIdx))
+    return values
+
+
+def zoneDimensions(boxWidth: float, boxLength: float, userAngle: float) -> Tuple[Optional[Tuple[int, int, int, int]], str]:
+    # Function: width and length (feet, inches, feet, inches) of a zone rotated by userAngle from its 2D bounding box size (meters),
+    # and the notes printed for the zone. None when the angle cannot be calculated (exactly 45, or above 90 degrees).
+    # Angles between 45 and 90 work but swap Width and Length, so they are corrected to 90 - angle.
+    notes = []
+    if (userAngle > 45 and userAngle <= 90):
+        angle = 90 - userAngle
+        notes.append(f"input angle {userAngle} corrected*")
+    else:
+        angle = float(userAngle)
+
+    if (angle == 45):
+        notes.append(f"input angle {angle} skipped; cannot be calculated*")
+        return None, "\n".join(notes)
+    if (angle > 90):
+        notes.append(f"input angle = {angle} skipped; must be less than 45*")
+        return None, "\n".join(notes)
+    notes.append(f"calculation angle = {angle}")
+
+    tangent = math.tan(math.radians(angle))
+
+    # sides a and b of the corner triangle, c is the actual Width of the room
+    b = ((boxWidth * tangent) - boxLength) / ((tangent * tangent) - 1)
+    a = b * tangent
+    c = math.sqrt((a*a)+(b*b))
+
+    # sides a1, b1, c1 (c1 is actual Length of room)
+    a1 = boxLength - b
+    b1 = boxWidth - a
+    c1 = math.sqrt((a1*a1)+(b1*b1))
+
+    widthIn = round(c * METERS_TO_INCHES)
+    lengthIn = round(c1 * METERS_TO_INCHES)
+    return (widthIn // 12, widthIn % 12, lengthIn // 12, lengthIn % 12), "\n".join(notes)
+
+
+def dimensionString(widthFt: int, widthIn: int, lengthFt: int, lengthIn: int) -> str:
+    return f"{widthFt}'-{widthIn}\" x {lengthFt}'-{lengthIn}\""
+
+#######################################################################################################
@@ -0,0 +1,418 @@
+######################################### General Info #########################################
+# Written by: Jessica Wood  w/ Meghan Beckmann, for KAA Design Group                           #
+# Date Created: 09/2022                                                                        #
+# Date Modified: 10/2026    moved out of the numbering scripts so they can be benchmarked      #
+#                                                                                              #
+# Description:                                                                                 #
+# Ordering algorithms shared by the numbering scripts. They work on plain data only:           #
+# elements are (ElementIdArrayItem, BoundingBox3DOrError) tuples (or anything shaped like      #
+# them) and the exterior side of every door/window is passed in as a {guid: side} dictionary,  #
+# so nothing here talks to Archicad.                                                           #
+################################################################################################
+
+
+import math
+from typing import Any, Dict, Iterable, List, Tuple
+
+Element = Tuple[Any, Any]   # (ElementIdArrayItem, BoundingBox3DOrError)
+
+
+
+
+########################################################################################## FUNCTIONS #############################################################################################
+
+def createClusters(positions: Iterable[float], limit: float) -> List[Tuple[float, float]]:
+    # Function: creates clusters based on zValues of all the Zones. Clusters represent stories
+
+    # sort Zvalues in ascending order
+    positions = sorted(positions)
+
+    if len(positions) == 0:
+        return []
+
+    clusters = []
+    posIter = iter(positions)
+    firstPos = lastPos = next(posIter)
+
+    for pos in posIter:
+        if pos - lastPos <= limit:
+            lastPos = pos
+        else:
+            clusters.append((firstPos, lastPos))
+            firstPos = lastPos = pos
+
+    clusters.append((firstPos, lastPos))
+    return clusters
+
+
+def sortPositionsByDistance(positions: Iterable[Tuple[float, float, float, float, float]], entryPosition: Tuple[float, float]) -> List[Tuple[float, float, float, float, float]]:
+    # Function: takes positions and the position of the entry room and returns positions sorted by their distance from the Entry room
+
+    # sort positions by distance from entry point
+    positions = sorted(positions, key=lambda e: math.dist((e[0], e[1]), entryPosition))
+
+    # return sorted positions
+    return positions
+
+
+def sortRecordsByDistance(records: Iterable[Any], entryRecord: Any) -> List[Any]:
+    # Function: sortPositionsByDistance for ElementRecords (kaa/records.py): records sorted by the distance of their (xMin, yMin) from the entry record
+    return sorted(records, key=lambda r: math.dist((r.xMin, r.yMin), (entryRecord.xMin, entryRecord.yMin)))
+
+
+def sortPositionsByPrevious(positions1: List[Element], entryPosition: Element) -> List[Element]:
+    # function: takes positions and the position of the entry room and returns positions sorted by their distance from the previous zone (starting at the Entry zone)
+
+    sortedPos = []
+    sortedPos.append(entryPosition)
+
+    for i in range(len(positions1)-1):
+        closestPoint = sorted(positions1, key=lambda e: math.dist((e[1].boundingBox3D.xMin, e[1].boundingBox3D.yMin), (sortedPos[i][1].boundingBox3D.xMin, sortedPos[i][1].boundingBox3D.yMin)))
+
+        for x in range(len(closestPoint)):
+            if (not isInArray(closestPoint[x], sortedPos)):
+                sortedPos.append(closestPoint[x])
+                break
+
+    return sortedPos
+
+
+
+def sortPositions(entryElement: Element, minMaxVals: Tuple[float, float], elements: List[Element], sides: Dict[str, str]) -> List[Element]: # need a user defined entry door
+    # Function: †akes all Doors/Windows on the current story and the position of the entry Door/Window and returns positions sorted clockwise around the perimeter starting with entry Door/Window
+
+    # If there is only one Door/Window return
+    if (len(elements) == 1):
+        return [elements[0]]
+
+    # create Z-midpoint
+    midpointZ = (minMaxVals[1] + minMaxVals[0])/2
+
+    # sort positions by midpoint
+    bottomRow = [e for e in elements if e[1].boundingBox3D.zMin <= midpointZ]
+    bottomPos = [p[0] for p in bottomRow]
+    topRow = [e for e in elements if e[1].boundingBox3D.zMin > midpointZ]
+    topPos = [p[0] for p in topRow]
+    
+    # create list to represent sorted points
+    sortedPositions = []
+
+    # first numbered element will be entry door/window
+    sortedPositions.append(entryElement)
+    currentPos = entryElement
+
+    # loop through each row and append the closest point to the sorted list
+
+    # loop through bottom row first
+    for i in range(len(bottomPos)-1):
+        if (currentPos == "error"):
+            print("error!")
+
+        # Call function to find the next closest door/window (from the side the element is on)
+        tempPos = determineClosestPoint(currentPos, bottomRow, sides[currentPos[0].elementId.guid], sortedPositions, sides)
+        currentPos = tempPos
+        sortedPositions.append(currentPos)
+
+    # If there are no doors/windows in the top row, skip the top row iteration
+    if (len(topRow) == 0):
+        return sortedPositions
+
+    # set up current pos for top row
+    currentPos = determineClosestPoint(entryElement, topRow, sides[entryElement[0].elementId.guid], sortedPositions, sides)
+    sortedPositions.append(currentPos)
+
+    # loop through top row
+    for i in range(len(topPos)-1):
+        if (currentPos == "error"):
+            print("error!")
+
+        # Call function to find the next closest door/window (from the side the element is on)
+        tempPos = determineClosestPoint(currentPos, topRow, sides[currentPos[0].elementId.guid], sortedPositions, sides)
+        currentPos = tempPos
+        sortedPositions.append(currentPos)
+    
+    return sortedPositions
+
+
+
+
+def determineClosestPoint(point: Element, positions: List[Element], side: str, sortedPositions: List[Element], sides: Dict[str, str]):
+    # Function: Returns the next closest door/window of the given door/window
+
+    # sort objects by the side in which they belong
+    top = []
+    bottom = []
+    left = []
+    right = []
+    for i in range(len(positions)):
+        if (sides[positions[i][0].elementId.guid] == "Top"):
+            if (positions[i][0].elementId.guid != point[0].elementId.guid):
+                if (side == sides[positions[i][0].elementId.guid]):
+                    if (not isInArray(positions[i], sortedPositions)): 
+                        top.append(positions[i])
+                else:
+                    top.append(positions[i])
+        if (sides[positions[i][0].elementId.guid] == "Bottom"):
+            if (positions[i][0].elementId.guid != point[0].elementId.guid):
+                if (side == sides[positions[i][0].elementId.guid]):
+                    if (not isInArray(positions[i], sortedPositions)): 
+                        bottom.append(positions[i])
+                else:
+                    bottom.append(positions[i])
+        if (sides[positions[i][0].elementId.guid] == "Right"):
+            if (positions[i][0].elementId.guid != point[0].elementId.guid):
+                if (side == sides[positions[i][0].elementId.guid]):
+                    if (not isInArray(positions[i], sortedPositions)): 
+                        right.append(positions[i])
+                else:
+                    right.append(positions[i])
+        if (sides[positions[i][0].elementId.guid] == "Left"):
+            if (positions[i][0].elementId.guid != point[0].elementId.guid):
+                if (side == sides[positions[i][0].elementId.guid]):
+                    if (not isInArray(positions[i], sortedPositions)): 
+                        left.append(positions[i])
+                else:
+                    left.append(positions[i])
+
+
+    # Find which side the current Door/Window belongs to
+    if (side == 'Top'): 
+        # Check if there are any other elements that have not been numbered on the Top side, if not move to the right, bottom, then left and check if they have elements to be numbered
+        if (len([t for t in top if t[1].boundingBox3D.xMin >= point[1].boundingBox3D.xMin]) == 0): 
+            if (len(right) == 0):
+                if (len(bottom) == 0):
+                    if (len(left) == 0):
+                        if (len([t for t in top if not isInArray(t, sortedPositions)]) == 0):
+                            return "error"
+                        else:
+                            top = sorted([t for t in top if not isInArray(t, sortedPositions)], key=lambda b: b[1].boundingBox3D.xMin)
+                            return top[0]
+                    else:
+                        left = sorted(left, key=lambda e: e[1].boundingBox3D.yMin)
+                        for i in range(len(left)):
+                            if (not isInArray(left[i], sortedPositions)):
+                                return left[i]
+                else:
+                    bottom = sorted(bottom, key=lambda e: e[1].boundingBox3D.xMin, reverse=True)
+                    for i in range(len(bottom)):
+                        if (not isInArray(bottom[i], sortedPositions)):
+                            return bottom[i]
+            else:
+                right = sorted(right, key=lambda e: e[1].boundingBox3D.yMin, reverse=True)
+                for i in range(len(right)):
+                        if (not isInArray(right[i], sortedPositions)):
+                            return right[i]
+        else: # If we are finding the next element on the same side, we must account for several corner cases (listed below)
+            lowestTop = sorted([b for b in top if not isInArray(b, sortedPositions)], key=lambda b: b[1].boundingBox3D.yMin)
+            top = sorted([t for t in top if t[1].boundingBox3D.xMin >= point[1].boundingBox3D.xMin], key=lambda e: e[1].boundingBox3D.xMin)
+            for i in range(len(top)):
+                if (top[i][1].boundingBox3D.xMin == point[1].boundingBox3D.xMin): # sort the windows/doors on the same axis
+                    topY = sorted([t for t in top if t[1].boundingBox3D.xMin == point[1].boundingBox3D.xMin], key=lambda t: t[1].boundingBox3D.yMin)
+                    for x in range(len(topY)):
+                        if (not isInArray(topY[x], sortedPositions)):
+                            for y in range(len(lowestTop)):
+                                if (math.dist(((lowestTop[y][1].boundingBox3D.xMin + lowestTop[y][1].boundingBox3D.xMax)/2, (lowestTop[y][1].boundingBox3D.yMin + lowestTop[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((topY[x][1].boundingBox3D.xMin + topY[x][1].boundingBox3D.xMax)/2, (topY[x][1].boundingBox3D.yMin + topY[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and lowestTop[y][1].boundingBox3D.xMin >= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.xMin):
+                                    return lowestTop[y]
+                            return topY[x]
+                if (not isInArray(top[i], sortedPositions)):
+                    if (point[1].boundingBox3D.yMin > top[i][1].boundingBox3D.yMin): # divet down
+                        topY = sorted([t for t in top if t[1].boundingBox3D.xMin == top[i][1].boundingBox3D.xMin], key=lambda t: t[1].boundingBox3D.yMin, reverse=True)
+                        for x in range(len(topY)):
+                            if (not isInArray(topY[x], sortedPositions)):
+                                for y in range(len(lowestTop)):
+                                    if (math.dist(((lowestTop[y][1].boundingBox3D.xMin + lowestTop[y][1].boundingBox3D.xMax)/2, (lowestTop[y][1].boundingBox3D.yMin + lowestTop[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((topY[x][1].boundingBox3D.xMin + topY[x][1].boundingBox3D.xMax)/2, (topY[x][1].boundingBox3D.yMin + topY[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and lowestTop[y][1].boundingBox3D.xMin >= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.xMin):
+                                        return lowestTop[y]
+                                return topY[x]
+                    elif (point[1].boundingBox3D.yMin < top[i][1].boundingBox3D.yMin): # divet up
+                        topY = sorted([t for t in top if t[1].boundingBox3D.xMin == top[i][1].boundingBox3D.xMin], key=lambda t: t[1].boundingBox3D.yMin)
+                        for x in range(len(topY)):
+                            for y in range(len(lowestTop)):
+                                if (math.dist(((lowestTop[y][1].boundingBox3D.xMin + lowestTop[y][1].boundingBox3D.xMax)/2, (lowestTop[y][1].boundingBox3D.yMin + lowestTop[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((topY[x][1].boundingBox3D.xMin + topY[x][1].boundingBox3D.xMax)/2, (topY[x][1].boundingBox3D.yMin + topY[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and lowestTop[y][1].boundingBox3D.xMin >= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.xMin):
+                                    return lowestTop[y]
+                            if (not isInArray(topY[x], sortedPositions)):
+                                return topY[x]
+                    return top[i]
+
+    elif (side == "Bottom"):
+        # Check if there are any other elements that have not been numbered on the Bottom side, if not move to the left, top, then right and check if they have elements to be numbered
+        if (len([t for t in bottom if t[1].boundingBox3D.xMin <= point[1].boundingBox3D.xMin]) == 0):
+            if (len(left) == 0):
+                if (len(top) == 0):
+                    if (len(right) == 0):
+                        if (len([t for t in bottom if not isInArray(t, sortedPositions)]) == 0):
+                            return "error"
+                        else:
+                            bottom = sorted([t for t in bottom if not isInArray(t, sortedPositions)], key=lambda b: b[1].boundingBox3D.xMin, reverse=True)
+                            return bottom[0]
+                    else:
+                        right = sorted(right, key=lambda e: e[1].boundingBox3D.yMin, reverse=True)
+                        for i in range(len(right)):
+                            if (not isInArray(right[i], sortedPositions)):
+                                return right[i]
+                else:
+                    top = sorted(top, key=lambda e: e[1].boundingBox3D.xMin)
+                    for i in range(len(top)):
+                        if (not isInArray(top[i], sortedPositions)):
+                            return top[i]
+            else:
+                left = sorted(left, key=lambda e: e[1].boundingBox3D.yMin)
+                for i in range(len(left)):
+                    if (not isInArray(left[i], sortedPositions)):
+                        return left[i]
+        else: # If we are finding the next element on the same side, we must account for several corner cases (listed below)
+            lowestBottom = sorted([b for b in bottom if not isInArray(b, sortedPositions)], key=lambda b: b[1].boundingBox3D.yMin, reverse=True)
+            bottom = sorted([t for t in bottom if t[1].boundingBox3D.xMin <= point[1].boundingBox3D.xMin], key=lambda e: e[1].boundingBox3D.xMin, reverse=True)
+            for i in range(len(bottom)):
+                if (bottom[i][1].boundingBox3D.xMin == point[1].boundingBox3D.xMin): # sort the windows/doors on the same axis
+                    bottomY = sorted([b for b in bottom if b[1].boundingBox3D.xMin == point[1].boundingBox3D.xMin], key=lambda b: b[1].boundingBox3D.yMin)
+                    for x in range(len(bottomY)):
+                        if (not isInArray(bottomY[x], sortedPositions)):
+                            for y in range(len(lowestBottom)):
+                                if (math.dist(((lowestBottom[y][1].boundingBox3D.xMin + lowestBottom[y][1].boundingBox3D.xMax)/2, (lowestBottom[y][1].boundingBox3D.yMin + lowestBottom[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((bottomY[x][1].boundingBox3D.xMin + bottomY[x][1].boundingBox3D.xMax)/2, (bottomY[x][1].boundingBox3D.yMin + bottomY[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and lowestBottom[y][1].boundingBox3D.xMin <= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.xMin):
+                                        return lowestBottom[y]
+                            return bottomY[x]
+                if (not isInArray(bottom[i], sortedPositions)):
+                    if (point[1].boundingBox3D.yMin > bottom[i][1].boundingBox3D.yMin): # divet down
+                        bottomY = sorted([t for t in bottom if t[1].boundingBox3D.xMin == bottom[i][1].boundingBox3D.xMin], key=lambda t: t[1].boundingBox3D.yMin, reverse=True)
+                        for x in range(len(bottomY)):
+                            if (not isInArray(bottomY[x], sortedPositions)):
+                                for y in range(len(lowestBottom)):
+                                    if (math.dist(((lowestBottom[y][1].boundingBox3D.xMin + lowestBottom[y][1].boundingBox3D.xMax)/2, (lowestBottom[y][1].boundingBox3D.yMin + lowestBottom[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((bottomY[x][1].boundingBox3D.xMin + bottomY[x][1].boundingBox3D.xMax)/2, (bottomY[x][1].boundingBox3D.yMin + bottomY[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and lowestBottom[y][1].boundingBox3D.xMin <= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.xMin):
+                                        return lowestBottom[y]
+                                return bottomY[x]
+                    elif (point[1].boundingBox3D.yMin < bottom[i][1].boundingBox3D.yMin): # divet up
+                        bottomY = sorted([t for t in bottom if t[1].boundingBox3D.xMin == bottom[i][1].boundingBox3D.xMin], key=lambda t: t[1].boundingBox3D.yMin)
+                        for x in range(len(bottomY)):
+                            if (not isInArray(bottomY[x], sortedPositions)):
+                                for y in range(len(lowestBottom)):
+                                    if (math.dist(((lowestBottom[y][1].boundingBox3D.xMin + lowestBottom[y][1].boundingBox3D.xMax)/2, (lowestBottom[y][1].boundingBox3D.yMin + lowestBottom[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((bottomY[x][1].boundingBox3D.xMin + bottomY[x][1].boundingBox3D.xMax)/2, (bottomY[x][1].boundingBox3D.yMin + bottomY[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and lowestBottom[y][1].boundingBox3D.xMin <= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.xMin):
+                                        return lowestBottom[y]
+                                return bottomY[x]
+                    return bottom[i]
+
+    elif (side == "Left"):
+        # Check if there are any other elements that have not been numbered on the Left side, if not move to the top, right, then bottom and check if they have elements to be numbered
+        if (len([t for t in left if t[1].boundingBox3D.yMin >= point[1].boundingBox3D.yMin]) == 0):
+            if (len(top) == 0):
+                if (len(right) == 0):
+                    if (len(bottom) == 0):
+                        if (len([t for t in left if not isInArray(t, sortedPositions)]) == 0):
+                            return "error"
+                        else:
+                            left = sorted([t for t in left if not isInArray(t, sortedPositions)], key=lambda b: b[1].boundingBox3D.yMin)
+                            return left[0]
+                    else:
+                        bottom = sorted(bottom, key=lambda e: e[1].boundingBox3D.xMin, reverse=True)
+                        for i in range(len(bottom)):
+                            if (not isInArray(bottom[i], sortedPositions)):
+                                return bottom[i]
+                else:
+                    right = sorted(right, key=lambda e: e[1].boundingBox3D.yMin, reverse=True)
+                    for i in range(len(right)):
+                            if (not isInArray(right[i], sortedPositions)):
+                                return right[i]
+            else:
+                top = sorted(top, key=lambda e: e[1].boundingBox3D.xMin)
+                for i in range(len(top)):
+                        if (not isInArray(top[i], sortedPositions)):
+                            return top[i]
+        else: # If we are finding the next element on the same side, we must account for several corner cases (listed below)
+            lowestLeft = sorted([b for b in left if not isInArray(b, sortedPositions)], key=lambda b: b[1].boundingBox3D.xMin, reverse=True)
+            left = sorted([t for t in left if t[1].boundingBox3D.yMin >= point[1].boundingBox3D.yMin], key=lambda e: e[1].boundingBox3D.yMin)
+            for i in range(len(left)):
+                if (left[i][1].boundingBox3D.yMin == point[1].boundingBox3D.yMin): # sort the windows/doors on the same axis
+                    leftX = sorted([l for l in left if l[1].boundingBox3D.yMin == point[1].boundingBox3D.yMin], key=lambda b: b[1].boundingBox3D.xMin)
+                    for x in range(len(leftX)):
+                        if (not isInArray(leftX[x], sortedPositions)):
+                            for y in range(len(lowestLeft)):
+                                if (math.dist(((lowestLeft[y][1].boundingBox3D.xMin + lowestLeft[y][1].boundingBox3D.xMax)/2, (lowestLeft[y][1].boundingBox3D.yMin + lowestLeft[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((leftX[x][1].boundingBox3D.xMin + leftX[x][1].boundingBox3D.xMax)/2, (leftX[x][1].boundingBox3D.yMin + leftX[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and lowestLeft[y][1].boundingBox3D.yMin >= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.yMin):
+                                        return lowestLeft[y]
+                            return leftX[x]
+                if (not isInArray(left[i], sortedPositions)):
+                    if (point[1].boundingBox3D.xMin > left[i][1].boundingBox3D.xMin): # divet left
+                        leftX = sorted([t for t in left if t[1].boundingBox3D.yMin == left[i][1].boundingBox3D.yMin], key=lambda t: t[1].boundingBox3D.xMin, reverse=True)
+                        for x in range(len(leftX)):
+                            if (not isInArray(leftX[x], sortedPositions)):
+                                for y in range(len(lowestLeft)):
+                                    if (math.dist(((lowestLeft[y][1].boundingBox3D.xMin + lowestLeft[y][1].boundingBox3D.xMax)/2, (lowestLeft[y][1].boundingBox3D.yMin + lowestLeft[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((leftX[x][1].boundingBox3D.xMin + leftX[x][1].boundingBox3D.xMax)/2, (leftX[x][1].boundingBox3D.yMin + leftX[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and lowestLeft[y][1].boundingBox3D.yMin >= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.yMin):
+                                        return lowestLeft[y]
+                                return leftX[x]
+                    elif (point[1].boundingBox3D.xMin < left[i][1].boundingBox3D.xMin): # divet right 
+                        leftX = sorted([t for t in left if t[1].boundingBox3D.yMin == left[i][1].boundingBox3D.yMin], key=lambda t: t[1].boundingBox3D.xMin)
+                        for x in range(len(leftX)):
+                            for y in range(len(lowestLeft)):
+                                if (math.dist(((lowestLeft[y][1].boundingBox3D.xMin + lowestLeft[y][1].boundingBox3D.xMax)/2, (lowestLeft[y][1].boundingBox3D.yMin + lowestLeft[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((leftX[x][1].boundingBox3D.xMin + leftX[x][1].boundingBox3D.xMax)/2, (leftX[x][1].boundingBox3D.yMin + leftX[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and lowestLeft[y][1].boundingBox3D.yMin >= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.yMin):
+                                    return lowestLeft[y]
+                            return leftX[x]
+                    return left[i]
+
+    elif (side == "Right"):
+        # Check if there are any other elements that have not been numbered on the Right side, if not move to the bottom, left, then top and check if they have elements to be numbered
+        if (len([t for t in right if t[1].boundingBox3D.yMin <= point[1].boundingBox3D.yMin]) == 0):
+            if (len(bottom) == 0):
+                if (len(left) == 0):
+                    if (len(top) == 0):
+                        if (len([t for t in right if not isInArray(t, sortedPositions)]) == 0):
+                            return "error"
+                        else:
+                            right = sorted([t for t in right if not isInArray(t, sortedPositions)], key=lambda b: b[1].boundingBox3D.yMin, reverse=True)
+                            return right[0]
+                    else:
+                        top = sorted(top, key=lambda e: e[1].boundingBox3D.xMin)
+                        for i in range(len(top)):
+                            if (not isInArray(top[i], sortedPositions)):
+                                return top[i]
+                else:
+                    left = sorted(left, key=lambda e: e[1].boundingBox3D.yMin)
+                    for i in range(len(left)):
+                        if (not isInArray(left[i], sortedPositions)):
+                            return left[i]
+            else:
+                bottom = sorted(bottom, key=lambda e: e[1].boundingBox3D.xMin, reverse=True)
+                for i in range(len(bottom)):
+                        if (not isInArray(bottom[i], sortedPositions)):
+                            return bottom[i]
+        else: # If we are finding the next element on the same side, we must account for several corner cases (listed below)
+            leftestRight = sorted([r for r in right if not isInArray(r, sortedPositions)], key=lambda e: e[1].boundingBox3D.xMin)
+            right = sorted([t for t in right if t[1].boundingBox3D.yMin <= point[1].boundingBox3D.yMin], key=lambda e: e[1].boundingBox3D.yMin, reverse=True)
+            for i in range(len(right)):
+                if (right[i][1].boundingBox3D.yMin == point[1].boundingBox3D.yMin): # sort the windows/doors on the same axis
+                    rightX = sorted([r for r in right if r[1].boundingBox3D.yMin == point[1].boundingBox3D.yMin], key=lambda b: b[1].boundingBox3D.xMin, reverse=True)
+                    for x in range(len(rightX)):
+                        if (not isInArray(rightX[x], sortedPositions)):
+                            for y in range(len(leftestRight)):
+                                if (math.dist(((leftestRight[y][1].boundingBox3D.xMin + leftestRight[y][1].boundingBox3D.xMax)/2, (leftestRight[y][1].boundingBox3D.yMin + leftestRight[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((rightX[x][1].boundingBox3D.xMin + rightX[x][1].boundingBox3D.xMax)/2, (rightX[x][1].boundingBox3D.yMin + rightX[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and leftestRight[y][1].boundingBox3D.yMin <= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.yMin):
+                                    return leftestRight[y]
+                            return rightX[x]
+                if (not isInArray(right[i], sortedPositions)):
+                    if (point[1].boundingBox3D.xMin > right[i][1].boundingBox3D.xMin): # divet left
+                        rightX = sorted([r for r in right if r[1].boundingBox3D.yMin == right[i][1].boundingBox3D.yMin], key=lambda t: t[1].boundingBox3D.xMin, reverse=True)
+                        for x in range(len(rightX)):
+                            if (not isInArray(rightX[x], sortedPositions)):
+                                for y in range(len(leftestRight)):
+                                    if (math.dist(((leftestRight[y][1].boundingBox3D.xMin + leftestRight[y][1].boundingBox3D.xMax)/2, (leftestRight[y][1].boundingBox3D.yMin + leftestRight[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((rightX[x][1].boundingBox3D.xMin + rightX[x][1].boundingBox3D.xMax)/2, (rightX[x][1].boundingBox3D.yMin + rightX[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and leftestRight[y][1].boundingBox3D.yMin <= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.yMin):
+                                        return leftestRight[y]
+                                return rightX[x]
+                    elif (point[1].boundingBox3D.xMin < right[i][1].boundingBox3D.xMin): # divet right
+                        rightX = sorted([r for r in right if r[1].boundingBox3D.yMin == right[i][1].boundingBox3D.yMin], key=lambda t: t[1].boundingBox3D.xMin)
+                        for x in range(len(rightX)):
+                            if (not isInArray(rightX[x], sortedPositions)):
+                                for y in range(len(leftestRight)):
+                                    if (math.dist(((leftestRight[y][1].boundingBox3D.xMin + leftestRight[y][1].boundingBox3D.xMax)/2, (leftestRight[y][1].boundingBox3D.yMin + leftestRight[y][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) <= math.dist(((rightX[x][1].boundingBox3D.xMin + rightX[x][1].boundingBox3D.xMax)/2, (rightX[x][1].boundingBox3D.yMin + rightX[x][1].boundingBox3D.yMax)/2), ((point[1].boundingBox3D.xMin + point[1].boundingBox3D.xMax)/2, (point[1].boundingBox3D.yMin + point[1].boundingBox3D.yMax)/2)) and leftestRight[y][1].boundingBox3D.yMin <= sortedPositions[len(sortedPositions)-2][1].boundingBox3D.yMin):
+                                        return leftestRight[y]
+                                return rightX[x]
+                    return right[i]
+
+    # Return an error if we do not find a next-closest element (we should never get here)
+    return "error"
+
+
+def isInArray(element: Element, sortedPositions: List[Element]):
+    # Function: checks if the element has already been numbered
+    for i in range(len(sortedPositions)):
+        if (sortedPositions[i][0].elementId.guid == element[0].elementId.guid):
+            return True
+    return False
+
+
+#############################################################################################################################################################################################
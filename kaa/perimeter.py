@@ -0,0 +1,347 @@
+######################################### General Info #########################################
+# Written by: Jessica Wood  w/ Meghan Beckmann, for KAA Design Group                           #
+# Date Created: 09/2022                                                                        #
+# Date Modified: 10/2026    records version of the exterior walk in kaa/ordering.py            #
+#                                                                                              #
+# Description:                                                                                 #
+# Clockwise walk around the perimeter for exterior doors/windows, working on ElementRecords   #
+# (kaa/records.py). Same decisions as sortPositions/determineClosestPoint in kaa/ordering.py, #
+# with record fields instead of e[1].boundingBox3D lookups, the exterior side stored on the    #
+# record, and a set of numbered GUIDs instead of scanning the sorted list for every check.     #
+################################################################################################
+
+
+import math
+from typing import List, Optional, Set, Tuple
+
+from kaa.records import ElementRecord
+
+
+
+
+########################################################################################## FUNCTIONS #############################################################################################
+
+class PerimeterWalkError(ValueError):
+    # Raised when the walk finds no next door/window (the legacy walk printed "error!" and crashed)
+    pass
+
+
+def walkPerimeter(entryElement: ElementRecord, minMaxVals: Tuple[float, float], elements: List[ElementRecord]) -> List[ElementRecord]:
+    # Function: takes all Doors/Windows on the current story and the entry Door/Window and returns them sorted clockwise around the perimeter starting with the entry Door/Window
+
+    # If there is only one Door/Window return
+    if (len(elements) == 1):
+        return [elements[0]]
+
+    # create Z-midpoint
+    midpointZ = (minMaxVals[1] + minMaxVals[0])/2
+
+    # sort positions by midpoint
+    bottomRow = [e for e in elements if e.zMin <= midpointZ]
+    topRow = [e for e in elements if e.zMin > midpointZ]
+
+    # first numbered element will be entry door/window
+    sortedPositions = [entryElement]
+    numbered = {entryElement.guid}
+
+    def append(nextPos: Optional[ElementRecord]) -> ElementRecord:
+        if (nextPos is None):
+            raise PerimeterWalkError(f"No next Door/Window found after {sortedPositions[-1].guid} ({sortedPositions[-1].side}). Check the ExteriorSide values on this story.")
+        sortedPositions.append(nextPos)
+        numbered.add(nextPos.guid)
+        return nextPos
+
+    # loop through bottom row first
+    currentPos = entryElement
+    for i in range(len(bottomRow)-1):
+        # find the next closest door/window (from the side the element is on)
+        currentPos = append(nextOnPerimeter(currentPos, bottomRow, currentPos.side, sortedPositions, numbered))
+
+    # If there are no doors/windows in the top row, skip the top row iteration
+    if (len(topRow) == 0):
+        return sortedPositions
+
+    # set up current pos for top row
+    currentPos = append(nextOnPerimeter(entryElement, topRow, entryElement.side, sortedPositions, numbered))
+
+    # loop through top row
+    for i in range(len(topRow)-1):
+        currentPos = append(nextOnPerimeter(currentPos, topRow, currentPos.side, sortedPositions, numbered))
+
+    return sortedPositions
+
+
+
+
+def nextOnPerimeter(point: ElementRecord, positions: List[ElementRecord], side: str, sortedPositions: List[ElementRecord], numbered: Set[str]) -> Optional[ElementRecord]:
+    # Function: Returns the next closest door/window of the given door/window (numbered holds the GUIDs of sortedPositions)
+
+    # sort objects by the side in which they belong
+    top = []
+    bottom = []
+    left = []
+    right = []
+    for i in range(len(positions)):
+        if (positions[i].side == "Top"):
+            if (positions[i].guid != point.guid):
+                if (side == positions[i].side):
+                    if (positions[i].guid not in numbered): 
+                        top.append(positions[i])
+                else:
+                    top.append(positions[i])
+        if (positions[i].side == "Bottom"):
+            if (positions[i].guid != point.guid):
+                if (side == positions[i].side):
+                    if (positions[i].guid not in numbered): 
+                        bottom.append(positions[i])
+                else:
+                    bottom.append(positions[i])
+        if (positions[i].side == "Right"):
+            if (positions[i].guid != point.guid):
+                if (side == positions[i].side):
+                    if (positions[i].guid not in numbered): 
+                        right.append(positions[i])
+                else:
+                    right.append(positions[i])
+        if (positions[i].side == "Left"):
+            if (positions[i].guid != point.guid):
+                if (side == positions[i].side):
+                    if (positions[i].guid not in numbered): 
+                        left.append(positions[i])
+                else:
+                    left.append(positions[i])
+
+
+    # Find which side the current Door/Window belongs to
+    if (side == 'Top'): 
+        # Check if there are any other elements that have not been numbered on the Top side, if not move to the right, bottom, then left and check if they have elements to be numbered
+        if (len([t for t in top if t.xMin >= point.xMin]) == 0): 
+            if (len(right) == 0):
+                if (len(bottom) == 0):
+                    if (len(left) == 0):
+                        if (len([t for t in top if t.guid not in numbered]) == 0):
+                            return None
+                        else:
+                            top = sorted([t for t in top if t.guid not in numbered], key=lambda b: b.xMin)
+                            return top[0]
+                    else:
+                        left = sorted(left, key=lambda e: e.yMin)
+                        for i in range(len(left)):
+                            if (left[i].guid not in numbered):
+                                return left[i]
+                else:
+                    bottom = sorted(bottom, key=lambda e: e.xMin, reverse=True)
+                    for i in range(len(bottom)):
+                        if (bottom[i].guid not in numbered):
+                            return bottom[i]
+            else:
+                right = sorted(right, key=lambda e: e.yMin, reverse=True)
+                for i in range(len(right)):
+                        if (right[i].guid not in numbered):
+                            return right[i]
+        else: # If we are finding the next element on the same side, we must account for several corner cases (listed below)
+            lowestTop = sorted([b for b in top if b.guid not in numbered], key=lambda b: b.yMin)
+            top = sorted([t for t in top if t.xMin >= point.xMin], key=lambda e: e.xMin)
+            for i in range(len(top)):
+                if (top[i].xMin == point.xMin): # sort the windows/doors on the same axis
+                    topY = sorted([t for t in top if t.xMin == point.xMin], key=lambda t: t.yMin)
+                    for x in range(len(topY)):
+                        if (topY[x].guid not in numbered):
+                            for y in range(len(lowestTop)):
+                                if (math.dist(((lowestTop[y].xMin + lowestTop[y].xMax)/2, (lowestTop[y].yMin + lowestTop[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((topY[x].xMin + topY[x].xMax)/2, (topY[x].yMin + topY[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and lowestTop[y].xMin >= sortedPositions[len(sortedPositions)-2].xMin):
+                                    return lowestTop[y]
+                            return topY[x]
+                if (top[i].guid not in numbered):
+                    if (point.yMin > top[i].yMin): # divet down
+                        topY = sorted([t for t in top if t.xMin == top[i].xMin], key=lambda t: t.yMin, reverse=True)
+                        for x in range(len(topY)):
+                            if (topY[x].guid not in numbered):
+                                for y in range(len(lowestTop)):
+                                    if (math.dist(((lowestTop[y].xMin + lowestTop[y].xMax)/2, (lowestTop[y].yMin + lowestTop[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((topY[x].xMin + topY[x].xMax)/2, (topY[x].yMin + topY[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and lowestTop[y].xMin >= sortedPositions[len(sortedPositions)-2].xMin):
+                                        return lowestTop[y]
+                                return topY[x]
+                    elif (point.yMin < top[i].yMin): # divet up
+                        topY = sorted([t for t in top if t.xMin == top[i].xMin], key=lambda t: t.yMin)
+                        for x in range(len(topY)):
+                            for y in range(len(lowestTop)):
+                                if (math.dist(((lowestTop[y].xMin + lowestTop[y].xMax)/2, (lowestTop[y].yMin + lowestTop[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((topY[x].xMin + topY[x].xMax)/2, (topY[x].yMin + topY[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and lowestTop[y].xMin >= sortedPositions[len(sortedPositions)-2].xMin):
+                                    return lowestTop[y]
+                            if (topY[x].guid not in numbered):
+                                return topY[x]
+                    return top[i]
+
+    elif (side == "Bottom"):
+        # Check if there are any other elements that have not been numbered on the Bottom side, if not move to the left, top, then right and check if they have elements to be numbered
+        if (len([t for t in bottom if t.xMin <= point.xMin]) == 0):
+            if (len(left) == 0):
+                if (len(top) == 0):
+                    if (len(right) == 0):
+                        if (len([t for t in bottom if t.guid not in numbered]) == 0):
+                            return None
+                        else:
+                            bottom = sorted([t for t in bottom if t.guid not in numbered], key=lambda b: b.xMin, reverse=True)
+                            return bottom[0]
+                    else:
+                        right = sorted(right, key=lambda e: e.yMin, reverse=True)
+                        for i in range(len(right)):
+                            if (right[i].guid not in numbered):
+                                return right[i]
+                else:
+                    top = sorted(top, key=lambda e: e.xMin)
+                    for i in range(len(top)):
+                        if (top[i].guid not in numbered):
+                            return top[i]
+            else:
+                left = sorted(left, key=lambda e: e.yMin)
+                for i in range(len(left)):
+                    if (left[i].guid not in numbered):
+                        return left[i]
+        else: # If we are finding the next element on the same side, we must account for several corner cases (listed below)
+            lowestBottom = sorted([b for b in bottom if b.guid not in numbered], key=lambda b: b.yMin, reverse=True)
+            bottom = sorted([t for t in bottom if t.xMin <= point.xMin], key=lambda e: e.xMin, reverse=True)
+            for i in range(len(bottom)):
+                if (bottom[i].xMin == point.xMin): # sort the windows/doors on the same axis
+                    bottomY = sorted([b for b in bottom if b.xMin == point.xMin], key=lambda b: b.yMin)
+                    for x in range(len(bottomY)):
+                        if (bottomY[x].guid not in numbered):
+                            for y in range(len(lowestBottom)):
+                                if (math.dist(((lowestBottom[y].xMin + lowestBottom[y].xMax)/2, (lowestBottom[y].yMin + lowestBottom[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((bottomY[x].xMin + bottomY[x].xMax)/2, (bottomY[x].yMin + bottomY[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and lowestBottom[y].xMin <= sortedPositions[len(sortedPositions)-2].xMin):
+                                        return lowestBottom[y]
+                            return bottomY[x]
+                if (bottom[i].guid not in numbered):
+                    if (point.yMin > bottom[i].yMin): # divet down
+                        bottomY = sorted([t for t in bottom if t.xMin == bottom[i].xMin], key=lambda t: t.yMin, reverse=True)
+                        for x in range(len(bottomY)):
+                            if (bottomY[x].guid not in numbered):
+                                for y in range(len(lowestBottom)):
+                                    if (math.dist(((lowestBottom[y].xMin + lowestBottom[y].xMax)/2, (lowestBottom[y].yMin + lowestBottom[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((bottomY[x].xMin + bottomY[x].xMax)/2, (bottomY[x].yMin + bottomY[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and lowestBottom[y].xMin <= sortedPositions[len(sortedPositions)-2].xMin):
+                                        return lowestBottom[y]
+                                return bottomY[x]
+                    elif (point.yMin < bottom[i].yMin): # divet up
+                        bottomY = sorted([t for t in bottom if t.xMin == bottom[i].xMin], key=lambda t: t.yMin)
+                        for x in range(len(bottomY)):
+                            if (bottomY[x].guid not in numbered):
+                                for y in range(len(lowestBottom)):
+                                    if (math.dist(((lowestBottom[y].xMin + lowestBottom[y].xMax)/2, (lowestBottom[y].yMin + lowestBottom[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((bottomY[x].xMin + bottomY[x].xMax)/2, (bottomY[x].yMin + bottomY[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and lowestBottom[y].xMin <= sortedPositions[len(sortedPositions)-2].xMin):
+                                        return lowestBottom[y]
+                                return bottomY[x]
+                    return bottom[i]
+
+    elif (side == "Left"):
+        # Check if there are any other elements that have not been numbered on the Left side, if not move to the top, right, then bottom and check if they have elements to be numbered
+        if (len([t for t in left if t.yMin >= point.yMin]) == 0):
+            if (len(top) == 0):
+                if (len(right) == 0):
+                    if (len(bottom) == 0):
+                        if (len([t for t in left if t.guid not in numbered]) == 0):
+                            return None
+                        else:
+                            left = sorted([t for t in left if t.guid not in numbered], key=lambda b: b.yMin)
+                            return left[0]
+                    else:
+                        bottom = sorted(bottom, key=lambda e: e.xMin, reverse=True)
+                        for i in range(len(bottom)):
+                            if (bottom[i].guid not in numbered):
+                                return bottom[i]
+                else:
+                    right = sorted(right, key=lambda e: e.yMin, reverse=True)
+                    for i in range(len(right)):
+                            if (right[i].guid not in numbered):
+                                return right[i]
+            else:
+                top = sorted(top, key=lambda e: e.xMin)
+                for i in range(len(top)):
+                        if (top[i].guid not in numbered):
+                            return top[i]
+        else: # If we are finding the next element on the same side, we must account for several corner cases (listed below)
+            lowestLeft = sorted([b for b in left if b.guid not in numbered], key=lambda b: b.xMin, reverse=True)
+            left = sorted([t for t in left if t.yMin >= point.yMin], key=lambda e: e.yMin)
+            for i in range(len(left)):
+                if (left[i].yMin == point.yMin): # sort the windows/doors on the same axis
+                    leftX = sorted([l for l in left if l.yMin == point.yMin], key=lambda b: b.xMin)
+                    for x in range(len(leftX)):
+                        if (leftX[x].guid not in numbered):
+                            for y in range(len(lowestLeft)):
+                                if (math.dist(((lowestLeft[y].xMin + lowestLeft[y].xMax)/2, (lowestLeft[y].yMin + lowestLeft[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((leftX[x].xMin + leftX[x].xMax)/2, (leftX[x].yMin + leftX[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and lowestLeft[y].yMin >= sortedPositions[len(sortedPositions)-2].yMin):
+                                        return lowestLeft[y]
+                            return leftX[x]
+                if (left[i].guid not in numbered):
+                    if (point.xMin > left[i].xMin): # divet left
+                        leftX = sorted([t for t in left if t.yMin == left[i].yMin], key=lambda t: t.xMin, reverse=True)
+                        for x in range(len(leftX)):
+                            if (leftX[x].guid not in numbered):
+                                for y in range(len(lowestLeft)):
+                                    if (math.dist(((lowestLeft[y].xMin + lowestLeft[y].xMax)/2, (lowestLeft[y].yMin + lowestLeft[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((leftX[x].xMin + leftX[x].xMax)/2, (leftX[x].yMin + leftX[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and lowestLeft[y].yMin >= sortedPositions[len(sortedPositions)-2].yMin):
+                                        return lowestLeft[y]
+                                return leftX[x]
+                    elif (point.xMin < left[i].xMin): # divet right 
+                        leftX = sorted([t for t in left if t.yMin == left[i].yMin], key=lambda t: t.xMin)
+                        for x in range(len(leftX)):
+                            for y in range(len(lowestLeft)):
+                                if (math.dist(((lowestLeft[y].xMin + lowestLeft[y].xMax)/2, (lowestLeft[y].yMin + lowestLeft[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((leftX[x].xMin + leftX[x].xMax)/2, (leftX[x].yMin + leftX[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and lowestLeft[y].yMin >= sortedPositions[len(sortedPositions)-2].yMin):
+                                    return lowestLeft[y]
+                            return leftX[x]
+                    return left[i]
+
+    elif (side == "Right"):
+        # Check if there are any other elements that have not been numbered on the Right side, if not move to the bottom, left, then top and check if they have elements to be numbered
+        if (len([t for t in right if t.yMin <= point.yMin]) == 0):
+            if (len(bottom) == 0):
+                if (len(left) == 0):
+                    if (len(top) == 0):
+                        if (len([t for t in right if t.guid not in numbered]) == 0):
+                            return None
+                        else:
+                            right = sorted([t for t in right if t.guid not in numbered], key=lambda b: b.yMin, reverse=True)
+                            return right[0]
+                    else:
+                        top = sorted(top, key=lambda e: e.xMin)
+                        for i in range(len(top)):
+                            if (top[i].guid not in numbered):
+                                return top[i]
+                else:
+                    left = sorted(left, key=lambda e: e.yMin)
+                    for i in range(len(left)):
+                        if (left[i].guid not in numbered):
+                            return left[i]
+            else:
+                bottom = sorted(bottom, key=lambda e: e.xMin, reverse=True)
+                for i in range(len(bottom)):
+                        if (bottom[i].guid not in numbered):
+                            return bottom[i]
+        else: # If we are finding the next element on the same side, we must account for several corner cases (listed below)
+            leftestRight = sorted([r for r in right if r.guid not in numbered], key=lambda e: e.xMin)
+            right = sorted([t for t in right if t.yMin <= point.yMin], key=lambda e: e.yMin, reverse=True)
+            for i in range(len(right)):
+                if (right[i].yMin == point.yMin): # sort the windows/doors on the same axis
+                    rightX = sorted([r for r in right if r.yMin == point.yMin], key=lambda b: b.xMin, reverse=True)
+                    for x in range(len(rightX)):
+                        if (rightX[x].guid not in numbered):
+                            for y in range(len(leftestRight)):
+                                if (math.dist(((leftestRight[y].xMin + leftestRight[y].xMax)/2, (leftestRight[y].yMin + leftestRight[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((rightX[x].xMin + rightX[x].xMax)/2, (rightX[x].yMin + rightX[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and leftestRight[y].yMin <= sortedPositions[len(sortedPositions)-2].yMin):
+                                    return leftestRight[y]
+                            return rightX[x]
+                if (right[i].guid not in numbered):
+                    if (point.xMin > right[i].xMin): # divet left
+                        rightX = sorted([r for r in right if r.yMin == right[i].yMin], key=lambda t: t.xMin, reverse=True)
+                        for x in range(len(rightX)):
+                            if (rightX[x].guid not in numbered):
+                                for y in range(len(leftestRight)):
+                                    if (math.dist(((leftestRight[y].xMin + leftestRight[y].xMax)/2, (leftestRight[y].yMin + leftestRight[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((rightX[x].xMin + rightX[x].xMax)/2, (rightX[x].yMin + rightX[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and leftestRight[y].yMin <= sortedPositions[len(sortedPositions)-2].yMin):
+                                        return leftestRight[y]
+                                return rightX[x]
+                    elif (point.xMin < right[i].xMin): # divet right
+                        rightX = sorted([r for r in right if r.yMin == right[i].yMin], key=lambda t: t.xMin)
+                        for x in range(len(rightX)):
+                            if (rightX[x].guid not in numbered):
+                                for y in range(len(leftestRight)):
+                                    if (math.dist(((leftestRight[y].xMin + leftestRight[y].xMax)/2, (leftestRight[y].yMin + leftestRight[y].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) <= math.dist(((rightX[x].xMin + rightX[x].xMax)/2, (rightX[x].yMin + rightX[x].yMax)/2), ((point.xMin + point.xMax)/2, (point.yMin + point.yMax)/2)) and leftestRight[y].yMin <= sortedPositions[len(sortedPositions)-2].yMin):
+                                        return leftestRight[y]
+                                return rightX[x]
+                    return right[i]
+
+    # Return None if we do not find a next-closest element (we should never get here)
+    return None
+
+
+#############################################################################################################################################################################################
@@ -0,0 +1,387 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Element queries. A query names where the elements come from (classification items, element  #
+# types, the selection), the properties it needs as named columns, filters on those columns    #
+# and the columns to group by. The planner turns it into the fewest requests, sent in three    #
+# concurrent rounds:                                                                           #
+#   1. one GetPropertyIds for every property, one classification tree per system, selection    #
+#   2. one element list per classification item / element type (skipped if the selection is  #
+#      used)                                                                                   #
+#   3. one GetPropertyValuesOfElements for all properties of all candidates (+ bounding boxes)  #
+# Round 3 goes through kaa/fastpath.py: its responses are decoded straight into the column     #
+# arrays and an n x 6 (n x 4 for 2D) box array, without the archicad package's typed objects.  #
+# Queries run together with runQueries() share one BatchLoader (kaa/loader.py), which sends    #
+# their round 3 requests of one kind as a single command.                                      #
+# Filters are evaluated on NumPy column arrays, so no per-element Python loop is written by    #
+# the scripts.                                                                                 #
+#                                                                                              #
+#   query = (Query().classified("KAA CLASSIFICATIONS", "Door", "Window").preferSelection()     #
+#            .column("position", BuiltIn("Category_Position"))                                 #
+#            .column("story", UserDefined("KAA Python", "StoryNumber"))                        #
+#            .where("position", "==", "Exterior").groupBy("story"))                            #
+#   result = query.run(conn)        # print(query.explain()) shows the requests                #
+################################################################################################
+
+
+import asyncio
+import math
+import operator
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from kaa.aio import AsyncConnection
+from kaa.loader import BatchLoader
+from kaa.records import FIRST_DOOR, FIRST_WINDOW, NO_BOX, ElementRecord
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+KAA_CLASSIFICATIONS = "KAA CLASSIFICATIONS"
+KAA_PROPERTY_GROUP = "KAA Python"
+
+# selection modes
+IGNORE_SELECTION = "ignore"     # always the sources
+PREFER_SELECTION = "prefer"     # the selected elements if anything is selected, else the sources (what the scripts do)
+WITHIN_SELECTION = "within"     # the sources that are also selected (all sources if nothing is selected)
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda value, values: value in values,
+    "not in": lambda value, values: value not in values,
+}
+
+# columns with these names fill the matching ElementRecord fields in QueryResult.records()
+RECORD_FLAGS = {"firstDoor": FIRST_DOOR, "firstWindow": FIRST_WINDOW}
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class BuiltIn(NamedTuple):
+    name: str                     # non-localized name, e.g. "Category_Position"
+
+
+class UserDefined(NamedTuple):
+    group: str
+    name: str
+
+
+Property = Union[BuiltIn, UserDefined]
+
+
+# the properties the KAA scripts use, by the column name they are fetched as (see Query.withColumns)
+KAA_PROPERTIES = {
+    "elementId": BuiltIn("General_ElementID"),
+    "position": BuiltIn("Category_Position"),
+    "relatedZone": BuiltIn("General_RelatedZoneNumber"),
+    "zoneNumber": BuiltIn("Zone_ZoneNumber"),
+    "story": UserDefined(KAA_PROPERTY_GROUP, "StoryNumber"),
+    "building": UserDefined(KAA_PROPERTY_GROUP, "BuildingNumber"),
+    "side": UserDefined(KAA_PROPERTY_GROUP, "ExteriorSide"),
+    "firstDoor": UserDefined(KAA_PROPERTY_GROUP, "First_Door"),
+    "firstWindow": UserDefined(KAA_PROPERTY_GROUP, "First_Window"),
+    "firstZone": UserDefined(KAA_PROPERTY_GROUP, "First_Zone"),
+    "zoneAngle": UserDefined(KAA_PROPERTY_GROUP, "ZoneAngle"),
+    "zoneDimension": UserDefined(KAA_PROPERTY_GROUP, "ZoneDimension"),
+}
+
+
+class Predicate(NamedTuple):
+    column: str
+    op: str
+    value: Any
+
+
+class QueryPlan(NamedTuple):
+    properties: List[Property]                      # resolved in one GetPropertyIds call
+    columns: List[str]                              # fetched for every candidate in one GetPropertyValuesOfElements call
+    classificationSystems: Dict[str, List[str]]     # system -> item ids, one tree read per system
+    elementTypes: List[str]
+    selection: str
+    boundingBoxes: Optional[str]                    # "3D", "2D" or None
+    predicates: List[Predicate]
+
+    def rounds(self) -> List[List[str]]:
+        # Function: the requests of every round (requests in one round are sent concurrently)
+        first = []
+        if (self.properties):
+            first.append(f"GetPropertyIds ({len(self.properties)} properties)")
+        for (system, items) in self.classificationSystems.items():
+            first.append(f"GetAllClassificationSystems + GetAllClassificationsInSystem '{system}' ({', '.join(items)})")
+        if (self.selection != IGNORE_SELECTION):
+            first.append("GetSelectedElements")
+        second = [f"GetElementsByClassification '{item}'" for items in self.classificationSystems.values() for item in items]
+        second += [f"GetElementsByType '{elementType}'" for elementType in self.elementTypes]
+        if (self.selection == PREFER_SELECTION):
+            second = [f"{request} (only if nothing is selected)" for request in second]
+        third = []
+        if (self.columns):
+            third.append(f"GetPropertyValuesOfElements ({', '.join(self.columns)})")
+        if (self.boundingBoxes):
+            third.append(f"Get{self.boundingBoxes}BoundingBoxes")
+        return [r for r in (first, second, third) if r]
+
+
+class QueryResult:
+    # Class: the elements that passed the filters, with their columns (NumPy arrays in element order), bounding boxes
+    # (n x 6 xMin, yMin, zMin, xMax, yMax, zMax or n x 4 xMin, yMin, xMax, yMax for 2D; NaN rows without a box) and groups
+
+    def __init__(self, elements: List[Any], columns: Dict[str, np.ndarray], boxes: Optional[np.ndarray], propertyIds: Dict[str, Any], groupKeys: Sequence[str]):
+        self.elements = elements
+        self.columns = columns
+        self.boxes = boxes
+        self.propertyIds = propertyIds      # column (or resolve) name -> PropertyId, for writing back
+        self.groupKeys = list(groupKeys)
+
+    def __len__(self) -> int:
+        return len(self.elements)
+
+    def guids(self) -> List[str]:
+        return [str(e.elementId.guid) for e in self.elements]
+
+    def groups(self) -> Dict[Tuple[Any, ...], np.ndarray]:
+        # Function: row indices per value combination of the groupBy columns, keys in ascending order (None last)
+        if (not self.groupKeys):
+            return {(): np.arange(len(self.elements))}
+        rowsByKey = {}
+        for (row, key) in enumerate(zip(*[self.columns[key].tolist() for key in self.groupKeys])):
+            rowsByKey.setdefault(key, []).append(row)
+        order = sorted(rowsByKey, key=lambda k: tuple((v is None, v if v is not None else 0) for v in k))
+        return {key: np.array(rowsByKey[key]) for key in order}
+
+    def records(self) -> List[ElementRecord]:
+        # Function: one ElementRecord per element; columns named like record fields (story, building, side, position,
+        # firstDoor, firstWindow) fill them, and the bounding boxes fill the coordinates
+        boxes = self.boxes.tolist() if (self.boxes is not None and self.boxes.shape[1] == 6) else None
+        columns = [(name, column.tolist()) for (name, column) in self.columns.items() if name in RECORD_FLAGS or name in ElementRecord.__slots__]
+        records = []
+        for (row, element) in enumerate(self.elements):
+            record = ElementRecord(str(element.elementId.guid))
+            if (boxes is not None and not math.isnan(boxes[row][0])):
+                (record.xMin, record.yMin, record.zMin, record.xMax, record.yMax, record.zMax) = boxes[row]
+            elif (boxes is not None):
+                record.flags |= NO_BOX
+            for (name, column) in columns:
+                if (name in RECORD_FLAGS):
+                    record.flags |= RECORD_FLAGS[name] if column[row] else 0
+                else:
+                    setattr(record, name, column[row])
+            records.append(record)
+        return records
+
+
+def evaluate(column: np.ndarray, op: str, value: Any) -> np.ndarray:
+    # Function: boolean mask of the rows whose value satisfies "value op" (missing values only match != and not in)
+    compare = OPERATORS[op]
+    present = np.not_equal(column, None)
+    if (op in ("==", "!=") and not isinstance(value, (list, tuple, set))):
+        mask = np.asarray(compare(column, value), dtype=bool)   # elementwise on the object array
+        return mask if op == "!=" else mask & present
+    if (op in ("in", "not in")):
+        value = set(value)
+    mask = np.zeros(len(column), dtype=bool)
+    if (present.any()):
+        mask[present] = np.frompyfunc(lambda v: bool(compare(v, value)), 1, 1)(column[present]).astype(bool)
+    if (op == "not in"):
+        mask |= ~present
+    return mask
+
+
+class Query:
+    # Class: builder for an element query; every method returns the query so calls can be chained
+
+    def __init__(self):
+        self.classifications: Dict[str, List[str]] = {}
+        self.elementTypes: List[str] = []
+        self.selection = IGNORE_SELECTION
+        self.columns: Dict[str, Property] = {}
+        self.resolveOnly: Dict[str, Property] = {}
+        self.predicates: List[Predicate] = []
+        self.boundingBoxes: Optional[str] = None
+        self.groupKeys: List[str] = []
+
+    def classified(self, system: str, *itemIds: str) -> "Query":
+        # Function: elements classified as any of the items of a classification system
+        self.classifications.setdefault(system, []).extend(i for i in itemIds if i not in self.classifications.get(system, []))
+        return self
+
+    def ofType(self, *elementTypes: str) -> "Query":
+        self.elementTypes.extend(t for t in elementTypes if t not in self.elementTypes)
+        return self
+
+    def preferSelection(self) -> "Query":
+        self.selection = PREFER_SELECTION
+        return self
+
+    def withinSelection(self) -> "Query":
+        self.selection = WITHIN_SELECTION
+        return self
+
+    def column(self, name: str, prop: Property) -> "Query":
+        # Function: fetches a property of every candidate as the column name (plain values, see kaa.records.plainValue)
+        self.columns[name] = prop
+        return self
+
+    def withColumns(self, *names: str) -> "Query":
+        # Function: column() for each name with its property from KAA_PROPERTIES
+        for name in names:
+            self.column(name, KAA_PROPERTIES[name])
+        return self
+
+    def resolve(self, name: str, prop: Property = None) -> "Query":
+        # Function: only looks up the property id (e.g. the property the script writes), in the same request as the columns
+        # (prop defaults to the KAA_PROPERTIES entry of name)
+        self.resolveOnly[name] = prop or KAA_PROPERTIES[name]
+        return self
+
+    def where(self, column: str, op: str, value: Any) -> "Query":
+        if (column not in self.columns):
+            raise KeyError(f"where() on unknown column {column!r}, add it with column() first")
+        if (op not in OPERATORS):
+            raise ValueError(f"Unknown operator {op!r}, use one of {', '.join(OPERATORS)}")
+        self.predicates.append(Predicate(column, op, value))
+        return self
+
+    def withBoundingBoxes(self, dimensions: str = "3D") -> "Query":
+        self.boundingBoxes = dimensions
+        return self
+
+    def groupBy(self, *columns: str) -> "Query":
+        unknown = [c for c in columns if c not in self.columns]
+        if (unknown):
+            raise KeyError(f"groupBy() on unknown column(s) {', '.join(unknown)}")
+        self.groupKeys = list(columns)
+        return self
+
+    def plan(self) -> QueryPlan:
+        # Function: the requests needed, every property (column or resolve) fetched once even if named twice
+        properties = list(dict.fromkeys(list(self.columns.values()) + list(self.resolveOnly.values())))
+        return QueryPlan(properties, list(self.columns), {s: list(i) for (s, i) in self.classifications.items()}, list(self.elementTypes), self.selection, self.boundingBoxes, list(self.predicates))
+
+    def explain(self) -> str:
+        lines = []
+        for (i, requests) in enumerate(self.plan().rounds(), start=1):
+            lines.append(f"round {i}: " + " | ".join(requests))
+        for p in self.predicates:
+            lines.append(f"filter: {p.column} {p.op} {p.value!r}")
+        if (self.groupKeys):
+            lines.append(f"group by: {', '.join(self.groupKeys)}")
+        return "\n".join(lines)
+
+    def run(self, conn, aconn: Optional[AsyncConnection] = None, loader: Optional[BatchLoader] = None) -> QueryResult:
+        # Function: sends the planned requests (concurrent within a round) and filters the candidates
+        aconn = aconn or AsyncConnection(conn)
+        return aconn.gather(self.fetch(conn, aconn, loader or BatchLoader(aconn, window=0)))[0]
+
+    async def fetch(self, conn, aconn: AsyncConnection, loader: BatchLoader) -> QueryResult:
+        # Function: run() as a coroutine; queries awaited together on one loader share its round 3 commands (see runQueries)
+        plan = self.plan()
+        act = conn.types
+        aacc = aconn.commands
+
+        # round 1: property ids, classification items and the selection
+        calls = []
+        if (plan.properties):
+            calls.append(aacc.GetPropertyIds([propertyUserId(act, p) for p in plan.properties]))
+        calls += [classificationItems(aconn, system, items) for (system, items) in plan.classificationSystems.items()]
+        if (plan.selection != IGNORE_SELECTION):
+            calls.append(aacc.GetSelectedElements())
+        results = list(await asyncio.gather(*calls))
+
+        propertyIds = {}
+        if (plan.properties):
+            resolved = results.pop(0)
+            byProperty = {}
+            for (prop, item) in zip(plan.properties, resolved):
+                if (getattr(item, "propertyId", None) is None):
+                    raise LookupError(f"Property {prop} not found in the project")
+                byProperty[prop] = item.propertyId
+            propertyIds = {name: byProperty[prop] for (name, prop) in list(self.columns.items()) + list(self.resolveOnly.items())}
+        classificationIds = [item for _ in plan.classificationSystems for item in results.pop(0)]
+        selected = results.pop(0) if plan.selection != IGNORE_SELECTION else []
+
+        # round 2: the candidates
+        if (plan.selection == PREFER_SELECTION and len(selected) > 0):
+            candidates = list(selected)
+        else:
+            lists = await asyncio.gather(*([aacc.GetElementsByClassification(c) for c in classificationIds] + [aacc.GetElementsByType(t) for t in plan.elementTypes]))
+            candidates = uniqueElements(e for elements in lists for e in elements)
+            if (plan.selection == WITHIN_SELECTION and len(selected) > 0):
+                selectedGuids = set(str(e.elementId.guid) for e in selected)
+                candidates = [e for e in candidates if str(e.elementId.guid) in selectedGuids]
+
+        # round 3: every property and the bounding boxes of every candidate, decoded straight into arrays (through the
+        # loader, which merges them with the same requests of other queries)
+        guids = [str(e.elementId.guid) for e in candidates]
+        calls = []
+        if (plan.columns):
+            calls.append(loader.values(guids, [propertyIds[n] for n in plan.columns]))
+        if (plan.boundingBoxes):
+            calls.append(loader.boxes(guids, plan.boundingBoxes))
+        results = list(await asyncio.gather(*calls))
+        columns = dict(zip(plan.columns, results.pop(0))) if plan.columns else {}
+        boxes = results.pop(0) if plan.boundingBoxes else None
+
+        # filters, on whole columns
+        mask = np.ones(len(candidates), dtype=bool)
+        for predicate in plan.predicates:
+            mask &= evaluate(columns[predicate.column], predicate.op, predicate.value)
+        rows = np.flatnonzero(mask)
+        return QueryResult([candidates[r] for r in rows], {n: c[rows] for (n, c) in columns.items()},
+                           boxes[rows] if boxes is not None else None, propertyIds, self.groupKeys)
+
+
+def runQueries(conn, *queries: Query) -> List[QueryResult]:
+    # Function: runs the queries concurrently on one connection; their property value and bounding box requests are
+    # merged into one command per kind where their rounds line up (kaa/loader.py)
+    aconn = AsyncConnection(conn)
+    loader = BatchLoader(aconn)
+    return aconn.gather(*[query.fetch(conn, aconn, loader) for query in queries])
+
+
+def propertyUserId(act, prop: Property):
+    if (isinstance(prop, BuiltIn)):
+        return act.BuiltInPropertyUserId(prop.name)
+    return act.UserDefinedPropertyUserId([prop.group, prop.name])
+
+
+async def classificationItems(aconn: AsyncConnection, system: str, itemIds: List[str]) -> List[Any]:
+    # Function: ClassificationIds of the items of one system from a single read of its tree
+    systemId = await aconn.utilities.FindClassificationSystem(system)
+    trees = await aconn.commands.GetAllClassificationsInSystem(systemId)
+    found = {}
+    for tree in trees:
+        for item in aconn.conn.utilities.FindInClassificationItemTree(tree.classificationItem, lambda c: c.id in itemIds):
+            found.setdefault(item.id, item.classificationItemId)
+    missing = [i for i in itemIds if i not in found]
+    if (missing):
+        raise LookupError(f"Classification item(s) {', '.join(missing)} not found in {system}")
+    return [found[i] for i in itemIds]
+
+
+def uniqueElements(elements) -> List[Any]:
+    # Function: elements in first-seen order without duplicates (an element can be in several sources)
+    seen = set()
+    unique = []
+    for element in elements:
+        guid = str(element.elementId.guid)
+        if (guid not in seen):
+            seen.add(guid)
+            unique.append(element)
+    return unique
+
+#######################################################################################################
@@ -0,0 +1,115 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Compact per-element records for the code that walks elements one by one (the exterior       #
+# perimeter walk, door ordering). A record holds the GUID, the six bounding box values,        #
+# story, building, exterior side, position and the First_Door/First_Window flags in slots,     #
+# built straight from the fetch responses, so no archicad wrapper objects or nested tuples     #
+# are kept per element. Write results back with act.ElementId(record.guid).                    #
+################################################################################################
+
+
+from typing import Any, List, Optional, Sequence
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+FIRST_DOOR = 1
+FIRST_WINDOW = 2
+NO_BOX = 4           # bounding boxes were fetched but Archicad returned none for the element (its coordinates stay 0)
+
+# record fields that can be filled from property columns (see buildRecords)
+PROPERTY_FIELDS = ("story", "building", "side", "position", "firstDoor", "firstWindow")
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class ElementRecord:
+    __slots__ = ("guid", "xMin", "yMin", "zMin", "xMax", "yMax", "zMax", "story", "building", "side", "position", "flags")
+
+    def __init__(self, guid: str, xMin: float = 0.0, yMin: float = 0.0, zMin: float = 0.0, xMax: float = 0.0, yMax: float = 0.0, zMax: float = 0.0,
+                 story: Optional[int] = None, building: Optional[int] = None, side: Optional[str] = None, position: Optional[str] = None, flags: int = 0):
+        self.guid = guid
+        self.xMin = xMin
+        self.yMin = yMin
+        self.zMin = zMin
+        self.xMax = xMax
+        self.yMax = yMax
+        self.zMax = zMax
+        self.story = story
+        self.building = building
+        self.side = side
+        self.position = position
+        self.flags = flags
+
+    def __repr__(self) -> str:
+        return f"ElementRecord({self.guid}, story={self.story}, building={self.building}, side={self.side})"
+
+    @property
+    def isFirstDoor(self) -> bool:
+        return bool(self.flags & FIRST_DOOR)
+
+    @property
+    def isFirstWindow(self) -> bool:
+        return bool(self.flags & FIRST_WINDOW)
+
+    @property
+    def hasBox(self) -> bool:
+        return not (self.flags & NO_BOX)
+
+
+def plainValue(propertyValueWrapper: Any) -> Any:
+    # Function: the plain Python value of one PropertyValueOrErrorItem (None when the property is missing or not available);
+    # enum values give their non-localized or display value, whichever Archicad sent
+    propertyValue = getattr(propertyValueWrapper, "propertyValue", None)
+    if (propertyValue is None or getattr(propertyValue, "status", "normal") != "normal"):
+        return None
+    value = getattr(propertyValue, "value", None)
+    if (hasattr(value, "nonLocalizedValue")):
+        return value.nonLocalizedValue
+    if (hasattr(value, "displayValue")):
+        return value.displayValue
+    return value
+
+
+def buildRecords(elements: Sequence[Any], boundingBoxes: Optional[Sequence[Any]] = None, propertyValues: Optional[Sequence[Any]] = None, fields: Sequence[str] = ()) -> List[ElementRecord]:
+    # Function: one record per element from the responses of Get3DBoundingBoxes and GetPropertyValuesOfElements;
+    # fields names the record field filled by each requested property, in request order (see PROPERTY_FIELDS)
+    records = []
+    for (i, element) in enumerate(elements):
+        record = ElementRecord(str(element.elementId.guid))
+        box = getattr(boundingBoxes[i], "boundingBox3D", None) if boundingBoxes is not None else None
+        if (box is not None):
+            (record.xMin, record.yMin, record.zMin, record.xMax, record.yMax, record.zMax) = (box.xMin, box.yMin, box.zMin, box.xMax, box.yMax, box.zMax)
+        elif (boundingBoxes is not None):
+            record.flags |= NO_BOX
+        if (propertyValues is not None):
+            for (field, wrapper) in zip(fields, propertyValues[i].propertyValues):
+                value = plainValue(wrapper)
+                if (field == "firstDoor"):
+                    record.flags |= FIRST_DOOR if value else 0
+                elif (field == "firstWindow"):
+                    record.flags |= FIRST_WINDOW if value else 0
+                else:
+                    setattr(record, field, value)
+        records.append(record)
+    return records
+
+
+def recordsFromPairs(pairs: Sequence[Any], sides: Optional[dict] = None) -> List[ElementRecord]:
+    # Function: records from legacy (element, bounding box) pairs, with the exterior sides from a {guid: side} dictionary
+    records = buildRecords([p[0] for p in pairs], [p[1] for p in pairs])
+    if (sides is not None):
+        for record in records:
+            record.side = sides.get(record.guid)
+    return records
+
+#######################################################################################################
@@ -0,0 +1,192 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Automatic building segmentation. The footprints (x/y bounding boxes) of a story's elements  #
+# are drawn onto a grid of gap-sized cells; elements sharing a cell or in neighbouring cells    #
+# are connected, and every connected group of footprints is one building. Footprints closer   #
+# than gap are always joined, footprints more than 2 x gap apart never are (buildings must     #
+# stand further apart than that). Openings along a blank wall can be further apart, so groups  #
+# whose bounding rectangles overlap are merged afterwards: the pieces of one building's        #
+# perimeter lie inside or beside the rectangle of the rest of it. The cells are sorted once     #
+# (O(n log n)), the components found with vectorised label propagation and the overlapping     #
+# rectangles with a sort-and-sweep over their x intervals, so a story with ten thousand        #
+# openings is segmented in a few tens of milliseconds. Elements without a bounding box get no  #
+# building, so the numbering reports their missing BuildingNumber.                             #
+#                                                                                              #
+# A hand-entered BuildingNumber still wins: elements that have one keep it, elements without  #
+# one take the most common BuildingNumber of their footprint group, and groups where nobody   #
+# has one get the next free numbers, west to east.                                             #
+################################################################################################
+
+
+from collections import Counter
+from typing import Sequence
+
+import numpy as np
+
+from kaa.records import ElementRecord
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+DEFAULT_BUILDING_GAP = 8.0    # meters; closer footprints are one building, footprints twice as far apart never are
+SWEEP_CHUNK = 1 << 20         # candidate rectangle pairs checked at a time by the sweep
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def connectedComponents(count: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # Function: component label (smallest member index) of every node of an undirected graph given as edge arrays a-b
+    labels = np.arange(count)
+    if (len(a) == 0):
+        return labels
+    while (True):
+        low = np.minimum(labels[a], labels[b])
+        updated = labels.copy()
+        np.minimum.at(updated, a, low)
+        np.minimum.at(updated, b, low)
+        updated = updated[updated]          # pointer jumping: follow labels to their own labels
+        while (not np.array_equal(updated, updated[updated])):
+            updated = updated[updated]
+        if (np.array_equal(updated, labels)):
+            return labels
+        labels = updated
+
+
+def segmentFootprints(xMin: np.ndarray, yMin: np.ndarray, xMax: np.ndarray, yMax: np.ndarray, gap: float = DEFAULT_BUILDING_GAP) -> np.ndarray:
+    # Function: building index (0, 1, ... west to east by the group's smallest xMin, then yMin) of every footprint, -1 for
+    # footprints with a non-finite coordinate (elements without geometry)
+    (xMin, yMin, xMax, yMax) = (np.asarray(v, dtype=float) for v in (xMin, yMin, xMax, yMax))
+    buildings = np.full(len(xMin), -1, dtype=int)
+    valid = np.isfinite(xMin) & np.isfinite(yMin) & np.isfinite(xMax) & np.isfinite(yMax)
+    if (valid.any()):
+        buildings[valid] = segmentValidFootprints(xMin[valid], yMin[valid], xMax[valid], yMax[valid], gap)
+    return buildings
+
+
+def segmentValidFootprints(xMin: np.ndarray, yMin: np.ndarray, xMax: np.ndarray, yMax: np.ndarray, gap: float) -> np.ndarray:
+    # Function: segmentFootprints for footprints that all have finite coordinates
+    count = len(xMin)
+    cell = float(gap)
+    (x0, y0) = (np.floor(xMin / cell).astype(np.int64), np.floor(yMin / cell).astype(np.int64))
+    (x1, y1) = (np.floor(xMax / cell).astype(np.int64), np.floor(yMax / cell).astype(np.int64))
+
+    # one (cell, element) pair for every cell an element's footprint covers
+    (widths, heights) = (x1 - x0 + 1, y1 - y0 + 1)
+    covered = widths * heights
+    owner = np.repeat(np.arange(count), covered)
+    local = np.arange(len(owner)) - np.repeat(np.cumsum(covered) - covered, covered)
+    cellX = np.repeat(x0, covered) + local % np.repeat(widths, covered)
+    cellY = np.repeat(y0, covered) + local // np.repeat(widths, covered)
+    (cellX, cellY) = (cellX - cellX.min() + 1, cellY - cellY.min() + 1)   # keep a free border for the neighbour keys
+    span = int(cellY.max()) + 2
+    keys = cellX * span + cellY
+
+    # elements in one cell are connected to the cell's first element
+    order = np.argsort(keys, kind="stable")
+    (keys, owner) = (keys[order], owner[order])
+    (cells, first) = np.unique(keys, return_index=True)
+    cellOwner = owner[first]
+    edgesA = [owner]
+    edgesB = [np.repeat(cellOwner, np.diff(np.r_[first, len(keys)]))]
+
+    # neighbouring cells (half of the 8 directions, the other half are the same edges reversed)
+    for offset in (span, 1, span + 1, span - 1):
+        positions = np.searchsorted(cells, cells + offset)
+        found = positions < len(cells)
+        found[found] = cells[positions[found]] == cells[found] + offset
+        edgesA.append(cellOwner[found])
+        edgesB.append(cellOwner[positions[found]])
+
+    labels = connectedComponents(count, np.concatenate(edgesA), np.concatenate(edgesB))
+    component = mergeEnvelopes(labels, xMin, yMin, xMax, yMax, gap)
+    (west, south) = envelopes(component, xMin, yMin, xMax, yMax)[:2]
+    rank = np.empty(len(west), dtype=int)
+    rank[np.lexsort((south, west))] = np.arange(len(west))
+    return rank[component]
+
+
+def envelopes(component: np.ndarray, xMin, yMin, xMax, yMax) -> np.ndarray:
+    # Function: (xMin, yMin, xMax, yMax) rows of the bounding rectangle of every component 0..n-1
+    count = int(component.max()) + 1
+    boxes = np.empty((4, count))
+    for (row, (values, reduce, start)) in enumerate(((xMin, np.minimum, np.inf), (yMin, np.minimum, np.inf), (xMax, np.maximum, -np.inf), (yMax, np.maximum, -np.inf))):
+        boxes[row] = start
+        reduce.at(boxes[row], component, values)
+    return boxes
+
+
+def mergeEnvelopes(labels: np.ndarray, xMin, yMin, xMax, yMax, gap: float) -> np.ndarray:
+    # Function: components 0..n-1 after merging the groups whose bounding rectangles overlap (within gap); a building with
+    # long blank walls falls apart into pieces of its perimeter, but each piece lies inside or beside the rectangle of the
+    # rest of the building, while separate buildings' rectangles stay apart
+    component = np.unique(labels, return_inverse=True)[1]
+    while (True):
+        (a, b) = overlappingPairs(*envelopes(component, xMin, yMin, xMax, yMax), gap)
+        if (len(a) == 0):
+            return component
+        component = np.unique(connectedComponents(int(component.max()) + 1, a, b), return_inverse=True)[1][component]
+
+
+def overlappingPairs(west: np.ndarray, south: np.ndarray, east: np.ndarray, north: np.ndarray, gap: float):
+    # Function: (a, b) index arrays of the rectangles that overlap within gap. Sort and sweep: sorted by west, the rectangles
+    # whose x interval overlaps rectangle i's are the ones after it up to the first west past east[i] + gap (a binary
+    # search), and only those candidate pairs are checked in y, so the work follows the candidates instead of n x n
+    order = np.argsort(west, kind="stable")
+    (west, south, east, north) = (west[order], south[order], east[order], north[order])
+    ends = np.searchsorted(west, east + gap, side="right")
+    counts = np.maximum(ends - np.arange(len(west)) - 1, 0)
+    (pairsA, pairsB) = ([], [])
+    start = 0
+    while (start < len(west)):
+        # rows start..stop-1 hold at most SWEEP_CHUNK candidates (at least one row, however many it has)
+        stop = max(start + 1, int(np.searchsorted(np.cumsum(counts[start:]), SWEEP_CHUNK, side="right")) + start)
+        rows = np.arange(start, stop)
+        chunk = counts[start:stop]
+        a = np.repeat(rows, chunk)
+        b = a + 1 + (np.arange(len(a)) - np.repeat(np.cumsum(chunk) - chunk, chunk))
+        near = (south[a] <= north[b] + gap) & (south[b] <= north[a] + gap)
+        (pairsA, pairsB) = (pairsA + [order[a[near]]], pairsB + [order[b[near]]])
+        start = stop
+    if (not pairsA):
+        return (np.zeros(0, dtype=int), np.zeros(0, dtype=int))
+    return (np.concatenate(pairsA), np.concatenate(pairsB))
+
+
+def assignBuildings(records: Sequence[ElementRecord], gap: float = DEFAULT_BUILDING_GAP) -> int:
+    # Function: sets the building of every record without a BuildingNumber from its story's footprint groups (see the
+    # header); returns how many records were given a building
+    byStory = {}
+    for record in records:
+        byStory.setdefault(record.story, []).append(record)
+    assigned = 0
+    for onStory in byStory.values():
+        if (all(r.building is not None for r in onStory)):
+            continue
+        groups = segmentFootprints(*(np.array([getattr(r, name) if r.hasBox else np.nan for r in onStory], dtype=float)
+                                     for name in ("xMin", "yMin", "xMax", "yMax")), gap=gap).tolist()
+        tagged = {}
+        for (r, group) in zip(onStory, groups):
+            if (r.building is not None and group >= 0):
+                tagged.setdefault(group, Counter())[r.building] += 1
+        nextNumber = max([int(r.building) for r in onStory if r.building is not None], default=0) + 1
+        numbers = {}
+        for group in range(max(groups) + 1):
+            if (group in tagged):
+                numbers[group] = tagged[group].most_common(1)[0][0]
+            else:
+                (numbers[group], nextNumber) = (nextNumber, nextNumber + 1)
+        for (r, group) in zip(onStory, groups):
+            if (r.building is None and group >= 0):
+                (r.building, assigned) = (numbers[group], assigned + 1)
+    return assigned
+
+#######################################################################################################
@@ -0,0 +1,78 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Stable renumbering. Given the new order of a story/building group and the numbers the        #
+# elements already have, keep as many numbers as possible while the numbers still increase    #
+# along the new order, and give the others the next free numbers. Adding one door then        #
+# changes one ID instead of every ID after it.                                                 #
+#                                                                                              #
+# Element i (0-based in the new order) can keep its number c_i only if the i elements before  #
+# it fit below it (c_i - i >= 1) and, for two kept elements i < j, the elements between them   #
+# fit between their numbers (c_j - c_i >= j - i), i.e. d_i = c_i - i never decreases over the   #
+# kept elements. The most numbers are kept by the longest non-decreasing subsequence of d,     #
+# found in O(n log n) with patience sorting.                                                    #
+################################################################################################
+
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def parseNumber(value: Optional[str], storyIndex: int, prefix: str = '') -> Optional[int]:
+    # Function: the element index of an existing number of this story (e.g. 7 for "207" on story 2), None if it is not one
+    if (not value or not value.startswith(prefix)):
+        return None
+    digits = value[len(prefix):]
+    story = str(storyIndex)
+    if (not digits.startswith(story) or not digits[len(story):].isdigit() or len(digits) - len(story) < 2):
+        return None
+    return int(digits[len(story):])
+
+
+def longestNonDecreasing(values: Sequence[Optional[int]]) -> List[int]:
+    # Function: positions of a longest non-decreasing subsequence of values (None entries are skipped)
+    tails = []          # tails[k]: smallest last value of a subsequence of length k+1
+    tailPositions = []  # position of that last value
+    previous = [-1] * len(values)
+    for (position, value) in enumerate(values):
+        if (value is None):
+            continue
+        k = bisect_right(tails, value)
+        if (k == len(tails)):
+            tails.append(value)
+            tailPositions.append(position)
+        else:
+            tails[k] = value
+            tailPositions[k] = position
+        previous[position] = tailPositions[k - 1] if k > 0 else -1
+    sequence = []
+    position = tailPositions[-1] if tailPositions else -1
+    while (position >= 0):
+        sequence.append(position)
+        position = previous[position]
+    return sequence[::-1]
+
+
+def stableIndexes(current: Sequence[Optional[int]]) -> List[int]:
+    # Function: new element indexes (1, 2, ... increasing) for elements in their new order, keeping as many of the current indexes as possible
+    offsets = [c - i if (c is not None and c - i >= 1) else None for (i, c) in enumerate(current)]
+    kept = set(longestNonDecreasing(offsets))
+    indexes = []
+    previous = 0
+    for (i, c) in enumerate(current):
+        previous = c if i in kept else previous + 1
+        indexes.append(previous)
+    return indexes
+
+
+def stableNumbers(storyIndex: int, orderedGuids: Sequence[str], existing: Dict[str, Optional[str]], prefix: str = '') -> List[int]:
+    # Function: element indexes for one story/building group in its new order, given the existing {guid: number} values
+    return stableIndexes([parseNumber(existing.get(guid), storyIndex, prefix) for guid in orderedGuids])
+
+#######################################################################################################
@@ -0,0 +1,261 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# On-disk geometry store for very large projects. A store is a directory of .npy files opened #
+# with numpy memmap, so opening it reads a few hundred bytes and rows are paged in only when   #
+# used; several tools (and several runs) share the same pages through the OS file cache:       #
+#   table.npy   ELEMENT_DTYPE rows (bounding box, story, building, side, flags), kaa/geometry  #
+#   guids.npy   GUID of every row                                                              #
+#   keys.npy    the GUIDs sorted, and order.npy the row of each sorted GUID (the GUID index,  #
+#               searched with np.searchsorted without loading it); an append writes the merged #
+#               index to new files (keys-<n>.npy, order-<n>.npy) and keeps the old ones        #
+#   meta.json   row count, capacity, index files and time of the last store-sync, replaced     #
+#               atomically and written last: an interrupted store-sync keeps the old index     #
+# Rows are updated in place; new elements are appended (the files double in size when full)   #
+# and removed ones are flagged FLAG_DELETED. Readers open the files copy-on-write, so a task   #
+# can set flags and stories on its table without touching the store, but rows updated in       #
+# place are not isolated: a reader can see a row that is half rewritten, so run store-sync     #
+# while no script reads the store.                                                             #
+#                                                                                              #
+#   store = GeometryStore.open("C:/KAA/store/campus")                                          #
+#   table = store.table(conn.types)      # ElementTable over the memmap, no Archicad fetch     #
+################################################################################################
+
+
+import json
+import os
+import time
+from typing import Any, Iterable, Optional, Sequence
+
+import numpy as np
+
+from kaa.geometry import ELEMENT_DTYPE, FLAG_DELETED, GUID_DTYPE, ElementTable
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+STORE_VERSION = 1
+INITIAL_CAPACITY = 1024
+META_FILE = "meta.json"
+ARRAYS = {"table": ELEMENT_DTYPE, "guids": np.dtype(GUID_DTYPE), "keys": np.dtype(GUID_DTYPE), "order": np.dtype("i8")}
+INDEX_ARRAYS = ("keys", "order")     # rewritten to new files on every append, see GeometryStore._index
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class StoredElements:
+    # Class: the elements of a stored table as archicad ElementIdArrayItems, built only when a row is used (to write back)
+
+    def __init__(self, guids: np.ndarray, act):
+        self.guids = guids
+        self.act = act
+
+    def __len__(self) -> int:
+        return len(self.guids)
+
+    def __getitem__(self, row: int):
+        return self.act.ElementIdArrayItem(self.act.ElementId(str(self.guids[row])))
+
+
+class GeometryStore:
+    # Class: one store directory; use GeometryStore.open or GeometryStore.create
+
+    def __init__(self, path: str, writable: bool):
+        self.path = path
+        self.writable = writable
+        with open(os.path.join(path, META_FILE), "r", encoding="utf-8") as metaFile:
+            meta = json.load(metaFile)
+        if (meta.get("version") != STORE_VERSION):
+            raise ValueError(f"{path} is a version {meta.get('version')} store, this script reads version {STORE_VERSION}")
+        self.count = meta["count"]
+        self.capacity = meta["capacity"]
+        self.synced = meta.get("synced")     # time of the last kaa store-sync, None if it never ran
+        self.index = meta.get("index", 0)    # generation of the GUID index files, see fileOf
+        self.replaced = []                   # index files of the previous generation, removed after the next flush
+        self._map()
+
+    @classmethod
+    def open(cls, path: str, writable: bool = False) -> "GeometryStore":
+        return cls(path, writable)
+
+    @classmethod
+    def create(cls, path: str, capacity: int = INITIAL_CAPACITY) -> "GeometryStore":
+        # Function: an empty store (an existing store in path is replaced)
+        os.makedirs(path, exist_ok=True)
+        for (name, dtype) in ARRAYS.items():
+            np.lib.format.open_memmap(os.path.join(path, f"{name}.npy"), mode="w+", dtype=dtype, shape=(capacity,)).flush()
+        writeMeta(path, 0, capacity)
+        return cls(path, writable=True)
+
+    @classmethod
+    def openOrCreate(cls, path: str) -> "GeometryStore":
+        if (os.path.exists(os.path.join(path, META_FILE))):
+            return cls.open(path, writable=True)
+        return cls.create(path)
+
+    def fileOf(self, name: str, index: Optional[int] = None) -> str:
+        # Function: path of an array file; the GUID index files of generation n > 0 are keys-n.npy and order-n.npy
+        index = self.index if index is None else index
+        if (name in INDEX_ARRAYS and index > 0):
+            return os.path.join(self.path, f"{name}-{index}.npy")
+        return os.path.join(self.path, f"{name}.npy")
+
+    def _map(self):
+        mode = "r+" if self.writable else "c"   # readers get copy-on-write pages
+        self.arrays = {name: np.load(self.fileOf(name), mmap_mode=mode) for name in ARRAYS}
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def data(self) -> np.ndarray:
+        return self.arrays["table"][:self.count]
+
+    @property
+    def guids(self) -> np.ndarray:
+        return self.arrays["guids"][:self.count]
+
+    def rowsOf(self, guids: Iterable[Any], live: bool = False) -> np.ndarray:
+        # Function: rows of the given GUIDs (strings or UUIDs), -1 for GUIDs not in the store (or removed from it if live)
+        wanted = np.array([str(g) for g in guids], dtype=GUID_DTYPE)
+        keys = self.arrays["keys"][:self.count]
+        positions = np.searchsorted(keys, wanted)
+        found = positions < self.count
+        found[found] = keys[positions[found]] == wanted[found]
+        rows = np.full(len(wanted), -1, dtype="i8")
+        rows[found] = self.arrays["order"][:self.count][positions[found]]
+        if (live):
+            rows[found] = np.where((self.data["flags"][rows[found]] & FLAG_DELETED) != 0, -1, rows[found])
+        return rows
+
+    def liveRows(self) -> np.ndarray:
+        return np.flatnonzero((self.data["flags"] & FLAG_DELETED) == 0)
+
+    def table(self, act=None, rows: Optional[np.ndarray] = None) -> ElementTable:
+        # Function: an ElementTable of the live rows (or the given rows); without deleted rows the data is the memmap itself
+        # (copy-on-write for readers). With act, table.elementsAt gives ElementIdArrayItems for writing back.
+        if (rows is None):
+            rows = self.liveRows()
+            if (len(rows) == self.count):
+                (data, guids) = (self.data, self.guids)
+            else:
+                (data, guids) = (self.data[rows], self.guids[rows])
+        else:
+            (data, guids) = (self.data[rows], self.guids[rows])
+        return ElementTable(StoredElements(guids, act) if act is not None else [], data, guids)
+
+    def upsert(self, guids: Sequence[Any], data: np.ndarray, fields: Optional[Sequence[str]] = None) -> np.ndarray:
+        # Function: writes rows by GUID, in place for known elements (only the given fields if any) and appended for new ones;
+        # returns the row of every GUID. A removed element that comes back is live again.
+        if (not self.writable):
+            raise PermissionError(f"{self.path} was opened read-only")
+        guids = np.array([str(g) for g in guids], dtype=GUID_DTYPE)
+        rows = self.rowsOf(guids)
+        known = rows >= 0
+        table = self.arrays["table"]
+        if (known.any()):
+            for field in (fields or ELEMENT_DTYPE.names):
+                table[field][rows[known]] = data[field][known]
+            table["flags"][rows[known]] &= ~np.uint8(FLAG_DELETED)
+        new = np.flatnonzero(~known)
+        if (len(new)):
+            new = new[np.sort(np.unique(guids[new], return_index=True)[1])]   # a GUID given twice is stored once
+            newGuids = guids[new]
+            self._reserve(self.count + len(new))
+            start = self.count
+            rows[new] = np.arange(start, start + len(new))
+            self.arrays["table"][start:start + len(new)] = data[new]
+            self.arrays["guids"][start:start + len(new)] = newGuids
+            byGuid = np.argsort(newGuids)
+            self._index(newGuids[byGuid], rows[new][byGuid])
+            self.count += len(new)
+            rows = self.rowsOf(guids)   # duplicates of a new GUID get its row
+        self.flush()
+        self._removeReplaced()
+        return rows
+
+    def remove(self, guids: Iterable[Any]) -> int:
+        # Function: flags the rows of the GUIDs FLAG_DELETED (they stay in the files), returns how many were in the store
+        rows = self.rowsOf(guids)
+        rows = rows[rows >= 0]
+        self.arrays["table"]["flags"][rows] |= np.uint8(FLAG_DELETED)
+        self.flush()
+        return len(rows)
+
+    def _index(self, newGuids: np.ndarray, newRows: np.ndarray):
+        # merges the new sorted GUIDs into keys/order (newGuids must be sorted and not in the store). The merged index goes
+        # to the files of the next generation; the current files stay as they are until meta.json names the new ones, so
+        # a run interrupted before the meta write leaves the old index valid for the old row count
+        count = self.count
+        keys = self.arrays["keys"]
+        order = self.arrays["order"]
+        positions = np.searchsorted(keys[:count], newGuids) + np.arange(len(newGuids))
+        mergedKeys = np.empty(count + len(newGuids), dtype=GUID_DTYPE)
+        mergedOrder = np.empty(count + len(newGuids), dtype="i8")
+        isOld = np.ones(len(mergedKeys), dtype=bool)
+        isOld[positions] = False
+        (mergedKeys[positions], mergedOrder[positions]) = (newGuids, newRows)
+        (mergedKeys[isOld], mergedOrder[isOld]) = (keys[:count], order[:count])
+        index = self.index + 1
+        for (name, merged) in (("keys", mergedKeys), ("order", mergedOrder)):
+            array = np.lib.format.open_memmap(self.fileOf(name, index), mode="w+", dtype=ARRAYS[name], shape=(self.capacity,))
+            array[:len(merged)] = merged
+            array.flush()
+            self.replaced.append(self.fileOf(name))
+            self.arrays[name] = array
+        self.index = index
+
+    def _removeReplaced(self):
+        # deletes the index files meta.json no longer names (kept if still open elsewhere, e.g. by a reader on Windows)
+        for path in self.replaced:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.replaced = []
+
+    def _reserve(self, count: int):
+        # grows every file to at least count rows (doubling), each through a temporary file and an atomic rename
+        if (count <= self.capacity):
+            return
+        capacity = max(self.capacity * 2, count)
+        self.flush()
+        for (name, dtype) in ARRAYS.items():
+            path = self.fileOf(name)
+            grown = np.lib.format.open_memmap(path + ".tmp", mode="w+", dtype=dtype, shape=(capacity,))
+            grown[:self.count] = self.arrays[name][:self.count]
+            grown.flush()
+            del grown
+            self.arrays[name] = None   # the old mapping must be closed before the rename on Windows
+            os.replace(path + ".tmp", path)
+        self.capacity = capacity
+        self._map()
+
+    def markSynced(self):
+        # Function: records that the store now matches the whole model (saved with the next flush)
+        self.synced = time.time()
+
+    def flush(self):
+        if (not self.writable):
+            return
+        for array in self.arrays.values():
+            array.flush()
+        writeMeta(self.path, self.count, self.capacity, self.synced, self.index)
+
+
+def writeMeta(path: str, count: int, capacity: int, synced: Optional[float] = None, index: int = 0):
+    # Function: the row count, capacity, time of the last sync and index generation, replaced atomically
+    temporary = os.path.join(path, META_FILE + ".tmp")
+    with open(temporary, "w", encoding="utf-8") as metaFile:
+        json.dump({"version": STORE_VERSION, "count": count, "capacity": capacity, "synced": synced, "index": index}, metaFile)
+    os.replace(temporary, os.path.join(path, META_FILE))
+
+#######################################################################################################
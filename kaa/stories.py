@@ -0,0 +1,97 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Leveling from the project's story table. The story items of the Project Map and their floor  #
+# levels are read once (GetNavigatorItemTree + GetStoryNavigatorItems), sorted by level, and   #
+# every element is put on the highest story whose level is at or below its bounding box zMin   #
+# plus STORY_TOLERANCE (binary search, np.searchsorted for whole columns). A mezzanine stays   #
+# on the story it starts from and a room sunk up to the tolerance below its floor stays on it, #
+# where clustering zMin values merged or split them. Zones get story indexes counted from the  #
+# lowest story (0), like the zMin clusters; doors and windows get the Archicad floor number    #
+# (0: ground floor, basements below 0), the convention of a hand-set StoryNumber.              #
+#                                                                                              #
+#   stories = fetchStoryTable(conn)                                                            #
+#   table.data["story"] = stories.storyIndexes(table.data["zMin"])                             #
+################################################################################################
+
+
+from typing import Any, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from kaa.records import ElementRecord
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+STORY_TOLERANCE = 0.3    # meters an element may start below its story's floor level (sunken rooms, floor finishes)
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class StoryTable:
+    # Class: the stories of a project, lowest first: floor level (meters), Archicad floor number and name
+
+    def __init__(self, levels: Sequence[float], floorNumbers: Optional[Sequence[int]] = None, names: Optional[Sequence[str]] = None):
+        order = np.argsort(np.asarray(levels, dtype=float), kind="stable")
+        self.levels = np.asarray(levels, dtype=float)[order]
+        self.floorNumbers = [int(n) for n in np.asarray(floorNumbers)[order]] if floorNumbers is not None else list(range(len(order)))
+        self.names = [str(n) for n in np.asarray(names)[order]] if names is not None else [''] * len(order)
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def storyIndexes(self, zValues: Any, tolerance: float = STORY_TOLERANCE) -> np.ndarray:
+        # Function: the story index of every z value (elements below the lowest story are on it); NaN (no geometry) gets -1
+        zValues = np.asarray(zValues, dtype=float)
+        stories = np.full(len(zValues), -1, dtype="i4")
+        if (len(self.levels) == 0):
+            return stories
+        valid = ~np.isnan(zValues)
+        stories[valid] = np.maximum(np.searchsorted(self.levels, zValues[valid] + tolerance, side="right") - 1, 0)
+        return stories
+
+    def floorNumbersOf(self, zValues: Any, tolerance: float = STORY_TOLERANCE) -> List[Optional[int]]:
+        # Function: the Archicad floor number of the story of every z value (the StoryNumber convention), None for NaN
+        return [self.floorNumbers[i] if i >= 0 else None for i in self.storyIndexes(zValues, tolerance).tolist()]
+
+
+def storyItemIds(item, found: Optional[List[Any]] = None) -> List[Any]:
+    # Function: the NavigatorItemIds of the StoryItems in a navigator tree item and its children
+    found = [] if found is None else found
+    if (item.type == "StoryItem"):
+        found.append(item.navigatorItemId)
+    for child in (item.children or []):
+        storyItemIds(child.navigatorItem, found)
+    return found
+
+
+def fetchStoryTable(conn) -> StoryTable:
+    # Function: the story table of the project in two commands
+    act = conn.types
+    tree = conn.commands.GetNavigatorItemTree(act.NavigatorTreeId("ProjectMap"))
+    itemIds = storyItemIds(tree.rootItem)
+    items = conn.commands.GetStoryNavigatorItems([act.NavigatorItemIdWrapper(i) for i in itemIds]) if itemIds else []
+    stories = [i.storyNavigatorItem for i in items if getattr(i, "storyNavigatorItem", None) is not None]
+    return StoryTable([s.floorLevel for s in stories], [s.floorNumber for s in stories], [s.name for s in stories])
+
+
+def levelRecords(records: Iterable[ElementRecord], stories: StoryTable, tolerance: float = STORY_TOLERANCE) -> List[ElementRecord]:
+    # Function: gives every record without a StoryNumber the floor number of the story of its zMin (a StoryNumber set by hand
+    # is kept, e.g. for clerestory windows that start above the next story's level) and returns the leveled records; records
+    # without a box keep no story, so the numbering reports the missing StoryNumber
+    records = [r for r in records if r.story is None and r.hasBox]
+    if (records):
+        for (record, story) in zip(records, stories.floorNumbersOf([r.zMin for r in records], tolerance)):
+            record.story = story
+    return records
+
+#######################################################################################################
@@ -0,0 +1,9 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# The work of each script as an importable function run(conn, args, tracer) -> exit code. The  #
+# command line (kaa/cli.py) imports a task module only when its subcommand runs, so nothing   #
+# is imported here.                                                                            #
+################################################################################################
@@ -0,0 +1,37 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Round trips and recorded time per command of sessions recorded with --record (kaa/           #
+# cassette.py), without Archicad. Given two cassettes, e.g. the same project recorded with    #
+# two versions of a script, the table shows both and the change, so a version that sends more  #
+# commands or waits longer on Archicad stands out.                                             #
+################################################################################################
+
+
+from kaa.cassette import cassetteStats
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def summary(conn, args, tracer) -> int:
+    if (len(args.cassettes) > 2):
+        print("Give one cassette, or two to compare")
+        return -1
+    stats = [cassetteStats(path) for path in args.cassettes]
+    names = sorted(set(name for s in stats for name in s), key=lambda n: -max(s.get(n, [0, 0.0])[1] for s in stats))
+    totals = [[sum(row[0] for row in s.values()), sum(row[1] for row in s.values())] for s in stats]
+
+    header = "".join(f"{'round trips':>12}{'ms':>11}" for _ in stats) + (f"{'change':>22}" if len(stats) == 2 else "")
+    print(f"{'command':<36}{header}")
+    for (name, rows) in [(n, [s.get(n, [0, 0.0]) for s in stats]) for n in names] + [("total", totals)]:
+        line = f"{name:<36}" + "".join(f"{calls:>12}{ms:>11.1f}" for (calls, ms) in rows)
+        if (len(rows) == 2):
+            line += f"{rows[1][0] - rows[0][0]:>+11}{rows[1][1] - rows[0][1]:>+11.1f}"
+        print(line)
+    return 0
+
+#######################################################################################################
@@ -0,0 +1,164 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Writing and reporting shared by the numbering tasks. Values are (element GUID, string) pairs #
+# as returned by kaa/numbering.py; with --dry-run nothing is written and the planned values    #
+# are printed instead of the values read back from Archicad. With --stable only the values    #
+# that changed are written (and printed on a dry run). Before writing, checkValues stops the   #
+# run if a planned number is already held by another element or overflows its story (see       #
+# kaa/validate.py); --no-validate skips the check. Writes are journaled (kaa/journal.py).      #
+################################################################################################
+
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from kaa.fastpath import RawCommands
+from kaa.journal import journalOf
+from kaa.numbering import NumberingError
+from kaa.query import KAA_CLASSIFICATIONS, Query, runQueries
+from kaa.segmentation import assignBuildings
+from kaa.stories import StoryTable, fetchStoryTable, levelRecords
+from kaa.validate import MAX_INDEX, ExistingValue, describeCollisions, findCollisions, findOverflows
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def printValues(pairs: Iterable[Tuple[Any, Any]]) -> None:
+    # Function: prints (element, value) pairs ordered by value
+    for pair in sorted(pairs, key=lambda p: (p[1] is None, p[1] or '')):
+        print(pair)
+
+
+def printUnchanged(values: Sequence[Tuple[str, str]], writes: Sequence[Tuple[str, str]]) -> None:
+    # Function: how many of the numbers a stable renumbering kept
+    print(f"{len(values) - len(writes)} of {len(values)} number(s) unchanged, {len(writes)} to write")
+
+
+def segmentBuildings(records, args) -> None:
+    # Function: gives records without a BuildingNumber the building of their footprint group (--building-gap 0: leave them,
+    # the numberers then stop and ask for the BuildingNumber as before)
+    if (args.building_gap > 0):
+        assigned = assignBuildings(records, args.building_gap)
+        if (assigned):
+            print(f"{assigned} element(s) without a BuildingNumber numbered by footprint clustering")
+
+
+def readStories(conn, args) -> Optional[StoryTable]:
+    # Function: the project's story table with --stories-from table, None with --stories-from property (StoryNumber required)
+    if (args.stories_from != "table"):
+        return None
+    stories = fetchStoryTable(conn)
+    if (len(stories) == 0):
+        raise NumberingError("No stories found in the Project Map. Run with --stories-from property to use the StoryNumber of each element.")
+    return stories
+
+
+def storyCount(args, stories: Optional[StoryTable]) -> int:
+    # Function: the number of stories to number, StoryNumber 0..count-1 (up to the highest floor of the table with --stories-from table)
+    return args.stories if stories is None else max([args.stories] + [n + 1 for n in stories.floorNumbers])
+
+
+def prepareRecords(records, args, stories: Optional[StoryTable] = None) -> None:
+    # Function: fills in the story (from the story table, for records without a StoryNumber) and then the building
+    # (segmentBuildings) of records the model does not give them
+    if (stories is not None):
+        leveled = levelRecords(records, stories, args.story_tolerance)
+        below = [r for r in leveled if r.story < 0]
+        if (below):
+            raise NumberingError(f"{len(below)} element(s) without a StoryNumber (e.g. {below[0].guid}) are on a story below the ground floor "
+                                 f"(floor {below[0].story}), which StoryNumber 0..stories-1 cannot number. Set their StoryNumber by hand.")
+        if (leveled):
+            print(f"{len(leveled)} element(s) without a StoryNumber put on their story by level")
+    segmentBuildings(records, args)
+
+
+def projectFile(conn) -> Optional[str]:
+    # Function: the path of the open project file, None if it is untitled, a Teamwork project or the Tapir add-on (the only
+    # way to ask Archicad for it) is not installed
+    act = conn.types
+    commandId = act.AddOnCommandId("TapirCommand", "GetProjectInfo")
+    try:
+        if (not conn.commands.IsAddOnCommandAvailable(commandId)):
+            return None
+        info = conn.commands.ExecuteAddOnCommand(commandId) or {}
+    except Exception:
+        return None
+    if (info.get("isUntitled") or info.get("isTeamwork") or not info.get("projectLocation")):
+        return None
+    return info["projectLocation"]
+
+
+def projectElementIds(conn) -> Iterator[ExistingValue]:
+    # Function: (GUID, "Door" or "Window", General_ElementID) of every door and window in the project, read in one property fetch
+    classes = ["Door", "Window"]
+    queries = [Query().classified(KAA_CLASSIFICATIONS, c).withColumns("elementId") for c in classes]
+    try:
+        results = runQueries(conn, *queries)
+    except LookupError:
+        # a class missing from the classification system has no elements; the others are read one by one
+        (classes, results) = ([], [])
+        for (elementClass, query) in zip(["Door", "Window"], queries):
+            try:
+                results.append(query.run(conn))
+                classes.append(elementClass)
+            except LookupError as error:
+                print(f"{error}, its elements are not checked")
+    for (elementClass, result) in zip(classes, results):
+        for (guid, value) in zip(result.guids(), result.columns["elementId"].tolist()):
+            yield (guid, elementClass, value)
+
+
+def checkValues(args, values: Sequence[Tuple[str, str]], existing: Iterable[ExistingValue], plannedClass: str,
+                storyOf: Optional[Dict[str, Optional[int]]] = None) -> None:
+    # Function: prints the numbers more than one element would hold and the indexes past MAX_INDEX, and raises NumberingError
+    # if a planned number clashes with another element's or overflows its story (on a dry run they are only printed)
+    if (not args.validate):
+        return
+    overflows = findOverflows(values, storyOf or {}, args.prefix)
+    collisions = findCollisions(existing, values, plannedClass)
+    clashes = sum(1 for c in collisions if c.clashes())
+    for line in describeCollisions(collisions):
+        print(f"Duplicate number {line}")
+    for (guid, value) in overflows:
+        print(f"Number {value!r} of {guid} is past element {MAX_INDEX} of its story and reads as another story's number")
+    if (len(collisions) > clashes):
+        print(f"{len(collisions) - clashes} duplicate number(s) given by this run to several elements or already in the project, not stopping")
+    if ((clashes or overflows) and not args.dry_run):
+        raise NumberingError(f"Nothing written: {clashes} number(s) already held by another element and {len(overflows)} overflowing "
+                             f"their story. Use a --prefix, renumber the other elements, or run with --no-validate to write anyway.")
+
+
+def writeValues(conn, propertyId, values: Sequence[Tuple[str, str]], dryRun: bool = False, previous: Optional[Dict[str, Any]] = None) -> None:
+    # Function: sets the string property of every element in one call; with a journal on the connection (kaa/journal.py) the
+    # previous values are recorded first, from previous ({guid: current value}, e.g. the existing values of --stable) if given,
+    # else read in one fetch
+    if (dryRun or len(values) == 0):
+        return
+    journal = journalOf(conn)
+    if (journal is not None):
+        if (previous is None):
+            guids = [guid for (guid, _) in values]
+            previous = dict(zip(guids, RawCommands(conn).GetPropertyValuesOfElements(guids, [propertyId])[0].tolist()))
+        journal.record(str(propertyId.guid), values, previous)
+    act = conn.types
+    conn.commands.SetPropertyValuesOfElements([
+        act.ElementPropertyValue(act.ElementId(guid), propertyId, act.NormalStringPropertyValue(value)) for (guid, value) in values])
+
+
+def reportValues(conn, elements: List[Any], propertyId, values: Sequence[Tuple[str, str]], dryRun: bool = False) -> None:
+    # Function: prints the property value of every element as read back from Archicad (the planned values on a dry run)
+    if (dryRun):
+        print(f"Dry run - {len(values)} value(s) not written:")
+        printValues(values)
+        return
+    if (len(elements) == 0):
+        return
+    guids = [str(e.elementId.guid) for e in elements]
+    (newValues,) = RawCommands(conn).GetPropertyValuesOfElements(guids, [propertyId])
+    printValues(zip(guids, newValues.tolist()))
+
+#######################################################################################################
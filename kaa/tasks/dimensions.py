@@ -0,0 +1,103 @@
+######################################### General Info #########################################
+# Written by: Jessica Wood  w/ Meghan Beckmann, for KAA Design Group                           #
+# Date Created: 09/2022                                                                        #
+# Date Modified: 05/2023 Meghan Beckmann & Jessica Wood                                        #
+# Date Modified: 10/2026    moved out of Dimension_Zones_Angles_v2.py                          #
+#                                                                                              #
+# Description:                                                                                 #
+# Writes the length and width (feet-inches) of the selected zones (all zones if none are      #
+# selected) into the user-defined property "ZoneDimension", from each zone's 2D bounding box   #
+# and its user-entered "ZoneAngle". Zones whose rounded 2D bounding box and ZoneAngle are the  #
+# same as when their dimension was last written, and that still hold that dimension (read in   #
+# the same request), are skipped. The cache is kept next to the project file (--cache FILE);   #
+# --no-cache recomputes and writes every zone.                                                 #
+################################################################################################
+
+
+import math
+import os
+
+from kaa.cache import KeyCache, roundedKey
+from kaa.numbering import dimensionString, zoneDimensions
+from kaa.query import Query
+from kaa.tasks.common import printValues, projectFile, writeValues
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+DIMENSION_CACHE_VERSION = "zone-dimensions-2"      # change when zoneDimensions or dimensionString change their results
+DIMENSION_CACHE_SUFFIX = "_kaa_dimensions.json"    # cache next to the project file: <project name><suffix>
+DIMENSION_CACHE_FILE = "kaa_dimensions_cache.json"  # in the working directory, when the project file is not known
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def cachePath(conn, args) -> str:
+    # Function: --cache, else the cache next to the project file, else the one in the working directory
+    if (args.cache):
+        return args.cache
+    project = projectFile(conn)
+    if (project is None):
+        print(f"Project file unknown (untitled, Teamwork or no Tapir add-on), using {DIMENSION_CACHE_FILE} in the working directory")
+        return DIMENSION_CACHE_FILE
+    return os.path.splitext(project)[0] + DIMENSION_CACHE_SUFFIX
+
+
+def run(conn, args, tracer) -> int:
+    # the selected zones (all zones if nothing is selected) with their 2D bounding box, ZoneAngle and current ZoneDimension
+    tracer.mark("fetch")
+    result = Query().ofType("Zone").withinSelection().withColumns("zoneAngle", "zoneDimension").withBoundingBoxes("2D").run(conn)
+    propertyId = result.propertyIds["zoneDimension"]
+    current = dict(zip(result.guids(), result.columns["zoneDimension"].tolist()))
+
+    tracer.mark("order")
+    cache = KeyCache.load(cachePath(conn, args), DIMENSION_CACHE_VERSION)
+    values = []
+    keys = {}
+    failed = []
+    skipped = 0
+    for (guid, (xMin, yMin, xMax, yMax), angle) in zip(result.guids(), result.boxes.tolist(), result.columns["zoneAngle"]):
+        if (math.isnan(xMin)):
+            failed.append(guid)
+            continue
+        key = roundedKey(xMin, yMin, xMax, yMax, angle)
+        if (not args.no_cache and not cache.changed(guid, key, current[guid])):
+            skipped += 1
+            continue
+        boxWidth = abs(xMax - xMin)    ### x axis is up-down
+        boxLength = abs(yMax - yMin)   ### y axis is left-right
+
+        # users should input angles between 0 and 44.99 (<45), no angle means 0 degrees
+        (dimensions, notes) = zoneDimensions(boxWidth, boxLength, angle or 0)
+        print(notes)
+        if (dimensions is not None):
+            values.append((guid, dimensionString(*dimensions)))
+            keys[guid] = key
+        else:
+            failed.append(guid)
+    if (skipped):
+        print(f"{skipped} zone(s) unchanged since the last run, skipped")
+
+    tracer.mark("write")
+    writeValues(conn, propertyId, values, args.dry_run, current)
+    if (args.dry_run):
+        printValues(values)
+    else:
+        for (guid, value) in values:
+            cache.update(guid, keys[guid], value)
+        cache.forget(failed)
+        cache.save()
+
+    print()
+    print("* ANGLE SHOULD BE LESS THAN 45 DEGREES")
+    print("* FORMULA CANNOT CALCULATE 45 DEGREE ANGLES;")
+    print("  IF 45, MEASURE MANUALLY OR TEMPORARILY ROTATE ZONES TO 0 DEGREES")
+    return 0
+
+#######################################################################################################
@@ -0,0 +1,112 @@
+######################################### General Info #########################################
+# Written by: Jessica Wood  w/ Meghan Beckmann, for KAA Design Group                           #
+# Date Created: 09/2022                                                                        #
+# Date Modified: 10/2026    both interior door scripts as one task (kaa doors --by ...)        #
+#                                                                                              #
+# Description:                                                                                 #
+# Generates unique ordered interior door element IDs for the selected doors (all doors        #
+# classified as Door in KAA CLASSIFICATIONS if none are selected). --by distance numbers per  #
+# story and building by distance from the user-defined property "First_Door" (101, 102, ...);  #
+# --by zone gives every door its related zone's number plus a letter (101a, 101b, ...).         #
+# --stable (by distance only) keeps as many of the current IDs as the new order allows.        #
+# --watch (by distance only) keeps renumbering as the doors change, see kaa/watch.py.         #
+# Doors without a BuildingNumber get one from footprint clustering (kaa/segmentation.py).     #
+# Doors without a StoryNumber go on the Project Map story of their level (kaa/stories.py).     #
+# IDs another door or window already has stop the run before writing (kaa/validate.py).        #
+################################################################################################
+
+
+from kaa.numbering import NO_ZONE_NUMBER, changedValues, letterDoorsByZone, numberDoorsByDistance
+from kaa.query import KAA_CLASSIFICATIONS, Query
+from kaa.tasks.common import checkValues, printUnchanged, projectElementIds, prepareRecords, readStories, reportValues, storyCount, writeValues
+from kaa.watch import watchRecords
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def interiorDoors(*columns: str) -> Query:
+    # Function: the selected doors (all doors if nothing is selected) that are "Interior", with the given columns
+    return (Query().classified(KAA_CLASSIFICATIONS, "Door").preferSelection()
+            .resolve("elementId").withColumns("position", *columns)
+            .where("position", "==", "Interior"))
+
+
+def watchByDistance(conn, args, tracer) -> int:
+    # the candidate doors and their boxes are polled; changed story/building groups are renumbered and written
+    sources = Query().classified(KAA_CLASSIFICATIONS, "Door").preferSelection().withBoundingBoxes()
+    query = interiorDoors("story", "building", "firstDoor", "elementId").withBoundingBoxes()
+    stories = readStories(conn, args)
+    number = lambda records, current: numberDoorsByDistance(records, storyCount(args, stories), args.prefix, current if args.stable else None)
+    return watchRecords(conn, args, tracer, sources, query, number, "Door", lambda records: prepareRecords(records, args, stories))
+
+
+def runByDistance(conn, args, tracer) -> int:
+    tracer.mark("fetch")
+    stories = readStories(conn, args)
+    query = interiorDoors("story", "building", "firstDoor").withBoundingBoxes()
+    if (args.stable):
+        query.withColumns("elementId")   # the current IDs, read in the same request
+    result = query.run(conn)
+    propertyId = result.propertyIds["elementId"]
+    existing = dict(zip(result.guids(), result.columns["elementId"])) if args.stable else None
+
+    tracer.mark("group")
+    records = result.records()
+    prepareRecords(records, args, stories)
+
+    tracer.mark("order")
+    values = numberDoorsByDistance(records, storyCount(args, stories), args.prefix, existing)
+
+    tracer.mark("validate")
+    checkValues(args, values, projectElementIds(conn), "Door", {r.guid: r.story for r in records})
+
+    tracer.mark("write")
+    writes = changedValues(values, existing)
+    if (args.stable):
+        printUnchanged(values, writes)
+    writeValues(conn, propertyId, writes, args.dry_run, existing)
+
+    tracer.mark("report")
+    reportValues(conn, result.elements, propertyId, writes, args.dry_run)
+    return 0
+
+
+def runByZone(conn, args, tracer) -> int:
+    tracer.mark("fetch")
+    result = interiorDoors("relatedZone").run(conn)
+    propertyId = result.propertyIds["elementId"]
+
+    tracer.mark("group")
+    doorZones = []
+    for (guid, zoneNumber) in zip(result.guids(), result.columns["relatedZone"]):
+        if (not zoneNumber):
+            # no zone related found! the door gets the default zone number
+            print(f"No zone related to door {guid} found! Default Zone number for this door is {NO_ZONE_NUMBER}\n")
+            zoneNumber = NO_ZONE_NUMBER
+        doorZones.append((guid, zoneNumber))
+
+    tracer.mark("order")
+    values = letterDoorsByZone(doorZones)
+
+    tracer.mark("validate")
+    checkValues(args, values, projectElementIds(conn), "Door")
+
+    tracer.mark("write")
+    writeValues(conn, propertyId, values, args.dry_run)
+
+    tracer.mark("report")
+    reportValues(conn, result.elements, propertyId, values, args.dry_run)
+    return 0
+
+
+def run(conn, args, tracer) -> int:
+    if (args.by == "zone"):
+        if (args.watch):
+            print("--watch only numbers doors by distance")
+            return -1
+        return runByZone(conn, args, tracer)
+    return watchByDistance(conn, args, tracer) if args.watch else runByDistance(conn, args, tracer)
+
+#######################################################################################################
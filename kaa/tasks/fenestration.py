@@ -0,0 +1,86 @@
+######################################### General Info #########################################
+# Written by: Jessica Wood  w/ Meghan Beckmann, for KAA Design Group                           #
+# Date Created: 09/2022                                                                        #
+# Date Modified: 10/2026    moved out of Number_Modern_A040-ExteriorFenestration_v1.py         #
+#                                                                                              #
+# Description:                                                                                 #
+# Generates unique ordered exterior door and window element IDs for the selected doors and    #
+# windows (all of them if none are selected). Numbering starts at a "First_Door" or            #
+# "First_Window" and goes clockwise around the perimeter of each building on each story.      #
+# --stable keeps as many of the current IDs as the new order allows, --watch keeps renumbering #
+# as the doors and windows change (kaa/watch.py). Doors and windows without a BuildingNumber   #
+# get one from footprint clustering (kaa/segmentation.py). IDs another door or window already  #
+# has stop the run before writing (kaa/validate.py). Elements without a StoryNumber are put on #
+# the Project Map story of their level (kaa/stories.py).                                       #
+################################################################################################
+
+
+from kaa.numbering import changedValues, numberFenestration
+from kaa.query import KAA_CLASSIFICATIONS, Query
+from kaa.tasks.common import checkValues, printUnchanged, projectElementIds, prepareRecords, readStories, reportValues, storyCount, writeValues
+from kaa.watch import watchRecords
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+# the properties read for every door/window (record fields, see kaa/records.py)
+RECORD_FIELDS = ["position", "story", "building", "side", "firstDoor", "firstWindow"]
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def exteriorOpenings() -> Query:
+    # Function: selected doors/windows (all of them if nothing is selected) that are "Exterior", with everything the walk needs
+    return (Query().classified(KAA_CLASSIFICATIONS, "Door", "Window").preferSelection()
+            .resolve("elementId").withColumns(*RECORD_FIELDS).withBoundingBoxes()
+            .where("position", "==", "Exterior"))
+
+
+def watch(conn, args, tracer) -> int:
+    # the candidate doors/windows and their boxes are polled; changed story/building groups are renumbered and written
+    sources = Query().classified(KAA_CLASSIFICATIONS, "Door", "Window").preferSelection().withBoundingBoxes()
+    query = exteriorOpenings().withColumns("elementId")
+    stories = readStories(conn, args)
+    number = lambda records, current: numberFenestration(records, storyCount(args, stories), args.prefix, current if args.stable else None)
+    return watchRecords(conn, args, tracer, sources, query, number, "Door/Window", lambda records: prepareRecords(records, args, stories))
+
+
+def run(conn, args, tracer) -> int:
+    if (args.watch):
+        return watch(conn, args, tracer)
+    tracer.mark("fetch")
+    stories = readStories(conn, args)
+    query = exteriorOpenings()
+    if (args.stable):
+        query.withColumns("elementId")   # the current IDs, read in the same request
+    result = query.run(conn)
+    propertyId = result.propertyIds["elementId"]
+    existing = dict(zip(result.guids(), result.columns["elementId"])) if args.stable else None
+
+    tracer.mark("group")
+    records = result.records()
+    prepareRecords(records, args, stories)
+
+    tracer.mark("order")
+    values = numberFenestration(records, storyCount(args, stories), args.prefix, existing)
+
+    tracer.mark("validate")
+    checkValues(args, values, projectElementIds(conn), "Door/Window", {r.guid: r.story for r in records})
+
+    tracer.mark("write")
+    writes = changedValues(values, existing)
+    if (args.stable):
+        printUnchanged(values, writes)
+    writeValues(conn, propertyId, writes, args.dry_run, existing)
+
+    tracer.mark("report")
+    reportValues(conn, result.elements, propertyId, writes, args.dry_run)
+    return 0
+
+#######################################################################################################
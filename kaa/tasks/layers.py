@@ -0,0 +1,121 @@
+######################################### General Info #########################################
+# Written by: Jessica Wood  w/ Meghan Beckmann, for KAA Design Group                           #
+# Date Created: 09/2022                                                                        #
+# Date Modified: 10/2026    moved out of the layer audit and layer folder scripts              #
+#                                                                                              #
+# Description:                                                                                 #
+# Layer naming audit and layer folder organisation with the shared rule table in               #
+# kaa/naming.py. The audit can also re-check the layer names stored in a snapshot report       #
+# (written by the attribute audit) without Archicad.                                            #
+################################################################################################
+
+
+from typing import Iterable
+
+from kaa.naming import LAYER_CLASSIFIER, LAYER_FOLDERS
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def layerNames(conn) -> Iterable[str]:
+    acc = conn.commands
+    return [layer.layerAttribute.name for layer in acc.GetLayerAttributes(acc.GetAttributesByType("Layer"))]
+
+
+def snapshotLayerNames(path: str) -> Iterable[str]:
+    from kaa.batch import readSnapshot   # only needed for snapshot audits
+    return [row["name"] for row in readSnapshot(path) if row.get("type") == "Layer"]
+
+
+def audit(conn, args, tracer) -> int:
+    # Print Info begin Auditing
+    print("Begin Auditing for Layer Names.")
+
+    tracer.mark("fetch")
+    names = snapshotLayerNames(args.snapshot) if args.snapshot else layerNames(conn)
+
+    # check the names against the shared rule table
+    tracer.mark("order")
+    hasError = False
+    for name in names:
+        if (not LAYER_CLASSIFIER.isCompliant(name)):
+            hasError = True
+            print(f"Layer: {name} does not match the naming convention!\n")
+
+    # Print End message
+    if (hasError):
+        print("Audit finished - please fix these names that don't match our standards!")
+    else:
+        print("Audit finished - no errors found, hooray! Nice layer management.")
+    return 0
+
+
+def organize(conn, args, tracer) -> int:
+    if (args.rebuild):
+        return rebuildFolders(conn, args, tracer)
+
+    from kaa.folders import syncAttributeFolders
+
+    # only create missing folders and move misfiled layers (AC27+)
+    tracer.mark("write")
+    plan = syncAttributeFolders(conn.commands, conn.types, "Layer", LAYER_CLASSIFIER.classify, LAYER_FOLDERS, dryRun=args.dry_run)
+    verb = "Would create" if args.dry_run else "Created"
+    for folder in plan.foldersToCreate:
+        print(f"{verb} folder: {folder}")
+    verb = "Would move" if args.dry_run else "Moved"
+    for (folder, guids) in plan.moves.items():
+        print(f"{verb} {len(guids)} layer(s) into: {folder}")
+    if (plan.isEmpty()):
+        print("Layer folders are already organised - nothing to move.")
+    return 0
+
+
+def rebuildFolders(conn, args, tracer) -> int:
+    # Function: the old process, rebuilds every folder through a DUMMY folder (the DUMMY folder process is broken in AC27)
+    acc = conn.commands
+    act = conn.types
+
+    tracer.mark("fetch")
+    layerAttributes = acc.GetAttributesByType("Layer")
+    layAttr = acc.GetLayerAttributes(layerAttributes)
+
+    # Put all attributes into their folder list using the shared rule table (ignored layers stay where they are)
+    attributesByFolder = {folder: [] for folder in LAYER_FOLDERS}
+    for (attributeId, folder) in zip(layerAttributes, LAYER_CLASSIFIER.classifyAll(l.layerAttribute.name for l in layAttr)):
+        if (folder is not None):
+            attributesByFolder[folder].append(attributeId)
+
+    if (args.dry_run):
+        for folder in LAYER_FOLDERS:
+            print(f"Would rebuild folder: {folder} ({len(attributesByFolder[folder])} layer(s))")
+        return 0
+
+    #Move attributes to DUMMY folder before starting sorting process
+    tracer.mark("write")
+    dummyFolder = act.AttributeFolder("Layer", attributeFolderId=layAttr[0].layerAttribute.attributeId.guid, path=["DUMMY"])
+    acc.CreateAttributeFolders([dummyFolder])
+
+    # Folder Names (order matters, folders are created in this order)
+    for folder in LAYER_FOLDERS:
+        layerFolder = act.AttributeFolder("Layer", attributeFolderId=layAttr[0].layerAttribute.attributeId.guid, path=[folder])
+        acc.CreateAttributeFolders([layerFolder])
+        newFolder = acc.GetAttributeFolder(layerFolder)
+
+        print(f"Created folder: {folder}")
+
+        attrFolderContent = acc.GetAttributeFolderContent(layerFolder)
+        if (len(attrFolderContent.attributeIds) > 0):
+            newDummyFolder = acc.GetAttributeFolder(dummyFolder)
+            acc.MoveAttributesAndFolders([], attrFolderContent.attributeIds, newDummyFolder)
+
+        # Move appropriate attributes to the new folder
+        if (len(attributesByFolder[folder]) > 0):
+            acc.MoveAttributesAndFolders([], attributesByFolder[folder], newFolder)
+
+    #Delete Dummy Folder
+    acc.DeleteAttributeFolders([dummyFolder])
+    return 0
+
+#######################################################################################################
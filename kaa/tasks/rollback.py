@@ -0,0 +1,68 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Undoes the writes of a journaled run (kaa/journal.py): the newest journal not rolled back    #
+# yet in --journal DIR, or the given file. The current values of the journaled elements are    #
+# read once per property and the previous values are restored in one                           #
+# SetPropertyValuesOfElements; elements changed again since the run are listed and kept        #
+# unless --force. Elements that had no value get an empty string.                              #
+################################################################################################
+
+
+import time
+import uuid
+
+from kaa.fastpath import RawCommands
+from kaa.journal import WriteJournal, latestJournal, rollbackValues
+from kaa.tasks.common import printValues
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def run(conn, args, tracer) -> int:
+    path = args.file or latestJournal(args.journal)
+    if (path is None):
+        print(f"No journal to roll back in {args.journal}")
+        return -1
+    journal = WriteJournal.load(path)
+    if (journal.rolledBack is not None and not args.force):
+        print(f"{path} was rolled back on {journal.rolledBack} (--force restores its previous values again)")
+        return -1
+    print(f"Rolling back {len(journal)} value(s) written by kaa {journal.command} on {journal.created} ({path})")
+
+    tracer.mark("fetch")
+    act = conn.types
+    raw = RawCommands(conn)
+    propertyIds = {key: act.PropertyId(uuid.UUID(key)) for key in journal.entries}
+    current = {}
+    for (key, elements) in journal.entries.items():
+        guids = list(elements)
+        (values,) = raw.GetPropertyValuesOfElements(guids, [propertyIds[key]])
+        current[key] = dict(zip(guids, values.tolist()))
+    (restore, changed) = rollbackValues(journal, current, args.force)
+    if (changed):
+        print(f"{len(changed)} element(s) changed since the run, not restored (--force restores them too):")
+        printValues((guid, value) for (_, guid, value) in changed)
+
+    tracer.mark("write")
+    if (args.dry_run):
+        print(f"Dry run - {len(restore)} value(s) not restored:")
+        printValues((guid, previous) for (_, guid, previous) in restore)
+        return 0
+    if (restore):
+        results = conn.commands.SetPropertyValuesOfElements([
+            act.ElementPropertyValue(act.ElementId(guid), propertyIds[key], act.NormalStringPropertyValue(previous or ''))
+            for (key, guid, previous) in restore])
+        failed = sum(1 for r in (results or []) if not getattr(r, "success", True))
+        if (failed):
+            print(f"{failed} value(s) could not be restored (elements deleted or locked?)")
+    journal.rolledBack = time.strftime("%Y-%m-%dT%H:%M:%S")
+    journal.save()
+    print(f"{len(restore)} value(s) restored")
+    return 0
+
+#######################################################################################################
@@ -0,0 +1,80 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Keeps a geometry store (kaa/store.py) in step with the model: kaa store-sync --store DIR    #
+# reads the bounding boxes of every zone, door and window and the StoryNumber, BuildingNumber, #
+# ExteriorSide and position of the doors and windows, and writes only the rows that changed;   #
+# elements no longer in the model are flagged deleted. Other commands then read the geometry  #
+# with --store DIR instead of fetching it.                                                     #
+################################################################################################
+
+
+import numpy as np
+
+from kaa.geometry import ELEMENT_DTYPE, FLAG_EXTERIOR, ElementTable, sideCode
+from kaa.query import KAA_CLASSIFICATIONS, Query, runQueries
+from kaa.store import GeometryStore
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+STORED_COLUMNS = ["story", "building", "side", "position"]   # door/window properties kept in the store
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def fetchRows(conn):
+    # Function: (GUIDs, ELEMENT_DTYPE rows) of every zone, door and window in the model, in two queries run together (their
+    # bounding boxes are fetched in one command)
+    (zones, openings) = runQueries(conn, Query().ofType("Zone").withBoundingBoxes(),
+                                   Query().classified(KAA_CLASSIFICATIONS, "Door", "Window").withColumns(*STORED_COLUMNS).withBoundingBoxes())
+
+    guids = zones.guids() + openings.guids()
+    table = ElementTable.fromBoxes(zones.elements + openings.elements, np.concatenate([zones.boxes, openings.boxes]))
+    rows = slice(len(zones), None)
+    table.data["story"][rows] = [-1 if v is None else int(v) for v in openings.columns["story"]]
+    table.data["building"][rows] = [-1 if v is None else int(v) for v in openings.columns["building"]]
+    table.data["side"][rows] = [sideCode(v) for v in openings.columns["side"]]
+    table.data["flags"][rows] |= np.where(openings.columns["position"] == "Exterior", FLAG_EXTERIOR, 0).astype("u1")
+    return (guids, table.data)
+
+
+def sameRows(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # Function: rows of two ELEMENT_DTYPE arrays that hold the same values (NaN boxes of elements without geometry are equal)
+    same = np.ones(len(a), dtype=bool)
+    for field in ELEMENT_DTYPE.names:
+        equal = a[field] == b[field]
+        if (a[field].dtype.kind == "f"):
+            equal |= np.isnan(a[field]) & np.isnan(b[field])
+        same &= equal
+    return same
+
+
+def sync(conn, args, tracer) -> int:
+    tracer.mark("fetch")
+    (guids, data) = fetchRows(conn)
+
+    tracer.mark("write")
+    store = GeometryStore.openOrCreate(args.store)
+    rows = store.rowsOf(guids)
+    known = rows >= 0
+    changed = ~known
+    changed[known] = ~sameRows(store.data[rows[known]], data[known])
+    if (not args.dry_run):
+        store.markSynced()
+        store.upsert([guids[i] for i in np.flatnonzero(changed)], data[changed])
+        removed = store.remove(sorted(set(store.guids[store.liveRows()].tolist()) - set(guids)))
+    else:
+        removed = len(set(store.guids[store.liveRows()].tolist()) - set(guids))
+    print(f"{args.store}: {int((~known).sum())} added, {int(changed.sum() - (~known).sum())} changed, {removed} removed, {len(guids)} elements")
+    return 0
+
+#######################################################################################################
@@ -0,0 +1,198 @@
+######################################### General Info #########################################
+# Written by: Jessica Wood  w/ Meghan Beckmann, for KAA Design Group                           #
+# Date Created: 09/2022                                                                        #
+# Date Modified: 10/2026    both zone numbering scripts as one task (kaa zones --from ...)     #
+#                                                                                              #
+# Description:                                                                                 #
+# Generates unique ordered zone numbers for the selected zones (all zones if none are          #
+# selected). Zones are put on the Project Map story their zMin is on (kaa/stories.py; zMin     #
+# clusters with --stories-from zmin) and numbered from the user-defined zone property          #
+# "First_Zone", either by distance from it (--from first) or by closest distance to the zone   #
+# numbered last (--from previous). --stable keeps as many of the current numbers as the new    #
+# order allows; --watch keeps renumbering the stories whose zones change (kaa/watch.py).       #
+# --store DIR reads the zone boxes from a geometry store (kaa/store.py).                       #
+# Numbers another zone already has stop the run before writing (kaa/validate.py).              #
+################################################################################################
+
+
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from kaa.fastpath import RawCommands
+from kaa.geometry import FLAG_ENTRY, FLAG_NO_GEOMETRY, FLAG_SELECTED, GUID_DTYPE, ElementTable, clusterStories, orderByDistance, orderByPrevious
+from kaa.numbering import NumberingError, changedValues, numberGroup
+from kaa.query import Query
+from kaa.stories import fetchStoryTable
+from kaa.tasks.common import checkValues, printUnchanged, printValues, reportValues, writeValues
+from kaa.watch import IncrementalNumbering, boxSignature, outsideNumbering, runWatch
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+STORY_GROUPING_LIMIT = 1
+ORDERINGS = {"first": orderByDistance, "previous": orderByPrevious}
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def numberZoneTable(table: ElementTable, rows: np.ndarray, orderFrom: str = "first", prefix: str = '',
+                    existing: Optional[Dict[str, Optional[str]]] = None) -> List[Tuple[str, str]]:
+    # Function: zone numbers of the given rows per story (table "story" column), starting from the FLAG_ENTRY row of each story
+    # (the last one wins if several are set). Stories without rows are skipped but keep their index. Given the existing
+    # zone numbers, keeps as many of them as the new order allows (see kaa/stable.py).
+    order = ORDERINGS[orderFrom]
+    isEntry = table.hasFlag(FLAG_ENTRY)
+    values = []
+    for ((storyIndex,), zonesOnStory) in table.groups(["story"], rows).items():
+        entryRows = zonesOnStory[isEntry[zonesOnStory]]
+        if (len(entryRows) == 0):
+            raise NumberingError(f"No First_Zone found on {storyIndex} story. Ensure you have set an entry Zone for each story.")
+        values.extend(numberGroup(storyIndex, [str(table.guids[row]) for row in order(table, zonesOnStory, entryRows[-1])], prefix, existing))
+    return values
+
+
+def storedZoneTable(conn, path: str, zoneElements, dryRun: bool = False) -> ElementTable:
+    # Function: the zone table from a geometry store (kaa/store.py); only zones the store does not have yet are fetched
+    # (and added to it, unless dryRun). Zones moved since the last kaa store-sync keep their stored boxes.
+    from kaa.store import META_FILE, GeometryStore
+    guids = [str(e.elementId.guid) for e in zoneElements]
+    if (dryRun and not os.path.exists(os.path.join(path, META_FILE))):
+        print(f"{path} is not a geometry store yet and --dry-run does not create it; every zone box is fetched")
+        return ElementTable.fromBoxes(zoneElements, RawCommands(conn).GetBoundingBoxes(guids))
+    store = GeometryStore.open(path) if dryRun else GeometryStore.openOrCreate(path)
+    rows = store.rowsOf(guids, live=True)
+    missing = np.flatnonzero(rows < 0)
+    table = ElementTable(list(zoneElements), ElementTable.empty(len(rows)), np.array(guids, dtype=GUID_DTYPE))
+    stored = np.flatnonzero(rows >= 0)
+    table.data[stored] = store.data[rows[stored]]
+    if (len(missing)):
+        newZones = [zoneElements[i] for i in missing]
+        fetched = ElementTable.fromBoxes(newZones, RawCommands(conn).GetBoundingBoxes([guids[i] for i in missing]))
+        table.data[missing] = fetched.data
+        if (not dryRun):
+            store.upsert(fetched.guids, fetched.data)
+    if (store.synced is None):
+        print(f"{len(stored)} zone box(es) from {path}, which kaa store-sync never updated; {len(missing)} fetched")
+    else:
+        synced = time.strftime("%Y-%m-%d %H:%M", time.localtime(store.synced))
+        hours = (time.time() - store.synced) / 3600
+        print(f"{len(stored)} zone box(es) from {path}, last kaa store-sync {synced} ({hours:.1f} h ago); {len(missing)} fetched")
+    if (len(stored)):
+        print("zones moved since they were stored keep their stored boxes: run kaa store-sync after moving zones")
+    return table
+
+
+def fetchZones(conn, args, withNumbers: bool = False):
+    # Function: (zone table with story and FLAG_ENTRY set, rows to number, elements to report, Zone_ZoneNumber property id,
+    # {guid: current zone number} of the rows to number or None if not withNumbers)
+    acc = conn.commands
+    acu = conn.utilities
+    raw = RawCommands(conn)
+
+    propertyId = acu.GetBuiltInPropertyId('Zone_ZoneNumber')
+    entryPropertyId = acu.GetUserDefinedPropertyId("KAA Python", "First_Zone")
+    allZoneElements = acc.GetElementsByType('Zone')
+    selectedElements = acc.GetSelectedElements()
+
+    # -- positions are based on zone stamp -- #
+    if (getattr(args, "store", None)):
+        zoneTable = storedZoneTable(conn, args.store, allZoneElements, args.dry_run)
+    else:
+        zoneTable = ElementTable.fromBoxes(allZoneElements, raw.GetBoundingBoxes([str(e.elementId.guid) for e in allZoneElements]))
+    if (args.stories_from == "table"):
+        zoneTable.data["story"] = fetchStoryTable(conn).storyIndexes(zoneTable.data["zMin"], args.story_tolerance)
+    else:
+        zoneTable.data["story"] = clusterStories(zoneTable.data["zMin"], args.story_limit)[0]
+
+    # number only the selected zones, all zones if nothing is selected
+    elements = allZoneElements if len(selectedElements) == 0 else selectedElements
+    zoneTable.setFlag(FLAG_SELECTED, slice(None) if len(selectedElements) == 0 else zoneTable.rowsOf(elements))
+    rowsToNumber = np.flatnonzero(zoneTable.hasFlag(FLAG_SELECTED) & ~zoneTable.hasFlag(FLAG_NO_GEOMETRY))
+
+    # First_Zone (and the current zone number if needed) of every zone to number, in one fetch
+    guids = zoneTable.guids[rowsToNumber].tolist()
+    columns = raw.GetPropertyValuesOfElements(guids, [entryPropertyId] + ([propertyId] if withNumbers else []))
+    zoneTable.setFlag(FLAG_ENTRY, rowsToNumber[np.array([v == True for v in columns[0]], dtype=bool)])
+    existing = None
+    if (withNumbers):
+        existing = dict(zip(guids, columns[1].tolist()))
+    return (zoneTable, rowsToNumber, elements, propertyId, existing)
+
+
+def projectZoneNumbers(conn, zoneTable: ElementTable, propertyId) -> Iterator[Tuple[str, str, Optional[str]]]:
+    # Function: (GUID, "Zone", Zone_ZoneNumber) of every zone in the table (all zones of the project), read in one fetch
+    guids = [str(g) for g in zoneTable.guids]
+    (numbers,) = RawCommands(conn).GetPropertyValuesOfElements(guids, [propertyId])
+    for (guid, number) in zip(guids, numbers.tolist()):
+        yield (guid, "Zone", number)
+
+
+def watch(conn, args, tracer) -> int:
+    # the zones (or the selection) and their boxes are polled; stories with changed zones are renumbered and written
+    sources = Query().ofType("Zone").preferSelection().withBoundingBoxes()
+    propertyIds = {}
+
+    def signal() -> int:
+        with tracer.phase("poll"):
+            result = sources.run(conn)
+        return boxSignature(result.guids(), result.boxes)
+
+    def fetch():
+        (zoneTable, rows, elements, propertyIds["zoneNumber"], current) = fetchZones(conn, args, withNumbers=True)
+        data = zoneTable.data
+        state = {str(zoneTable.guids[row]): (int(data["story"][row]), hash(tuple(data[row].tolist()))) for row in rows}
+        return (state, current, (zoneTable, rows))
+
+    def number(context, stories) -> List[Tuple[str, str]]:
+        (zoneTable, rows) = context
+        rows = rows[np.isin(zoneTable.data["story"][rows], sorted(stories))]
+        return numberZoneTable(zoneTable, rows, args.order, args.prefix, numbering.current if args.stable else None)
+
+    def write(writes: List[Tuple[str, str]], context):
+        (zoneTable, rows) = context
+        if (args.dry_run):
+            printValues(writes)
+        if (writes):
+            storyOf = {str(zoneTable.guids[row]): int(zoneTable.data["story"][row]) for row in rows}
+            checkValues(args, writes, outsideNumbering(projectZoneNumbers(conn, zoneTable, propertyIds["zoneNumber"]), numbering.current, writes),
+                        "Zone", storyOf)
+        writeValues(conn, propertyIds["zoneNumber"], writes, args.dry_run, numbering.current)
+
+    numbering = IncrementalNumbering(fetch, number, write, tracer)
+    return runWatch(args, signal, numbering)
+
+
+def run(conn, args, tracer) -> int:
+    if (args.watch):
+        return watch(conn, args, tracer)
+
+    tracer.mark("fetch")
+    (zoneTable, rowsToNumber, elements, propertyId, existing) = fetchZones(conn, args, withNumbers=args.stable)
+
+    tracer.mark("order")
+    values = numberZoneTable(zoneTable, rowsToNumber, args.order, args.prefix, existing)
+
+    tracer.mark("validate")
+    storyOf = {str(zoneTable.guids[row]): int(zoneTable.data["story"][row]) for row in rowsToNumber}
+    checkValues(args, values, projectZoneNumbers(conn, zoneTable, propertyId), "Zone", storyOf)
+
+    tracer.mark("write")
+    writes = changedValues(values, existing)
+    if (args.stable):
+        printUnchanged(values, writes)
+    writeValues(conn, propertyId, writes, args.dry_run, existing)
+
+    tracer.mark("report")
+    reportValues(conn, elements, propertyId, writes, args.dry_run)
+    return 0
+
+#######################################################################################################
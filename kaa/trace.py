@@ -0,0 +1,272 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Timing instrumentation for the scripts. When tracing is on (script run with --trace [path]  #
+# or the KAA_TRACE environment variable set to 1 or a path) every Archicad command is timed    #
+# twice: on the wire (request + JSON decoding, via post_command) and as the typed call         #
+# (including the archicad package building its result objects), with call counts, element     #
+# counts and approximate payload bytes. Scripts mark their phases (fetch, group, order,        #
+# write). At the end a Chrome trace (open in chrome://tracing or ui.perfetto.dev) is written   #
+# and a summary table printed. When tracing is off, startTracing returns a tracer whose       #
+# methods do nothing and the connection is left untouched.                                     #
+#                                                                                              #
+#   tracer = startTracing(conn)                                                                #
+#   acc = conn.commands                                                                        #
+#   tracer.mark("fetch") ... tracer.mark("order") ... tracer.finish()                          #
+################################################################################################
+
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from kaa.connection import installPostCommand
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+TRACE_FLAG = "--trace"
+TRACE_ENVIRONMENT_VARIABLE = "KAA_TRACE"
+DEFAULT_TRACE_PATH = "kaa_trace.json"
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+def _now() -> float:
+    return time.perf_counter() * 1e6   # Chrome traces use microseconds
+
+
+def countElements(value: Any) -> int:
+    # Function: size of the largest list among a call's arguments or result (how many elements a command touched)
+    if (isinstance(value, (list, tuple))):
+        return len(value)
+    if (isinstance(value, dict)):
+        return max([countElements(v) for v in value.values() if isinstance(v, (list, tuple))], default=0)
+    return 0
+
+
+def commandName(jsonStr: str) -> str:
+    # Function: reads the command name from the request body without decoding all of it
+    start = jsonStr.find('"command"')
+    if (start < 0):
+        return "unknown"
+    start = jsonStr.find('"', jsonStr.find(":", start)) + 1
+    name = jsonStr[start:jsonStr.find('"', start)]
+    return name[4:] if name.startswith("API.") else name
+
+
+class CommandStats:
+    __slots__ = ("calls", "wireTime", "callTime", "typedCalls", "maxTime", "elements", "bytesOut", "bytesIn")
+
+    def __init__(self):
+        self.calls = 0          # requests sent
+        self.wireTime = 0.0     # round trip + JSON decoding (us)
+        self.callTime = 0.0     # typed calls made through conn.commands (us)
+        self.typedCalls = 0
+        self.maxTime = 0.0
+        self.elements = 0
+        self.bytesOut = 0
+        self.bytesIn = 0
+
+
+class TracedCommands:
+    # Class: stands in for conn.commands (or conn.utilities) and times every call
+    # __wrapped__ keeps the original so kaa.connection can still find the release's commands module.
+
+    def __init__(self, target, tracer: "Tracer", category: str):
+        self.__wrapped__ = target
+        self._tracer = tracer
+        self._category = category
+
+    def __getattr__(self, name: str):
+        function = getattr(self.__wrapped__, name)
+        if (not callable(function)):
+            return function
+        tracer, category = self._tracer, self._category
+
+        def call(*args, **kwargs):
+            start = _now()
+            result = function(*args, **kwargs)
+            tracer.recordCall(name, category, start, _now() - start, max([countElements(a) for a in args] + [countElements(result)]))
+            return result
+
+        call.__name__ = name
+        return call
+
+
+class Tracer:
+    # Class: collects phase spans and command timings and exports them as a Chrome trace and a summary table
+
+    enabled = True
+
+    def __init__(self, path: str = DEFAULT_TRACE_PATH):
+        self.path = path
+        self.events: List[Dict[str, Any]] = []
+        self.commands: Dict[str, CommandStats] = {}
+        self.phases: Dict[str, List[float]] = {}   # name -> [count, total us]
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        self._start = _now()
+        self._openPhase = None
+        self._finished = False
+        self._detach = []         # undoes attach, run by finish
+
+    def attach(self, conn):
+        # Function: times every request of the connection and swaps conn.commands/conn.utilities for timed stand-ins
+        def wrap(postCommand):
+            def tracedPostCommand(req, jsonStr):
+                start = _now()
+                response = postCommand(req, jsonStr)
+                self.recordRequest(commandName(jsonStr), start, _now() - start, len(jsonStr), response)
+                return response
+            return tracedPostCommand
+        self._detach.append(installPostCommand(conn, wrap))
+        (commands, utilities) = (conn.commands, conn.utilities)
+        conn.commands = TracedCommands(commands, self, "command")
+        conn.utilities = TracedCommands(utilities, self, "utility")
+        self._detach.append(lambda: (setattr(conn, "commands", commands), setattr(conn, "utilities", utilities)))
+        return conn
+
+    def _event(self, name: str, category: str, start: float, duration: float, args: Optional[Dict[str, Any]] = None):
+        event = {"name": name, "cat": category, "ph": "X", "ts": start - self._start, "dur": duration, "pid": self._pid, "tid": threading.get_ident()}
+        if (args):
+            event["args"] = args
+        self.events.append(event)
+
+    def recordRequest(self, name: str, start: float, duration: float, bytesOut: int, response: Any):
+        # the response is already decoded, its re-encoded length stands in for the bytes received
+        bytesIn = len(json.dumps(response, separators=(",", ":")))
+        with self._lock:
+            stats = self.commands.setdefault(name, CommandStats())
+            stats.calls += 1
+            stats.wireTime += duration
+            stats.maxTime = max(stats.maxTime, duration)
+            stats.bytesOut += bytesOut
+            stats.bytesIn += bytesIn
+            self._event(name, "roundtrip", start, duration, {"bytesOut": bytesOut, "bytesIn": bytesIn})
+
+    def recordCall(self, name: str, category: str, start: float, duration: float, elements: int):
+        with self._lock:
+            stats = self.commands.setdefault(name, CommandStats())
+            stats.typedCalls += 1
+            stats.callTime += duration
+            stats.elements += elements
+            self._event(name, category, start, duration, {"elements": elements})
+
+    def _closePhase(self):
+        if (self._openPhase is not None):
+            (name, start) = self._openPhase
+            self._endPhase(name, start)
+            self._openPhase = None
+
+    def _endPhase(self, name: str, start: float):
+        duration = _now() - start
+        with self._lock:
+            totals = self.phases.setdefault(name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += duration
+            self._event(name, "phase", start, duration)
+
+    def mark(self, name: str):
+        # Function: ends the current phase (if any) and starts the next one
+        self._closePhase()
+        self._openPhase = (name, _now())
+
+    @contextmanager
+    def phase(self, name: str):
+        # Function: times a nested block as a phase (for library code that should not end the script's current phase)
+        start = _now()
+        try:
+            yield
+        finally:
+            self._endPhase(name, start)
+
+    def summary(self) -> str:
+        # Function: plain text table of the phases and the commands, slowest first
+        lines = [f"{'PHASE':<28}{'count':>8}{'total ms':>12}"]
+        for (name, (count, total)) in sorted(self.phases.items(), key=lambda p: -p[1][1]):
+            lines.append(f"{name:<28}{count:>8}{total / 1000:>12.1f}")
+        lines.append("")
+        lines.append(f"{'COMMAND':<36}{'requests':>9}{'wire ms':>10}{'typed ms':>10}{'max ms':>9}{'elements':>10}{'KB out':>9}{'KB in':>9}")
+        for (name, s) in sorted(self.commands.items(), key=lambda c: -max(c[1].wireTime, c[1].callTime)):
+            lines.append(f"{name:<36}{s.calls:>9}{s.wireTime / 1000:>10.1f}{s.callTime / 1000:>10.1f}{s.maxTime / 1000:>9.1f}{s.elements:>10}{s.bytesOut / 1024:>9.1f}{s.bytesIn / 1024:>9.1f}")
+        return "\n".join(lines)
+
+    def finish(self):
+        # Function: closes the open phase, detaches from the connections, writes the Chrome trace and prints the summary (only once)
+        if (self._finished):
+            return
+        self._finished = True
+        self._closePhase()
+        for detach in reversed(self._detach):
+            detach()
+        self._detach = []
+        with open(self.path, "w", encoding="utf-8") as traceFile:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, traceFile)
+        print(self.summary())
+        print(f"Trace written to {self.path}")
+
+
+class NullTracer:
+    # Class: what startTracing returns when tracing is off, every method does nothing
+
+    enabled = False
+
+    def attach(self, conn):
+        return conn
+
+    def mark(self, name: str):
+        pass
+
+    @contextmanager
+    def phase(self, name: str):
+        yield
+
+    def summary(self) -> str:
+        return ""
+
+    def finish(self):
+        pass
+
+
+NULL_TRACER = NullTracer()
+
+
+def tracePath(argv: List[str] = None) -> Optional[str]:
+    # Function: the trace file asked for on the command line (--trace [path]) or in KAA_TRACE, None when tracing is off
+    argv = sys.argv if argv is None else argv
+    if (TRACE_FLAG in argv):
+        i = argv.index(TRACE_FLAG)
+        if (i + 1 < len(argv) and not argv[i + 1].startswith("-")):
+            return argv[i + 1]
+        return DEFAULT_TRACE_PATH
+    value = os.environ.get(TRACE_ENVIRONMENT_VARIABLE, "")
+    if (value.lower() in ("", "0", "false", "no")):
+        return None
+    return DEFAULT_TRACE_PATH if value.lower() in ("1", "true", "yes") else value
+
+
+def startTracing(conn, path: Optional[str] = None):
+    # Function: returns a Tracer attached to conn when tracing is asked for, the NullTracer otherwise
+    path = path or tracePath()
+    if (path is None):
+        return NULL_TRACER
+    tracer = Tracer(path)
+    tracer.attach(conn)
+    atexit.register(tracer.finish)   # scripts that exit early still leave a trace
+    return tracer
+
+#######################################################################################################
@@ -0,0 +1,172 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Keep-alive transport for the Archicad JSON commands. The archicad package's post_command    #
+# opens a new TCP connection (urllib) for every command; KeepAliveTransport keeps idle         #
+# http.client connections in a small pool and sends every command over one of them, so a      #
+# chatty script pays the connection set-up once. Responses are requested gzip-compressed       #
+# (Accept-Encoding) and decompressed when the server sends them that way; servers that don't   #
+# compress or close the connection after each response still work, just without the saving.   #
+# Request bodies are compressed only if compressRequests is set, as a server cannot tell the   #
+# client in advance that it accepts them.                                                      #
+#                                                                                              #
+#   useTransport(conn, KeepAliveTransport())      # before startTracing, so tracing sees it    #
+################################################################################################
+
+
+import gzip
+import http.client
+import socket
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+from kaa.connection import installPostCommand, loadJson
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+POOL_SIZE = 8              # idle connections kept per server (kaa.aio sends up to 8 commands at once)
+TIMEOUT = 600.0            # seconds; large fetches on big models take minutes
+COMPRESS_MIN_BYTES = 1024  # request bodies below this are sent as they are
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class TransportStats:
+    __slots__ = ("requests", "connections", "retries", "bytesOut", "bytesIn", "compressedIn")
+
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0      # TCP connections opened
+        self.retries = 0          # requests resent because a kept-alive connection had been closed by the server
+        self.bytesOut = 0         # request bytes on the wire
+        self.bytesIn = 0          # response bytes on the wire
+        self.compressedIn = 0     # responses that came gzip/deflate compressed
+
+
+def decodeBody(body: bytes, encoding: str) -> bytes:
+    # Function: the response body without its Content-Encoding (gzip, deflate or none)
+    encoding = (encoding or "").strip().lower()
+    if (encoding in ("gzip", "x-gzip")):
+        return gzip.decompress(body)
+    if (encoding == "deflate"):
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)   # raw deflate, sent by some servers
+    return body
+
+
+class NoDelayConnection(http.client.HTTPConnection):
+    # Class: HTTPConnection with Nagle's algorithm off; on a kept-alive socket a request sent as headers + body would
+    # otherwise wait for the delayed ACK of the previous response (~40 ms per command)
+
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class KeepAliveTransport:
+    # Class: post_command replacement that reuses HTTP/1.1 connections; safe to use from several threads
+
+    def __init__(self, poolSize: int = POOL_SIZE, timeout: float = TIMEOUT, acceptCompression: bool = True, compressRequests: bool = False):
+        self.poolSize = poolSize
+        self.timeout = timeout
+        self.acceptCompression = acceptCompression
+        self.compressRequests = compressRequests
+        self.stats = TransportStats()
+        self._idle: Dict[Tuple[str, int], List[NoDelayConnection]] = {}
+        self._uninstalls: List[Callable[[], None]] = []   # one per connection given to useTransport
+        self._lock = threading.Lock()
+
+    def _take(self, host: str, port: int) -> Tuple[http.client.HTTPConnection, bool]:
+        # an idle connection to the server (reused=True) or a new one
+        with self._lock:
+            idle = self._idle.get((host, port))
+            if (idle):
+                return (idle.pop(), True)
+            self.stats.connections += 1
+        return (NoDelayConnection(host, port, timeout=self.timeout), False)
+
+    def _give(self, host: str, port: int, connection: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault((host, port), [])
+            if (len(idle) < self.poolSize):
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _send(self, connection: http.client.HTTPConnection, path: str, body: bytes, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        connection.request("POST", path, body=body, headers=headers)
+        return connection.getresponse()
+
+    def post(self, req, jsonStr: str) -> Dict[str, Any]:
+        # Function: same contract as the archicad package's post_command(request, jsonStr)
+        url = urlsplit(req.full_url)
+        (host, port) = (url.hostname, url.port or 80)
+        headers = {name.title(): value for (name, value) in req.headers.items()}   # not the stale Content-length urlopen may have left
+        headers["Connection"] = "keep-alive"
+        if (self.acceptCompression):
+            headers["Accept-Encoding"] = "gzip, deflate"
+        body = jsonStr.encode("UTF-8")
+        if (self.compressRequests and len(body) >= COMPRESS_MIN_BYTES):
+            (body, headers["Content-Encoding"]) = (gzip.compress(body, compresslevel=1), "gzip")
+
+        (connection, reused) = self._take(host, port)
+        try:
+            try:
+                response = self._send(connection, url.path or "/", body, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if (not reused):
+                    raise
+                # the server closed the idle connection before it read this request: resend once on a fresh one
+                connection.close()
+                with self._lock:
+                    (self.stats.retries, self.stats.connections) = (self.stats.retries + 1, self.stats.connections + 1)
+                response = self._send(connection, url.path or "/", body, headers)
+            raw = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        encoding = response.getheader("Content-Encoding", "")
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.bytesOut += len(body)
+            self.stats.bytesIn += len(raw)
+            self.stats.compressedIn += 1 if encoding else 0
+        if (response.will_close):
+            connection.close()
+        else:
+            self._give(host, port, connection)
+        if (response.status >= 400):
+            raise http.client.HTTPException(f"Archicad answered {response.status} {response.reason}")
+        return loadJson(decodeBody(raw, encoding))
+
+    def close(self):
+        # Function: gives the connections back their previous post_command and closes the idle HTTP connections
+        for uninstall in reversed(self._uninstalls):
+            uninstall()
+        self._uninstalls = []
+        with self._lock:
+            connections = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+
+def useTransport(conn, transport: KeepAliveTransport) -> KeepAliveTransport:
+    # Function: sends every command of the connection through the transport (until transport.close())
+    transport._uninstalls.append(installPostCommand(conn, lambda postCommand: transport.post))
+    return transport
+
+#######################################################################################################
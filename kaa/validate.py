@@ -0,0 +1,92 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Checks planned numbers before they are written. Interior doors (kaa doors) and exterior      #
+# doors/windows (kaa fenestration) both write General_ElementID as {story}{index:02d}, and     #
+# zones write Zone_ZoneNumber the same way, so one run can give an element a number another    #
+# element of the project already has. findCollisions streams the existing values of every      #
+# element of the namespace once into a hash index (value -> owners, with their element class), #
+# the planned value replacing the current one of the elements being numbered, and returns      #
+# every value held by more than one element. A clash (a planned value another element already  #
+# has) is what the tasks stop for. findOverflows flags element indexes past MAX_INDEX: the     #
+# 100th element of story 1 gets "1100", which reads as story 11.                               #
+# Like kaa/numbering.py this runs without Archicad; kaa/tasks/common.py fetches and reports.   #
+################################################################################################
+
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from kaa.stable import parseNumber
+
+NumberedValue = Tuple[str, str]             # (element GUID, new property value), as in kaa/numbering.py
+ExistingValue = Tuple[str, str, Any]        # (element GUID, element class, current property value)
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+MAX_INDEX = 99      # element indexes per story that fit the two digits of {story}{index:02d}
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+class Collision(NamedTuple):
+    value: str
+    owners: List[Tuple[str, str]]     # (element GUID, element class) of every element with the value
+    planned: List[str]                # GUIDs of the owners that get the value from this run
+
+    def classes(self) -> str:
+        # Function: the element classes involved, e.g. "Door/Window"
+        return "/".join(sorted(set(c for (_, c) in self.owners)))
+
+    def clashes(self) -> bool:
+        # Function: whether a value of this run is also held by an element the run does not number (values the run gives
+        # several elements itself, e.g. 101 on the same story of two buildings, are the numbering rule's)
+        return 0 < len(self.planned) < len(self.owners)
+
+
+def findCollisions(existing: Iterable[ExistingValue], planned: Sequence[NumberedValue], plannedClass: str) -> List[Collision]:
+    # Function: every value more than one element holds once the planned values are written, in one pass over the existing
+    # values; planned elements the existing values do not list count as plannedClass. Empty values are ignored.
+    plannedValues = dict(planned)
+    unseen = dict.fromkeys(plannedValues)
+    owners: Dict[str, List[Tuple[str, str]]] = {}
+    for (guid, elementClass, value) in existing:
+        if (guid in plannedValues):
+            value = plannedValues[guid]
+            unseen.pop(guid, None)
+        if (value):
+            owners.setdefault(str(value), []).append((guid, elementClass))
+    for guid in unseen:
+        if (plannedValues[guid]):
+            owners.setdefault(str(plannedValues[guid]), []).append((guid, plannedClass))
+    return [Collision(value, elements, [g for (g, _) in elements if g in plannedValues])
+            for (value, elements) in owners.items() if len(elements) > 1]
+
+
+def findOverflows(planned: Sequence[NumberedValue], storyOf: Dict[str, Optional[int]], prefix: str = '') -> List[NumberedValue]:
+    # Function: the planned values whose element index on their story (storyOf: GUID -> story index) is past MAX_INDEX
+    overflows = []
+    for (guid, value) in planned:
+        index = parseNumber(value, storyOf.get(guid), prefix) if storyOf.get(guid) is not None else None
+        if (index is not None and index > MAX_INDEX):
+            overflows.append((guid, value))
+    return overflows
+
+
+def describeCollisions(collisions: Sequence[Collision]) -> List[str]:
+    # Function: one line per collision, the clashes with elements this run does not number first
+    lines = []
+    for collision in sorted(collisions, key=lambda c: (not c.clashes(), not c.planned, c.value)):
+        owners = ", ".join(f"{guid} ({elementClass}{', this run' if guid in collision.planned else ''})" for (guid, elementClass) in collision.owners)
+        lines.append(f"{collision.value!r} held by {len(collision.owners)} {collision.classes()} elements: {owners}")
+    return lines
+
+#######################################################################################################
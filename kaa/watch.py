@@ -0,0 +1,224 @@
+######################################### General Info #########################################
+# Written by: KAA Design Technology, for KAA Design Group                                      #
+# Date Created: 10/2026                                                                        #
+#                                                                                              #
+# Description:                                                                                 #
+# Watch mode for the numbering tasks (kaa zones/doors/fenestration --watch). Every interval    #
+# a cheap signal is polled: the candidate elements (element lists or the selection) and a      #
+# hash of their bounding boxes, without any property values. Once the signal has changed and   #
+# then stayed the same for the debounce time (so dragging a door is one change, not twenty),   #
+# or every refresh seconds to pick up property edits, the task's full fetch runs. Every        #
+# element gets a (group, hash) state; only the (story, building) groups whose elements were   #
+# added, removed, moved or edited are renumbered, and only values that differ from the         #
+# current ones are written, after the same checks as a full run (kaa/validate.py).             #
+#                                                                                              #
+# The loop sleeps long enough that the time spent polling and renumbering stays below          #
+# max load (a fraction of one core), so a big model makes it poll less often instead of        #
+# competing with Archicad.                                                                     #
+################################################################################################
+
+
+import math
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from kaa.numbering import NumberingError, changedValues
+from kaa.records import ElementRecord
+from kaa.tasks.common import checkValues, printValues, projectElementIds, writeValues
+from kaa.validate import ExistingValue
+
+
+
+
+############################################ CONFIGURATION ############################################
+
+DEFAULT_INTERVAL = 2.0      # seconds between polls
+DEFAULT_DEBOUNCE = 1.0      # seconds the signal must stay unchanged before renumbering
+DEFAULT_MAX_LOAD = 0.05     # most of one core the watcher may use, averaged over a cycle
+DEFAULT_REFRESH = 60.0      # seconds between full fetches without a signal change (property edits), 0 = never
+BOX_PRECISION = 3           # bounding box coordinates are hashed rounded to millimeters
+
+#######################################################################################################
+
+
+
+
+############################################## FUNCTIONS ##############################################
+
+ElementState = Dict[str, Tuple[Hashable, int]]    # element GUID -> (group key, hash of everything its number depends on)
+
+
+def boxKey(box: Sequence[float]) -> Tuple[float, ...]:
+    # Function: rounded coordinates of one row of a box array (empty for elements without a box)
+    if (math.isnan(box[0])):
+        return ()
+    return tuple(round(v, BOX_PRECISION) for v in box)
+
+
+def boxSignature(guids: Sequence[str], boxes: Optional[np.ndarray]) -> int:
+    # Function: one hash of the element list and their bounding boxes (changes when an element is added, removed or moved)
+    if (boxes is None):
+        return hash(frozenset(guids))
+    return hash(frozenset(zip(guids, (boxKey(b) for b in boxes.tolist()))))
+
+
+def recordState(records: Iterable[ElementRecord]) -> ElementState:
+    # Function: (story, building) and a hash of the box, side, position and flags of every record
+    return {r.guid: ((r.story, r.building), hash(tuple(round(v, BOX_PRECISION) if isinstance(v, float) else v for v in (getattr(r, name) for name in ElementRecord.__slots__[1:]))))
+            for r in records}
+
+
+def affectedGroups(old: ElementState, new: ElementState) -> Set[Hashable]:
+    # Function: groups with an element that was added, removed or changed (a changed element affects its old and new group)
+    groups = set()
+    for guid in set(old) | set(new):
+        (before, after) = (old.get(guid), new.get(guid))
+        if (before == after):
+            continue
+        if (before is not None):
+            groups.add(before[0])
+        if (after is not None):
+            groups.add(after[0])
+    return groups
+
+
+class Poller:
+    # Class: the polling loop; calls poll() every interval and onChange() once poll's result is new and has been
+    # stable for debounce seconds (and every refresh seconds regardless), keeping its CPU use under maxLoad.
+    # onChange returns None if the change could not be applied, it is then tried again on the next poll
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, debounce: float = DEFAULT_DEBOUNCE, maxLoad: float = DEFAULT_MAX_LOAD,
+                 refresh: float = DEFAULT_REFRESH, clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        self.interval = interval
+        self.debounce = debounce
+        self.maxLoad = maxLoad
+        self.refresh = refresh
+        self.clock = clock
+        self.sleep = sleep
+
+    def pause(self, busy: float) -> float:
+        # Function: seconds to sleep after a cycle that took busy seconds
+        return max(self.interval - busy, busy * (1.0 / self.maxLoad - 1.0))
+
+    def run(self, poll: Callable[[], Hashable], onChange: Callable[[], Any], cycles: Optional[int] = None):
+        applied = None         # signal of the last onChange
+        pending = None         # newer signal waiting for the debounce
+        pendingSince = 0.0
+        lastChange = None
+        cycle = 0
+        while (cycles is None or cycle < cycles):
+            cycle += 1
+            start = self.clock()
+            signal = poll()
+            now = self.clock()
+            if (signal != pending):
+                (pending, pendingSince) = (signal, now)
+            settled = (pending != applied and now - pendingSince >= self.debounce) or lastChange is None
+            stale = self.refresh > 0 and lastChange is not None and now - lastChange >= self.refresh
+            if (settled or stale):
+                if (onChange() is not None):
+                    applied = pending
+                lastChange = self.clock()
+            self.sleep(self.pause(self.clock() - start))
+
+
+class IncrementalNumbering:
+    # Class: renumbers the affected groups after each full fetch and writes the differences.
+    # fetch() returns (state, current values {guid: value}, context); number(context, groups) returns the
+    # (guid, value) pairs of the given groups; write(values, context) checks and sends them.
+
+    def __init__(self, fetch: Callable[[], Tuple[ElementState, Dict[str, Any], Any]],
+                 number: Callable[[Any, Set[Hashable]], List[Tuple[str, str]]],
+                 write: Callable[[List[Tuple[str, str]], Any], None], tracer):
+        self.fetch = fetch
+        self.number = number
+        self.write = write
+        self.tracer = tracer
+        self.state: ElementState = {}
+        self.current: Dict[str, Any] = {}    # the values in the model at the last fetch
+
+    def update(self) -> Optional[List[Tuple[str, str]]]:
+        # Function: one full fetch, renumbering and write; returns the values written, None if the groups could not be
+        # renumbered or written (they are tried again on the next poll)
+        with self.tracer.phase("fetch"):
+            (state, self.current, context) = self.fetch()
+        groups = affectedGroups(self.state, state)
+        if (not groups):
+            return []
+        with self.tracer.phase("order"):
+            try:
+                values = self.number(context, groups)
+            except NumberingError as error:
+                # the model is mid-edit (e.g. no First_Door yet); keep the old state so the groups are retried
+                print(error)
+                return None
+        writes = changedValues(values, self.current)
+        with self.tracer.phase("write"):
+            try:
+                self.write(writes, context)
+            except NumberingError as error:
+                # a number clashes with another element's or overflows its story; nothing was written, keep the old state
+                print(error)
+                return None
+        self.state = state
+        print(f"{time.strftime('%H:%M:%S')} renumbered {len(groups)} group(s): {len(writes)} of {len(values)} value(s) written")
+        return writes
+
+
+def outsideNumbering(existing: Iterable[ExistingValue], numbered: Dict[str, Any], planned: Sequence[Tuple[str, str]]) -> Iterable[ExistingValue]:
+    # Function: the existing values without those of the elements the watch numbers but does not write now (their numbers are
+    # the numbering's own, like the duplicates of two buildings in a full run), so only clashes with other elements stop a write
+    plannedGuids = set(guid for (guid, _) in planned)
+    return (e for e in existing if e[0] in plannedGuids or e[0] not in numbered)
+
+
+def runWatch(args, signal: Callable[[], Hashable], numbering: IncrementalNumbering) -> int:
+    # Function: runs the watch loop of a task with the --interval/--debounce/--max-load/--refresh options until Ctrl+C
+    poller = Poller(args.interval, args.debounce, args.max_load, args.refresh)
+    print(f"Watching every {args.interval:g}s (debounce {args.debounce:g}s, max load {args.max_load:.0%}), Ctrl+C to stop")
+    try:
+        poller.run(signal, numbering.update)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def watchRecords(conn, args, tracer, sources, query, number: Callable[[List[ElementRecord], Dict[str, Any]], List[Tuple[str, str]]],
+                 plannedClass: str, prepare: Optional[Callable[[List[ElementRecord]], Any]] = None) -> int:
+    # Function: watch mode of a task numbering ElementRecords per (story, building) into its "elementId" column: sources is the
+    # query polled for the signal (no columns), query the task's full query, number(records, currentIds) its numberer,
+    # plannedClass the class its elements are checked as (see checkValues) and prepare(records) fills in what the records
+    # need before grouping (e.g. the buildings)
+    propertyIds = {}
+
+    def signal() -> int:
+        with tracer.phase("poll"):
+            result = sources.run(conn)
+        return boxSignature(result.guids(), result.boxes)
+
+    def fetch():
+        result = query.run(conn)
+        propertyIds.update(result.propertyIds)
+        records = result.records()
+        if (prepare is not None):
+            prepare(records)
+        return (recordState(records), dict(zip(result.guids(), result.columns["elementId"].tolist())), records)
+
+    def numberGroups(records: List[ElementRecord], groups: Set[Hashable]) -> List[Tuple[str, str]]:
+        return number([r for r in records if (r.story, r.building) in groups], numbering.current)
+
+    def write(writes: List[Tuple[str, str]], records: List[ElementRecord]):
+        if (args.dry_run):
+            printValues(writes)
+        if (writes):
+            checkValues(args, writes, outsideNumbering(projectElementIds(conn), numbering.current, writes), plannedClass,
+                        {r.guid: r.story for r in records})
+        writeValues(conn, propertyIds["elementId"], writes, args.dry_run, numbering.current)
+
+    numbering = IncrementalNumbering(fetch, numberGroups, write, tracer)
+    return runWatch(args, signal, numbering)
+
+
+#######################################################################################################
@@ -0,0 +1,42 @@
+import ast
+import os
+
+import kaa.cassette as cassette
+from kaa import cli
+
+CASSETTE = os.path.join(os.path.dirname(__file__), "data", "fenestration.cassette")
+
+# kaa fenestration recorded on a two-story model: four exterior windows and one exterior door per story (numbered
+# clockwise from the First_Window) and an interior door, which is not numbered
+PLANNED = {
+    "b6b2c9bd-b692-50a0-951f-731d876b3673": "001",   # W0-1, First_Window
+    "6c1f3ed6-23f8-5227-916a-c01c3713ebb9": "002",   # D0-1, left side
+    "d495527a-311b-555b-aa92-4a4591390d17": "003",   # W0-4, top side
+    "30b785d0-c587-52e2-9d62-6e079336028d": "004",   # W0-3, right side
+    "2243f40d-6f8d-5e17-b55a-0da5d3f44bb7": "005",   # W0-2, bottom side
+    "22465f41-4303-5f80-8ca0-5e4f2b0b5236": "101",
+    "2d122c4e-e8dd-56f4-8589-a69b27484048": "102",
+    "b81c0e91-d8c3-5665-ac14-0e6bfbed2289": "103",
+    "dc21f279-2c82-5c63-a469-f81fd756c991": "104",
+    "96e6990f-d9e1-51b1-8852-ca9ac08d733b": "105",
+}
+
+
+def test_fenestration_replay(monkeypatch, capsys):
+    players = []
+    replayConnection = cassette.replayConnection
+
+    def keepPlayer(path):
+        (conn, player) = replayConnection(path)
+        players.append(player)
+        return (conn, player)
+
+    monkeypatch.setattr(cassette, "replayConnection", keepPlayer)
+    assert cli.main(["fenestration", "--replay", CASSETTE, "--dry-run"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    planned = dict(ast.literal_eval(line) for line in lines if line.startswith("('"))
+    assert planned == PLANNED
+    (player,) = players
+    assert player.served == player.recorded == 19
+    assert player.unplayed() == 0
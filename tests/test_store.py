@@ -0,0 +1,54 @@
+import uuid
+
+import numpy as np
+import pytest
+
+import kaa.store as store
+from kaa.geometry import ELEMENT_DTYPE
+from kaa.store import GeometryStore
+
+
+def randomGuids(count):
+    return [str(uuid.uuid4()) for _ in range(count)]
+
+
+def rowsFor(count):
+    data = np.zeros(count, dtype=ELEMENT_DTYPE)
+    data["zMin"] = np.arange(count)
+    return data
+
+
+def interrupted(*args, **kwargs):
+    raise OSError("interrupted")
+
+
+def test_interrupted_upsert_keeps_the_index(tmp_path, monkeypatch):
+    path = str(tmp_path / "store")
+    first = randomGuids(5)
+    GeometryStore.create(path).upsert(first, rowsFor(5))
+    monkeypatch.setattr(store, "writeMeta", interrupted)
+    with pytest.raises(OSError):
+        GeometryStore.open(path, writable=True).upsert(randomGuids(20), rowsFor(20))
+    monkeypatch.undo()
+
+    reopened = GeometryStore.open(path)
+    assert len(reopened) == 5
+    assert reopened.rowsOf(first).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_upsert_after_an_interrupted_upsert(tmp_path, monkeypatch):
+    path = str(tmp_path / "store")
+    first = randomGuids(5)
+    GeometryStore.create(path).upsert(first, rowsFor(5))
+    monkeypatch.setattr(store, "writeMeta", interrupted)
+    with pytest.raises(OSError):
+        GeometryStore.open(path, writable=True).upsert(randomGuids(3), rowsFor(3))
+    monkeypatch.undo()
+
+    second = randomGuids(3)
+    writer = GeometryStore.open(path, writable=True)
+    assert writer.upsert(first + second, rowsFor(8)).tolist() == list(range(8))
+    reopened = GeometryStore.open(path)
+    assert len(reopened) == 8
+    assert reopened.rowsOf(first + second).tolist() == list(range(8))
+    assert sorted(p.name for p in (tmp_path / "store").iterdir() if p.name.startswith(("keys", "order"))) == ["keys-2.npy", "order-2.npy"]